@@ -1,5 +1,6 @@
 import tkinter as tk
-from tkinter import ttk, scrolledtext
+from tkinter import ttk
+import tkinter.font as tkfont
 import threading
 import queue
 import time
@@ -9,7 +10,37 @@ import math
 import platform
 import subprocess
 import shutil
-from collections import deque
+import zlib
+import os
+import sys
+import csv
+import json
+import struct
+import functools
+import http.server
+import asyncio
+import socket
+import argparse
+import re
+import mmap
+import heapq
+import bisect
+import tracemalloc
+import itertools
+import multiprocessing
+from multiprocessing import shared_memory
+from array import array
+from collections import deque, OrderedDict
+
+try:
+    import numpy as np  # Optional: vectorized batch threat evaluation (--analyze)
+except ImportError:
+    np = None
+
+try:
+    from PIL import Image, ImageDraw, ImageFont, ImageTk, GifImagePlugin  # Optional: --raster, --export
+except ImportError:
+    Image = ImageDraw = ImageFont = ImageTk = GifImagePlugin = None
 
 # --- Configuration and Styling ---
 COLOR_BG_DARK = "#050510"
@@ -28,6 +59,110 @@ COLOR_ABORT_BG = "#331a00"
 DEFAULT_PARTICLE_COUNT = 24
 MAX_THREAT_HISTORY = 60  # For the sparkline graph
 
+DATA_DIR = os.environ.get('THREAT_MATRIX_HOME', os.path.join(os.path.expanduser('~'), '.threat_matrix'))
+HISTORY_FILE = os.path.join(DATA_DIR, 'threat_history.bin')
+HISTORY_AUTOSAVE_MS = 60000
+# Rollup resolutions: name -> (bucket seconds, buckets kept)
+HISTORY_RESOLUTIONS = {
+    'second': (1, 3600),  # last hour
+    'minute': (60, 1440),  # last day
+    'hour': (3600, 24 * 365),  # last year
+}
+
+JOURNAL_DIR = os.path.join(DATA_DIR, 'journal')
+JOURNAL_SEGMENT_SIZE = 4 * 1024 * 1024  # Bytes per memory-mapped segment file
+JOURNAL_INDEX_INTERVAL = 64  # Records per sparse index block
+JOURNAL_FSYNC_BATCH = 256  # Records written before a forced msync...
+JOURNAL_FSYNC_INTERVAL = 0.5  # ...or seconds since the last one, whichever comes first
+JOURNAL_PAGE_SIZE = 50  # Records paged back into the log per request
+JOURNAL_SEVERITIES = ('INFO', 'WARNING', 'ERROR', 'CRITICAL')
+JOURNAL_SEVERITY_CODES = {name: code for code, name in enumerate(JOURNAL_SEVERITIES)}
+
+MSG_LANES = ('control', 'urgent', 'info')  # msg_queue service order (LaneQueue)
+MSG_LANE_CAPACITY = {'control': 1000, 'urgent': 2000, 'info': 4000}  # Messages held per lane before shedding
+INGEST_HIGH_WATER = 2000  # msg_queue depth at which ingest applies backpressure / sheds UDP load
+INGEST_LOW_WATER = 500  # Depth at which paused stream connections resume reading
+INGEST_BACKPRESSURE_POLL = 0.05  # Seconds between queue depth checks while paused
+INGEST_READ_SIZE = 64 * 1024  # Bytes parsed per batch from a stream connection
+PROC_ROOT = '/proc'  # Live process/socket feed for the header ('' disables; a fixture dir stands in for tests)
+PROC_SCAN_INTERVAL = 2.0  # Seconds between incremental scans (on a background thread)
+PROC_READ_BUDGET = 512  # New PIDs whose stat is read per scan; the rest are picked up by later scans
+PROC_REFRESH_BATCH = 16  # Cached PIDs re-read per scan, round-robin (catches PID reuse and state changes)
+PROC_HIGHLIGHTS = 24  # Processes / sockets kept in the header rotation
+WALL_VIEWS = ('globe', 'log', 'meter')  # Panels that can be opened as separate --wall windows
+METRICS_PORT = 9464  # Default local port for --metrics
+LOG_INDEX_CAPACITY = 50000  # Lines kept searchable in memory; older ones remain in the journal (F9 pages them in)
+LOG_INDEX_TRIM = 2048  # Lines evicted at once past capacity, so trimming postings amortizes
+LOG_VIEW_MIN_ROWS = 10  # Lines kept in the log Text widget at minimum (the view is virtualized)
+LOG_ICONS = {"INFO": "▶", "WARNING": "⚠", "ERROR": "✖", "CRITICAL": "⚡"}
+LOG_COLORS = {"INFO": COLOR_NEON_BLUE, "WARNING": COLOR_NEON_GREEN, "ERROR": COLOR_NEON_ORANGE,
+              "CRITICAL": COLOR_NEON_PURPLE}
+EXPORT_SIZE = (960, 540)  # Offscreen export frame size (--export)
+EXPORT_FPS = 30
+EXPORT_TAIL_SECONDS = 2.0  # Recorded after the scenario completes, so the verdict stays on screen
+EXPORT_QUEUE_DEPTH = 8  # Rendered frames waiting for the encoder thread (bounds export memory)
+LOADGEN_RATES = (50, 100, 200, 500, 1000, 2000, 5000)  # Offered events/s per --loadgen stage
+LOADGEN_STAGE_SECONDS = 5.0
+LOADGEN_MIX = {"INFO": 70, "WARNING": 20, "ERROR": 8, "CRITICAL": 2}  # Relative severity weights
+LOADGEN_TICK = 0.01  # Producer pacing granularity (s)
+LOADGEN_BURST_PERIOD = 1.0  # Burst pattern: LOADGEN_BURST_FACTOR x rate for LOADGEN_BURST_SHARE of each period
+LOADGEN_BURST_FACTOR = 4.0
+LOADGEN_BURST_SHARE = 0.2
+LOADGEN_SATURATION_MS = 250  # p95 enqueue-to-screen latency above this counts as saturated
+LOADGEN_DRAIN_TIMEOUT = 15.0  # Seconds to wait for the queue to drain after the last stage
+SOAK_SPEED = 10.0  # Time acceleration in --soak (animations and simulation steps)
+SOAK_SAMPLE_SECONDS = 30.0  # Real seconds between soak samples
+SOAK_WARMUP_SAMPLES = 2  # The baseline is this sample; earlier growth is caches and pools filling
+SOAK_SCENARIO_GAP = 3.0  # Idle (clock) seconds between back-to-back scenarios
+SOAK_TOP_ALLOCATORS = 10
+SOAK_THRESHOLDS = {  # Allowed growth over the baseline before --soak fails
+    'canvas_items': 200,  # On any single canvas
+    'after_callbacks': 25,
+    'log_lines': 2000,  # Lines held in LogIndex (the log's real buffer; the Text widget is a fixed window)
+    'log_postings': 20000,  # Line ids across LogIndex's token postings
+    'traced_mb': 32.0,
+    'rss_mb': 128.0,
+}
+EXPORT_GLOBE_RATE = 35  # Globe animation ticks per simulated second (HologramGlobe's default fps)
+
+RNG_SEED = None  # None seeds from the clock; set an int for reproducible runs
+RNG_BLOCK_SIZE = 4096  # Uniforms pre-generated per refill of a random stream
+GRID_COLORS = ['#0a0a1a', '#151525', '#1a1a2e']
+SPRITE_CACHE_SIZE = 256  # Max pre-rendered glow sprites kept alive (LRU)
+METER_GLOW_QUANTUM = 8  # Meter glow sprite widths snap to this many pixels, so levels share sprites
+
+# --- Adaptive Quality Tiers (MEDIUM matches the original fixed constants) ---
+QUALITY_TIERS = [
+    {'name': 'MINIMAL', 'particles': 8, 'globe_points': 90, 'globe_connections': 30, 'fps_scale': 0.5},
+    {'name': 'LOW', 'particles': 16, 'globe_points': 160, 'globe_connections': 60, 'fps_scale': 0.75},
+    {'name': 'MEDIUM', 'particles': DEFAULT_PARTICLE_COUNT, 'globe_points': 260, 'globe_connections': 100,
+     'fps_scale': 1.0},
+    {'name': 'HIGH', 'particles': 40, 'globe_points': 420, 'globe_connections': 160, 'fps_scale': 1.0},
+    {'name': 'ULTRA', 'particles': 64, 'globe_points': 640, 'globe_connections': 240, 'fps_scale': 1.2},
+]
+DEFAULT_QUALITY_TIER = 2
+ADAPTIVE_QUALITY = True
+TARGET_FPS = 30
+ANIMATION_MAX_STEPS = 5  # Fixed motion steps caught up per frame after a stall; older time is dropped
+QUALITY_WINDOW_FRAMES = 30  # Heartbeat frames averaged per governor decision
+QUALITY_DOWNGRADE_RATIO = 1.3  # Step down when frames run this much over budget...
+QUALITY_DOWNGRADE_WINDOWS = 2  # ...for this many consecutive windows
+QUALITY_UPGRADE_RATIO = 1.1  # Step up only when frames stay within this ratio of budget...
+QUALITY_UPGRADE_WINDOWS = 5  # ...for this many consecutive windows
+QUALITY_UPGRADE_COOLDOWN = 10.0  # Seconds after a downgrade before upgrades are allowed (doubles on ping-pong)
+
+VISIBILITY_THROTTLE_FACTOR = 3  # Frame delay multiplier when unfocused or partially covered
+GLOBE_BACKFACE_Z = 0.2  # Rotated z beyond this is treated as the far hemisphere (dimmed, throttled)
+GLOBE_BACK_DIM = 0.35  # Blend of the point color over the panel for back-facing points
+GLOBE_BACK_REFRESH_DIVISOR = 3  # Back-facing points get new coords every Nth frame (round-robin)
+GLOBE_SORT_THRESHOLD = 0.15  # Radians of rotation before the front points are depth-sorted again
+GLOBE_LOD_REFERENCE_SIZE = 360  # Canvas size (px) at which every globe point is animated
+GLOBE_LOD_MIN_FRACTION = 0.25  # Smallest share of points kept on tiny canvases
+GLOBE_EDGE_SPACING = 1.4  # Max globe connection length, in multiples of the mean point spacing
+GLOBE_EDGE_DEGREE = 4  # Nearest neighbors kept per globe point in the connection graph
+RESIZE_DEBOUNCE_MS = 120  # Quiet period after the last <Configure> before a widget relayouts
+GRID_STEP = 60
+
 # --- ENHANCEMENT: Centralized Color Map ---
 THREAT_COLOR_MAP = {
     'LOW': {'level': 0, 'color': COLOR_NEON_BLUE},
@@ -35,6 +170,17 @@ THREAT_COLOR_MAP = {
     'HIGH': {'level': 70, 'color': COLOR_NEON_PURPLE},
 }
 
+# --- Threat Model Defaults (scenarios override any key via ATTACK_DATA[...]['threat_model']) ---
+THREAT_MODEL_DEFAULTS = {
+    'ramp': 70,  # Level contributed by scenario progress: step / total_steps * ramp
+    'bonus': {'INFO': (0, 5), 'WARNING': (5, 15), 'ERROR': (15, 25), 'CRITICAL': (25, 30)},  # Random bonus range
+    'weights': {'INFO': 1.0, 'WARNING': 1.0, 'ERROR': 1.0, 'CRITICAL': 1.0},  # Multiplier on the bonus
+    'decay_half_life': None,  # Seconds for an earlier peak to fade by half; None = level follows each step
+    'combine': 'max',  # How concurrent threat sources merge: 'max', 'sum' or 'noisy_or'
+}
+THREAT_COMBINERS = ('max', 'sum', 'noisy_or')
+THREAT_DECAY_CUTOFF = 1e-3  # Decay weights below this are dropped (bounds the look-back window)
+
 
 # --- Helper: Linear Color Interpolation (RGB Lerp) ---
 def hex_to_rgb(hex_color):
@@ -50,6 +196,11 @@ def rgb_to_hex(r, g, b):
     return f'#{r:02x}{g:02x}{b:02x}'
 
 
+def pack_rgb(r, g, b) -> int:
+    """Clamped (r, g, b) packed into one int, for color data that crosses process boundaries."""
+    return (int(max(0, min(255, r))) << 16) | (int(max(0, min(255, g))) << 8) | int(max(0, min(255, b)))
+
+
 def lerp_color(color1_hex, color2_hex, ratio):
     """Linearly interpolates between two hex colors based on ratio (0.0 to 1.0)."""
     r1, g1, b1 = hex_to_rgb(color1_hex)
@@ -72,6 +223,193 @@ def get_threat_color(level: int) -> str:
         return THREAT_COLOR_MAP['HIGH']['color']
 
 
+# --- Seeded Per-Subsystem Random Streams ---
+class RandomStream:
+    """
+    Independent seeded random stream that pre-generates uniforms in blocks.
+    Hot loops call take(n) once per frame and index the returned array
+    instead of paying a Python call per draw.
+    """
+
+    def __init__(self, seed, block_size=RNG_BLOCK_SIZE):
+        self.seed = seed
+        self.block_size = block_size
+        self._rng = random.Random(seed)
+        self._block = array('d')
+        self._pos = 0
+
+    def _refill(self, needed):
+        draw = self._rng.random
+        size = max(needed, self.block_size)
+        remaining = self._block[self._pos:]
+        self._block = remaining + array('d', [draw() for _ in range(size)])
+        self._pos = 0
+
+    def take(self, n: int):
+        """Returns the next n uniforms in [0, 1) as a read-only view into the current block."""
+        if self._pos + n > len(self._block):
+            self._refill(n)
+        start = self._pos
+        self._pos += n
+        return memoryview(self._block)[start:self._pos].toreadonly()
+
+    def random(self) -> float:
+        if self._pos >= len(self._block):
+            self._refill(1)
+        value = self._block[self._pos]
+        self._pos += 1
+        return value
+
+    def uniform(self, a: float, b: float) -> float:
+        return a + (b - a) * self.random()
+
+    def randint(self, a: int, b: int) -> int:
+        return a + int(self.random() * (b - a + 1))
+
+    def choice(self, seq):
+        return seq[int(self.random() * len(seq))]
+
+    def choices(self, population, k=1):
+        n = len(population)
+        return [population[int(u * n)] for u in self.take(k)]
+
+    def shuffle(self, seq):
+        """In-place Fisher-Yates over buffered uniforms, so it stays in step with every other draw."""
+        uniforms = self.take(max(0, len(seq) - 1))
+        for k, i in enumerate(range(len(seq) - 1, 0, -1)):
+            j = int(uniforms[k] * (i + 1))
+            seq[i], seq[j] = seq[j], seq[i]
+
+    def sample(self, population, k):
+        """k distinct elements: a partial Fisher-Yates over a copy, drawing k buffered uniforms."""
+        pool = list(population)
+        if not 0 <= k <= len(pool):
+            raise ValueError("sample larger than population or is negative")
+        uniforms = self.take(k)
+        for i in range(k):
+            j = i + int(uniforms[i] * (len(pool) - i))
+            pool[i], pool[j] = pool[j], pool[i]
+        return pool[:k]
+
+
+class RandomStreams:
+    """Hands out one reproducible RandomStream per subsystem, derived from a single master seed."""
+
+    def __init__(self, seed=None):
+        self.seed = seed if seed is not None else time.time_ns() & 0xFFFFFFFF
+        self._streams = {}
+
+    def stream(self, name: str) -> RandomStream:
+        if name not in self._streams:
+            # crc32 keeps the derived seed stable across interpreter runs (unlike hash())
+            self._streams[name] = RandomStream(self.seed ^ zlib.crc32(name.encode('utf-8')))
+        return self._streams[name]
+
+    def reseed(self, seed):
+        """Restarts every subsystem stream from a new master seed."""
+        self.seed = seed
+        self._streams.clear()
+
+
+RNG = RandomStreams(RNG_SEED)
+
+
+# --- Offscreen Sprite Cache (pre-rendered glow effects) ---
+class SpriteCache:
+    """
+    LRU-bounded cache of pre-rasterized PhotoImage sprites.
+    Keys are tuples whose first element is the sprite kind, e.g.
+    ('particle', size, color) or ('meter_glow', width, height, color).
+    """
+
+    def __init__(self, maxsize=SPRITE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._sprites = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, render):
+        """Returns the cached sprite for key, rasterizing it with render() on a miss."""
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        sprite = render()
+        self._sprites[key] = sprite
+        if len(self._sprites) > self.maxsize:
+            self._sprites.popitem(last=False)
+        return sprite
+
+    def invalidate(self, kind=None):
+        """Drops every sprite of the given kind (all sprites if kind is None)."""
+        if kind is None:
+            self._sprites.clear()
+            return
+        for key in [k for k in self._sprites if k[0] == kind]:
+            del self._sprites[key]
+
+    def __len__(self):
+        return len(self._sprites)
+
+
+SPRITES = SpriteCache()
+
+
+def _put_rect_outline(image, x1, y1, x2, y2, color, width=1):
+    """Rasterizes a rectangle outline (inclusive coords) into a PhotoImage."""
+    for w in range(width):
+        image.put(color, to=(x1 + w, y1 + w, x2 - w + 1, y1 + w + 1))
+        image.put(color, to=(x1 + w, y2 - w, x2 - w + 1, y2 - w + 1))
+        image.put(color, to=(x1 + w, y1 + w, x1 + w + 1, y2 - w + 1))
+        image.put(color, to=(x2 - w, y1 + w, x2 - w + 1, y2 - w + 1))
+
+
+def render_particle_sprite(master, size, color):
+    """Outer ring (radius 2*size) plus filled core (radius size), centered in a transparent square."""
+    outer = size * 2
+    dim = outer * 2 + 1
+    image = tk.PhotoImage(master=master, width=dim, height=dim)
+    for row in range(dim):
+        dy = row - outer
+        run_start = None
+        for col in range(dim + 1):
+            inside = False
+            if col < dim:
+                dist = math.hypot(col - outer, dy)
+                inside = dist <= size or outer - 1 <= dist <= outer
+            if inside and run_start is None:
+                run_start = col
+            elif not inside and run_start is not None:
+                image.put(color, to=(run_start, row, col, row + 1))
+                run_start = None
+    return image
+
+
+def render_meter_glow_sprite(master, fill_width, bar_height, color, layers=3):
+    """The meter's layered outer glow: one outline per layer, blended towards the panel color."""
+    width = fill_width + layers * 2 + 1
+    height = bar_height + layers * 2 + 1
+    image = tk.PhotoImage(master=master, width=width, height=height)
+    base_color_rgb = hex_to_rgb(color)
+    for i in range(layers, 0, -1):  # Largest to smallest, same layering as the vector version
+        r, g, b = [c + (255 - c) * 0.1 * i for c in base_color_rgb]
+        blend_color = lerp_color(COLOR_BG_PANEL, rgb_to_hex(r, g, b), 0.8 / i)
+        inset = layers - i
+        _put_rect_outline(image, inset, inset, width - 1 - inset, height - 1 - inset, blend_color)
+    return image
+
+
+def render_button_sprite(master, width, height, bg_color, border_color):
+    """GlowButton body: filled panel and 2px border. The moving scanline is a separate canvas item."""
+    image = tk.PhotoImage(master=master, width=width, height=height)
+    image.put(bg_color, to=(2, 2, width - 2, height - 2))
+    _put_rect_outline(image, 1, 1, width - 2, height - 2, border_color, width=2)
+    return image
+
+
 # --- ATTACK_DATA (Unchanged) ---
 ATTACK_DATA = {
     "buffer_overflow": {
@@ -198,6 +536,1533 @@ ATTACK_DATA = {
 }
 
 
+# --- Threat History Time-Series Store ---
+class RingSeries:
+    """Fixed-capacity ring of (timestamp, avg, peak) rows held in flat typed arrays."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.timestamps = array('d', bytes(8 * capacity))
+        self.avg = array('f', bytes(4 * capacity))
+        self.peak = array('f', bytes(4 * capacity))
+        self.start = 0
+        self.count = 0
+
+    def append(self, ts: float, avg: float, peak: float):
+        pos = (self.start + self.count) % self.capacity
+        self.timestamps[pos] = ts
+        self.avg[pos] = avg
+        self.peak[pos] = peak
+        if self.count < self.capacity:
+            self.count += 1
+        else:
+            self.start = (self.start + 1) % self.capacity
+
+    def newest_timestamp(self):
+        return self.timestamps[(self.start + self.count - 1) % self.capacity] if self.count else None
+
+    def pop(self):
+        """Removes and returns the newest row."""
+        self.count -= 1
+        pos = (self.start + self.count) % self.capacity
+        return self.timestamps[pos], self.avg[pos], self.peak[pos]
+
+    def copy(self):
+        ring = RingSeries(self.capacity)
+        ring.timestamps[:], ring.avg[:], ring.peak[:] = self.timestamps, self.avg, self.peak
+        ring.start, ring.count = self.start, self.count
+        return ring
+
+    def rows(self, last=None):
+        """Yields (ts, avg, peak) oldest to newest, optionally only the newest `last` rows."""
+        n = self.count if last is None else min(last, self.count)
+        for k in range(self.count - n, self.count):
+            pos = (self.start + k) % self.capacity
+            yield self.timestamps[pos], self.avg[pos], self.peak[pos]
+
+    def __len__(self):
+        return self.count
+
+
+class ThreatHistoryStore:
+    """
+    Timestamped threat levels kept across sessions as multi-resolution rollups
+    (per second, minute and hour). Each resolution stores the bucket average and
+    peak in its own RingSeries; the bucket currently filling is kept open in memory.
+    """
+
+    MAGIC = b'THS1'
+    HEADER = struct.Struct('<4sI')
+    SERIES_HEADER = struct.Struct('<16sIII')  # name, capacity, start, count
+
+    def __init__(self, resolutions=HISTORY_RESOLUTIONS):
+        self.resolutions = dict(resolutions)
+        self.series = {name: RingSeries(capacity) for name, (_, capacity) in self.resolutions.items()}
+        self._open = {name: None for name in self.resolutions}  # name -> [bucket_ts, sum, count, peak]
+        self._save_lock = threading.Lock()  # One writer at a time (background autosave vs. final save)
+
+    def record(self, level: float, ts=None):
+        ts = time.time() if ts is None else ts
+        for name, (step, _) in self.resolutions.items():
+            bucket = ts - (ts % step)
+            current = self._open[name]
+            ring = self.series[name]
+            if current is None and ring.newest_timestamp() == bucket:
+                # Bucket was closed by a save/restart within the same period: reopen it (prior rows weigh as one)
+                _, avg, peak = ring.pop()
+                current = self._open[name] = [bucket, avg, 1, peak]
+            if current is not None and current[0] == bucket:
+                current[1] += level
+                current[2] += 1
+                current[3] = max(current[3], level)
+                continue
+            if current is not None:
+                self.series[name].append(current[0], current[1] / current[2], current[3])
+            self._open[name] = [bucket, level, 1, level]
+
+    def query(self, resolution: str, count: int):
+        """Newest `count` rollups (ts, avg, peak) at the given resolution, including the open bucket."""
+        rows = list(self.series[resolution].rows(count))
+        current = self._open[resolution]
+        if current is not None:
+            rows.append((current[0], current[1] / current[2], current[3]))
+        return rows[-count:]
+
+    def snapshot(self, resolution: str) -> RingSeries:
+        """Copy of a resolution's ring with the open bucket appended; the live store is left untouched."""
+        ring = self.series[resolution].copy()
+        current = self._open[resolution]
+        if current is not None:
+            ring.append(current[0], current[1] / current[2], current[3])
+        return ring
+
+    # --- Persistence ---
+    def save(self, path: str, background=False):
+        """
+        Writes every resolution to path. With background, the rings are copied now
+        (a few hundred KB of memcpy) and serialized and written from a worker thread.
+        """
+        rings = [(name, self.snapshot(name)) for name in self.series]
+        if not background:
+            self._write(path, rings)
+            return
+        threading.Thread(target=self._write_quietly, args=(path, rings), name='history-save', daemon=True).start()
+
+    def _write_quietly(self, path, rings):
+        try:
+            self._write(path, rings)
+        except OSError as e:
+            print(f"Threat history not saved: {e}")
+
+    def _write(self, path, rings):
+        with self._save_lock:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(self.HEADER.pack(self.MAGIC, len(rings)))
+                for name, ring in rings:
+                    f.write(self.SERIES_HEADER.pack(name.encode('ascii'), ring.capacity, ring.start, ring.count))
+                    for column in (ring.timestamps, ring.avg, ring.peak):
+                        if sys.byteorder == 'big':
+                            column = array(column.typecode, column)
+                            column.byteswap()
+                        column.tofile(f)
+            os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str):
+        """Loads a saved store; a missing or unreadable file yields an empty store."""
+        store = cls()
+        try:
+            with open(path, 'rb') as f:
+                magic, n_series = cls.HEADER.unpack(f.read(cls.HEADER.size))
+                if magic != cls.MAGIC:
+                    return store
+                for _ in range(n_series):
+                    raw_name, capacity, start, count = cls.SERIES_HEADER.unpack(f.read(cls.SERIES_HEADER.size))
+                    ring = RingSeries(capacity)
+                    ring.start, ring.count = start, count
+                    for column in (ring.timestamps, ring.avg, ring.peak):
+                        loaded = array(column.typecode)
+                        loaded.fromfile(f, capacity)
+                        if sys.byteorder == 'big':
+                            loaded.byteswap()
+                        column[:] = loaded
+                    name = raw_name.rstrip(b'\0').decode('ascii')
+                    if name in store.series and store.series[name].capacity == capacity:
+                        store.series[name] = ring
+        except (OSError, EOFError, struct.error, ValueError) as e:
+            print(f"Threat history not loaded ({e}); starting fresh.")
+        return store
+
+    # --- Export ---
+    def export_csv(self, path: str, resolution='second'):
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['timestamp', 'iso_time', 'avg_threat', 'peak_threat'])
+            for ts, avg, peak in self.snapshot(resolution).rows():
+                writer.writerow([f"{ts:.3f}", datetime.fromtimestamp(ts).isoformat(), f"{avg:.2f}", f"{peak:.2f}"])
+
+    def export_columnar(self, directory: str, resolution='second'):
+        """
+        Writes one little-endian binary file per column plus schema.json (name, dtype,
+        rows), so analysis tools can memory-map single columns without parsing text.
+        """
+        os.makedirs(directory, exist_ok=True)
+        ring = self.snapshot(resolution)
+        columns = [('timestamp', 'float64', ring.timestamps), ('avg_threat', 'float32', ring.avg),
+                   ('peak_threat', 'float32', ring.peak)]
+        # Unroll the ring into chronological order once, then write each column in one call
+        order = [(ring.start + k) % ring.capacity for k in range(ring.count)]
+        for name, _, data in columns:
+            column = array(data.typecode, (data[pos] for pos in order))
+            if sys.byteorder == 'big':
+                column.byteswap()
+            with open(os.path.join(directory, f"{name}.bin"), 'wb') as f:
+                column.tofile(f)
+        schema = {
+            'resolution': resolution,
+            'step_seconds': self.resolutions[resolution][0],
+            'rows': ring.count,
+            'byteorder': 'little',
+            'columns': [{'name': name, 'dtype': dtype, 'file': f"{name}.bin"} for name, dtype, _ in columns],
+        }
+        with open(os.path.join(directory, 'schema.json'), 'w') as f:
+            json.dump(schema, f, indent=2)
+
+
+# --- Memory-Mapped Event Journal ---
+class JournalSegment:
+    """
+    One fixed-size, memory-mapped segment file of append-only log records, plus its
+    sparse index sidecar. The 16-byte segment header holds the committed length; the
+    sidecar holds one entry per block of JOURNAL_INDEX_INTERVAL records with the
+    block's time range, byte range and a bitmask of the severities it contains.
+    """
+
+    MAGIC = b'TJS1'
+    HEADER = struct.Struct('<4s4xQ')  # magic, committed length
+    RECORD = struct.Struct('<dBBHH')  # timestamp, severity code, threat level, scenario len, message len
+    INDEX = struct.Struct('<ddQQIB')  # first ts, last ts, start offset, end offset, record count, severity mask
+
+    def __init__(self, path: str, writable: bool):
+        self.path = path
+        self.index_path = path[:-4] + '.idx'
+        self.writable = writable
+        is_new = not os.path.exists(path)
+        self._file = open(path, 'w+b' if is_new else ('r+b' if writable else 'rb'))
+        if is_new:
+            self._file.truncate(JOURNAL_SEGMENT_SIZE)
+        access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+        self.map = mmap.mmap(self._file.fileno(), 0, access=access)
+        self.size = len(self.map)
+        if is_new:
+            self.HEADER.pack_into(self.map, 0, self.MAGIC, self.HEADER.size)
+        magic, self.committed = self.HEADER.unpack_from(self.map, 0)
+        if magic != self.MAGIC:
+            raise ValueError(f"{path} is not a journal segment")
+        self.blocks = self._load_index()
+        # Records after the last indexed block form the open block; rescan only that tail
+        self.open_block = None
+        tail_start = self.blocks[-1][3] if self.blocks else self.HEADER.size
+        for offset, next_offset, record in self.scan(tail_start, self.committed):
+            self._account(offset, next_offset, record)
+
+    def _load_index(self):
+        blocks = []
+        try:
+            with open(self.index_path, 'rb') as f:
+                data = f.read()
+            usable = len(data) - len(data) % self.INDEX.size
+            blocks = [self.INDEX.unpack_from(data, pos) for pos in range(0, usable, self.INDEX.size)]
+        except OSError:
+            pass
+        return [b for b in blocks if b[3] <= self.committed]
+
+    def _account(self, start, end, record):
+        ts, severity = record[0], record[1]
+        if self.open_block is None:
+            self.open_block = [ts, ts, start, end, 0, 0]
+        block = self.open_block
+        block[1] = ts
+        block[3] = end
+        block[4] += 1
+        block[5] |= 1 << JOURNAL_SEVERITY_CODES.get(severity, 0)
+        if block[4] >= JOURNAL_INDEX_INTERVAL:
+            self.close_block()
+
+    def close_block(self):
+        if self.open_block is None:
+            return
+        entry = tuple(self.open_block)
+        self.blocks.append(entry)
+        self.open_block = None
+        if self.writable:
+            with open(self.index_path, 'ab') as f:
+                f.write(self.INDEX.pack(*entry))
+
+    def append(self, ts, severity, level, scenario, message) -> bool:
+        """Writes one record after the committed length; returns False when the segment is full."""
+        scenario_bytes = scenario.encode('utf-8')[:0xFFFF]
+        message_bytes = message.encode('utf-8')[:0xFFFF]
+        start = self.committed
+        end = start + self.RECORD.size + len(scenario_bytes) + len(message_bytes)
+        if end > self.size:
+            return False
+        self.RECORD.pack_into(self.map, start, ts, JOURNAL_SEVERITY_CODES.get(severity, 0),
+                              max(0, min(255, int(level))), len(scenario_bytes), len(message_bytes))
+        body = start + self.RECORD.size
+        self.map[body:end] = scenario_bytes + message_bytes
+        self.committed = end
+        self._account(start, end, (ts, severity, level, scenario, message))
+        return True
+
+    def commit(self, sync=True):
+        """Publishes the committed length in the header and (optionally) msyncs the mapping."""
+        self.HEADER.pack_into(self.map, 0, self.MAGIC, self.committed)
+        if sync:
+            self.map.flush()
+
+    def scan(self, start, end):
+        """Yields (offset, next_offset, (ts, severity, level, scenario, message)) for records in [start, end)."""
+        offset = start
+        while offset + self.RECORD.size <= end:
+            ts, code, level, scenario_len, message_len = self.RECORD.unpack_from(self.map, offset)
+            body = offset + self.RECORD.size
+            next_offset = body + scenario_len + message_len
+            scenario = bytes(self.map[body:body + scenario_len]).decode('utf-8', 'replace')
+            message = bytes(self.map[body + scenario_len:next_offset]).decode('utf-8', 'replace')
+            yield offset, next_offset, (ts, JOURNAL_SEVERITIES[code], level, scenario, message)
+            offset = next_offset
+
+    def close(self):
+        try:
+            self.map.close()
+        finally:
+            self._file.close()
+
+
+class EventJournal:
+    """
+    Append-only, memory-mapped journal of every log event (timestamp, severity,
+    scenario, threat level, message). append() only enqueues; a background writer
+    drains the queue in batches into the active segment and msyncs at most every
+    JOURNAL_FSYNC_INTERVAL seconds or JOURNAL_FSYNC_BATCH records. Queries walk
+    the sparse block index newest-first, so paging back through months of history
+    only touches the blocks that match.
+    """
+
+    def __init__(self, directory=JOURNAL_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._closed = False
+        self._readers = OrderedDict()  # Read-only mappings of sealed segments (small LRU)
+        names = sorted(n for n in os.listdir(directory) if n.startswith('journal_') and n.endswith('.seg'))
+        self.segment_ids = [int(n[8:-4]) for n in names]
+        if not self.segment_ids:
+            self.segment_ids.append(0)
+        self.active = JournalSegment(self._segment_path(self.segment_ids[-1]), writable=True)
+        self.records_written = 0
+        self._writer = threading.Thread(target=self._run_writer, name='journal-writer', daemon=True)
+        self._writer.start()
+
+    def _segment_path(self, segment_id: int) -> str:
+        return os.path.join(self.directory, f"journal_{segment_id:06d}.seg")
+
+    def append(self, severity: str, message: str, scenario='system', threat_level=0, ts=None):
+        if not self._closed:
+            self._queue.put((time.time() if ts is None else ts, severity, threat_level, scenario, message))
+
+    def _run_writer(self):
+        pending = 0
+        last_sync = time.monotonic()
+        while True:
+            try:
+                record = self._queue.get(timeout=JOURNAL_FSYNC_INTERVAL)
+            except queue.Empty:
+                record = None
+            batch = [] if record is None else [record]
+            while len(batch) < JOURNAL_FSYNC_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            with self._lock:
+                for record in batch:
+                    if record is _JOURNAL_STOP:
+                        stop = True
+                        continue
+                    if not self.active.append(*record):
+                        self._roll_segment()
+                        self.active.append(*record)
+                    pending += 1
+                    self.records_written += 1
+                now = time.monotonic()
+                if pending and (stop or pending >= JOURNAL_FSYNC_BATCH or now - last_sync >= JOURNAL_FSYNC_INTERVAL):
+                    self.active.commit(sync=True)
+                    pending = 0
+                    last_sync = now
+                elif pending:
+                    self.active.commit(sync=False)  # Visible to readers, durable at the next sync
+            if stop:
+                return
+
+    def _roll_segment(self):
+        self.active.close_block()
+        self.active.commit(sync=True)
+        self.active.close()
+        self.segment_ids.append(self.segment_ids[-1] + 1)
+        self.active = JournalSegment(self._segment_path(self.segment_ids[-1]), writable=True)
+
+    def _reader(self, segment_id: int) -> JournalSegment:
+        if segment_id == self.segment_ids[-1]:
+            return self.active
+        segment = self._readers.get(segment_id)
+        if segment is None:
+            segment = JournalSegment(self._segment_path(segment_id), writable=False)
+            self._readers[segment_id] = segment
+            if len(self._readers) > 4:
+                self._readers.popitem(last=False)[1].close()
+        self._readers.move_to_end(segment_id)
+        return segment
+
+    def query(self, severities=None, start_ts=None, end_ts=None, before=None, limit=JOURNAL_PAGE_SIZE):
+        """
+        Newest-first page of records matching the filters. `before` is the cursor
+        returned by the previous page (None starts at the newest record).
+        Returns (records oldest-to-newest, cursor for the next older page or None).
+        """
+        mask = 0
+        for severity in severities or JOURNAL_SEVERITIES:
+            mask |= 1 << JOURNAL_SEVERITY_CODES[severity]
+        results = []
+        with self._lock:
+            for segment_id in reversed(self.segment_ids):
+                if before is not None and segment_id > before[0]:
+                    continue
+                segment = self._reader(segment_id)
+                blocks = list(segment.blocks)
+                if segment.open_block is not None:
+                    blocks.append(tuple(segment.open_block))
+                for first_ts, last_ts, start, end, _, block_mask in reversed(blocks):
+                    if before is not None and segment_id == before[0] and start >= before[1]:
+                        continue
+                    if not block_mask & mask:
+                        continue
+                    if (start_ts is not None and last_ts < start_ts) or (end_ts is not None and first_ts > end_ts):
+                        continue
+                    if before is not None and segment_id == before[0]:
+                        end = min(end, before[1])
+                    matches = [(offset, record) for offset, _, record in segment.scan(start, end)
+                               if (1 << JOURNAL_SEVERITY_CODES[record[1]]) & mask
+                               and (start_ts is None or record[0] >= start_ts)
+                               and (end_ts is None or record[0] <= end_ts)]
+                    for offset, record in reversed(matches):
+                        results.append(record)
+                        if len(results) >= limit:
+                            return list(reversed(results)), (segment_id, offset)
+        return list(reversed(results)), None
+
+    def close(self):
+        """Drains queued events, syncs and unmaps everything."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_JOURNAL_STOP)
+        self._writer.join(timeout=5)
+        with self._lock:
+            self.active.commit(sync=True)
+            self.active.close()
+            for segment in self._readers.values():
+                segment.close()
+            self._readers.clear()
+
+
+_JOURNAL_STOP = object()
+
+
+# --- Indexed Log Search & Severity Filtering ---
+_TOKEN_RE = re.compile(r'[a-z0-9_]+')
+
+
+def tokenize(text: str) -> list:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _negate(value):
+    return -value
+
+
+class IdList:
+    """
+    Ascending line ids in two typed arrays that both grow at their end: ids prepended
+    by paged-in history (descending, in `head`) and appended live ids (in `tail`).
+    """
+
+    __slots__ = ('head', 'tail')
+
+    def __init__(self):
+        self.head = array('q')
+        self.tail = array('q')
+
+    def append(self, line_id: int):
+        self.tail.append(line_id)
+
+    def prepend(self, line_id: int):
+        self.head.append(line_id)
+
+    def __len__(self):
+        return len(self.head) + len(self.tail)
+
+    def __iter__(self):
+        return itertools.chain(reversed(self.head), self.tail)
+
+    def __getitem__(self, position: int):
+        """Id at an ascending position (0 is the lowest)."""
+        if position < len(self.head):
+            return self.head[len(self.head) - 1 - position]
+        return self.tail[position - len(self.head)]
+
+    def to_array(self):
+        ids = self.head[::-1]
+        ids.extend(self.tail)
+        return ids
+
+    def trim(self, low: int, high: int):
+        """Drops ids outside [low, high)."""
+        head, tail = self.head, self.tail
+        del head[bisect.bisect_right(head, -low, key=_negate):]
+        del head[:bisect.bisect_right(head, -high, key=_negate)]
+        del tail[bisect.bisect_left(tail, high):]
+        del tail[:bisect.bisect_left(tail, low)]
+
+
+class LogIndex:
+    """
+    Bounded in-memory inverted index over log lines. Each token maps to an IdList
+    of line ids, each severity owns one too, and a sorted vocabulary serves prefix
+    lookups by bisection. Line ids are never reused: live lines count up from
+    next_id and paged history counts down from low_id, whatever is evicted in
+    between. Past capacity + LOG_INDEX_TRIM lines, a chunk is evicted from the end
+    opposite to the one that grew (older lines stay in the journal).
+    """
+
+    def __init__(self, capacity=LOG_INDEX_CAPACITY):
+        self.capacity = capacity
+        self._lines = {}  # line id -> (display text, severity)
+        self._order = IdList()  # Every held id, ascending
+        self.next_id = 0  # Id of the next live line
+        self.low_id = 0  # Lowest id handed out so far; paged history goes below it
+        self.postings = {}
+        self.vocabulary = []
+        self.by_severity = {severity: IdList() for severity in JOURNAL_SEVERITIES}
+        self.severity_counts = dict.fromkeys(JOURNAL_SEVERITIES, 0)  # Lines currently held, per severity
+        self.generation = 0  # Bumped on clear() and prepend(), so followers know to re-read
+
+    def __len__(self):
+        return len(self._lines)
+
+    def __contains__(self, line_id):
+        return line_id in self._lines
+
+    @property
+    def first_id(self) -> int:
+        return self._order[0] if self._lines else self.next_id
+
+    @property
+    def end_id(self) -> int:
+        """One past the newest line id."""
+        return self.next_id
+
+    def line(self, line_id: int):
+        """(display text, severity) of a held line."""
+        return self._lines[line_id]
+
+    def _index(self, line_id, text, severity, at_end):
+        self._lines[line_id] = (text, severity)
+        for token in set(tokenize(text)):
+            postings = self.postings.get(token)
+            if postings is None:
+                postings = self.postings[token] = IdList()
+                bisect.insort(self.vocabulary, token)
+            (postings.append if at_end else postings.prepend)(line_id)
+        for ids in (self.by_severity[severity], self._order):
+            (ids.append if at_end else ids.prepend)(line_id)
+        self.severity_counts[severity] += 1
+
+    def add(self, text: str, severity: str) -> int:
+        """Indexes one line and returns its id."""
+        line_id = self.next_id
+        self.next_id += 1
+        self._index(line_id, text, severity if severity in self.by_severity else 'INFO', at_end=True)
+        if len(self) >= self.capacity + LOG_INDEX_TRIM:
+            self._evict(oldest=True)
+        return line_id
+
+    def prepend(self, lines):
+        """Indexes older lines, given oldest to newest, in front of the current ones."""
+        for text, severity in reversed(lines):
+            self.low_id -= 1
+            self._index(self.low_id, text, severity if severity in self.by_severity else 'INFO', at_end=False)
+        if len(self) > self.capacity:
+            self._evict(oldest=False)  # Keep the history just paged in; the newest lines are in the journal
+        self.generation += 1
+
+    def _evict(self, oldest: bool):
+        count = len(self) - self.capacity
+        held = len(self)
+        if oldest:
+            evicted = [self._order[k] for k in range(count)]
+            low, high = self._order[count], self.next_id
+        else:
+            evicted = [self._order[k] for k in range(held - count, held)]
+            low, high = self.low_id, self._order[held - count]
+        tokens = set()
+        for line_id in evicted:
+            text, severity = self._lines.pop(line_id)
+            tokens.update(tokenize(text))
+            self.severity_counts[severity] -= 1
+        for token in tokens:
+            postings = self.postings[token]
+            postings.trim(low, high)
+            if not postings:
+                del self.postings[token]
+                del self.vocabulary[bisect.bisect_left(self.vocabulary, token)]
+        for ids in (*self.by_severity.values(), self._order):
+            ids.trim(low, high)
+
+    def clear(self):
+        generation = self.generation + 1
+        self.__init__(self.capacity)
+        self.generation = generation
+
+    def ids(self):
+        return self._order.to_array()
+
+    def _severity_ids(self, severities):
+        if set(severities) >= set(JOURNAL_SEVERITIES):
+            return self.ids()
+        return array('q', heapq.merge(*(self.by_severity[severity] for severity in severities)))
+
+    def _prefix_tokens(self, prefix):
+        vocabulary = self.vocabulary
+        position = bisect.bisect_left(vocabulary, prefix)
+        while position < len(vocabulary) and vocabulary[position].startswith(prefix):
+            yield vocabulary[position]
+            position += 1
+
+    def _token_ids(self, tokens):
+        """Lines containing every token; the last token also matches as a prefix (search-as-you-type)."""
+        *exact, last = tokens
+        lists = [self.postings.get(token, ()) for token in exact]
+        prefix_hits = set()
+        for token in self._prefix_tokens(last):
+            prefix_hits.update(self.postings[token])
+        result = prefix_hits
+        for postings in sorted(lists, key=len):
+            if not result:
+                break
+            result = result.intersection(postings)
+        return sorted(result)
+
+    def search(self, query: str, severities=JOURNAL_SEVERITIES):
+        """Ascending line ids matching all query tokens and one of the severities."""
+        tokens = tokenize(query)
+        if not tokens:
+            return self._severity_ids(severities)
+        wanted = set(severities)
+        return array('q', (i for i in self._token_ids(tokens) if self.line(i)[1] in wanted))
+
+    def matches(self, line_id: int, query: str, severities) -> bool:
+        """Incremental check for a single new line against the active filter."""
+        text, severity = self.line(line_id)
+        if severity not in severities:
+            return False
+        tokens = tokenize(query)
+        if not tokens:
+            return True
+        line_tokens = set(tokenize(text))
+        *exact, last = tokens
+        return all(t in line_tokens for t in exact) and any(t.startswith(last) for t in line_tokens)
+
+
+class LogView:
+    """
+    Virtualized, filtered view of a LogIndex in a Text widget: the widget only ever
+    holds the visible window of matching lines, and the scrollbar maps onto the
+    whole match list, so a million-line log scrolls and filters like a short one.
+    """
+
+    def __init__(self, text: tk.Text, scrollbar: tk.Scrollbar, index: LogIndex):
+        self.text = text
+        self.scrollbar = scrollbar
+        self.index = index
+        self.query = ''
+        self.severities = set(JOURNAL_SEVERITIES)
+        self.matches = index.search('')
+        self.first = 0
+        self.rows = LOG_VIEW_MIN_ROWS
+        self.follow = True  # Stick to the newest line while the user hasn't scrolled away
+        scrollbar.config(command=self.yview)
+        text.bind('<MouseWheel>', lambda e: self.scroll(-1 if e.delta > 0 else 1, 'units'))
+        text.bind('<Button-4>', lambda e: self.scroll(-1, 'units'))
+        text.bind('<Button-5>', lambda e: self.scroll(1, 'units'))
+        text.bind('<Configure>', self._on_resize, add='+')
+
+    def _on_resize(self, event):
+        linespace = tkfont.Font(font=self.text.cget('font')).metrics('linespace') or 14
+        rows = max(LOG_VIEW_MIN_ROWS, event.height // linespace)
+        if rows != self.rows:
+            self.rows = rows
+            self.render()
+
+    def set_filter(self, query=None, severities=None):
+        if query is not None:
+            self.query = query
+        if severities is not None:
+            self.severities = set(severities)
+        self.matches = self.index.search(self.query, self.severities)
+        self.follow = True
+        self.render()
+
+    def reset(self):
+        """Re-reads the (cleared or rebuilt) index with the current filter."""
+        self.set_filter()
+
+    def _drop_evicted(self):
+        """Forgets matches the index has evicted; the window stays on the same lines."""
+        dropped = bisect.bisect_left(self.matches, self.index.first_id)
+        del self.matches[:dropped]
+        self.first = max(0, self.first - dropped)
+
+    def on_line_added(self, line_id: int):
+        self._drop_evicted()
+        if line_id not in self.index or not self.index.matches(line_id, self.query, self.severities):
+            return
+        self.matches.append(line_id)
+        if not self.follow:
+            self._update_scrollbar()
+            return
+        # Incremental: append one line, drop the top one once the window is full
+        text, severity = self.index.line(line_id)
+        self.text.config(state=tk.NORMAL)
+        self.text.insert(tk.END, text + '\n', severity)
+        if len(self.matches) - self.first > self.rows:
+            self.first += 1
+            self.text.delete('1.0', '2.0')
+        self.text.see(tk.END)
+        self.text.config(state=tk.DISABLED)
+        self._update_scrollbar()
+
+    def render(self):
+        total = len(self.matches)
+        if self.follow:
+            self.first = max(0, total - self.rows)
+        self.first = max(0, min(self.first, max(0, total - self.rows)))
+        self.text.config(state=tk.NORMAL)
+        self.text.delete('1.0', tk.END)
+        for line_id in self.matches[self.first:self.first + self.rows]:
+            text, severity = self.index.line(line_id)
+            self.text.insert(tk.END, text + '\n', severity)
+        if self.follow:
+            self.text.see(tk.END)
+        else:
+            self.text.yview_moveto(0)
+        self.text.config(state=tk.DISABLED)
+        self._update_scrollbar()
+
+    def _update_scrollbar(self):
+        total = max(1, len(self.matches))
+        self.scrollbar.set(self.first / total, min(1.0, (self.first + self.rows) / total))
+
+    def scroll(self, amount: int, what: str):
+        step = self.rows if what == 'pages' else 3
+        self.first += int(amount) * step
+        self.follow = self.first + self.rows >= len(self.matches)
+        self.render()
+        return 'break'
+
+    def yview(self, *args):
+        """Scrollbar protocol: ('moveto', fraction) or ('scroll', n, 'units'|'pages')."""
+        if args[0] == 'moveto':
+            self.first = int(float(args[1]) * len(self.matches))
+            self.follow = self.first + self.rows >= len(self.matches)
+            self.render()
+        elif args[0] == 'scroll':
+            self.scroll(int(args[1]), args[2])
+
+
+def configure_log_tags(text: tk.Text):
+    for severity, color in LOG_COLORS.items():
+        text.tag_config(severity, foreground=color)
+    text.tag_config("CRITICAL", font=('Consolas', 10, 'bold'))
+
+
+# --- Prioritized Message Queue (lanes + overload shedding) ---
+def message_lane(message) -> str:
+    """Control messages (complete, error, ...) first, then ERROR/CRITICAL logs, then everything else."""
+    if message.get('type') != 'log':
+        return 'control'
+    return 'urgent' if message.get('severity') in ('ERROR', 'CRITICAL') else 'info'
+
+
+class LaneQueue:
+    """
+    Drop-in for msg_queue's queue.Queue: bounded lanes served in MSG_LANES order, so
+    a completion or CRITICAL event never waits behind a backlog of INFO lines. A full
+    log lane sheds its oldest entry; a full control lane rejects the new message.
+    Threat levels are coalesced rather than lost: 'threat_level' samples (and the
+    levels of shed logs) keep only the latest per source. Every message gets a
+    sequence number so the consumer can tell which level is newest after reordering.
+    """
+
+    def __init__(self, capacities=None):
+        self.capacities = {**MSG_LANE_CAPACITY, **(capacities or {})}
+        self.lanes = {lane: deque() for lane in MSG_LANES}
+        self.samples = OrderedDict()  # source -> newest coalesced threat_level message
+        self.shed = {lane: 0 for lane in MSG_LANES}
+        self.coalesced = 0
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+
+    def put(self, message, block=True, timeout=None):
+        with self._lock:
+            self._seq += 1
+            message = dict(message, seq=self._seq)  # Stamp a copy; the producer may reuse or keep its dict
+            if message.get('type') == 'threat_level':
+                self._coalesce(message)
+            else:
+                lane = message_lane(message)
+                queue_ = self.lanes[lane]
+                if len(queue_) >= self.capacities[lane]:
+                    self.shed[lane] += 1
+                    if lane == 'control':
+                        return
+                    dropped = queue_.popleft()
+                    if dropped.get('threat_level') is not None:
+                        self._coalesce({'type': 'threat_level', 'threat_level': dropped['threat_level'],
+                                        'source': dropped.get('source', 'simulation'), 'seq': dropped['seq']})
+                queue_.append(message)
+            self._ready.notify()
+
+    def put_nowait(self, message):
+        self.put(message, block=False)
+
+    def _coalesce(self, sample):
+        source = sample.get('source', 'simulation')
+        current = self.samples.get(source)
+        if current is not None:
+            self.coalesced += 1
+            if current['seq'] > sample['seq']:
+                return
+        self.samples[source] = sample
+
+    def get(self, block=True, timeout=None):
+        with self._lock:
+            if block and not self._ready.wait_for(self._qsize, timeout):
+                raise queue.Empty
+            for lane in MSG_LANES:
+                if lane == 'info' and self.samples:
+                    return self.samples.popitem(last=False)[1]  # Levels before the bulk of the log lines
+                if self.lanes[lane]:
+                    return self.lanes[lane].popleft()
+            if self.samples:
+                return self.samples.popitem(last=False)[1]
+            raise queue.Empty
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+    def _qsize(self) -> int:
+        return sum(len(lane) for lane in self.lanes.values()) + len(self.samples)
+
+    def qsize(self) -> int:
+        with self._lock:
+            return self._qsize()
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'depth': {lane: len(q) for lane, q in self.lanes.items()}, 'shed': dict(self.shed),
+                    'coalesced': self.coalesced, 'samples': len(self.samples)}
+
+
+# --- Local Network Event Stream (external threat feeds) ---
+def parse_endpoint(spec: str):
+    """'tcp:HOST:PORT', 'udp:HOST:PORT' or 'unix:PATH' -> (kind, address)."""
+    kind, _, rest = spec.partition(':')
+    if kind == 'unix':
+        return kind, rest
+    if kind in ('tcp', 'udp'):
+        host, _, port = rest.rpartition(':')
+        return kind, (host or '127.0.0.1', int(port))
+    raise ValueError(f"Unsupported endpoint '{spec}' (use tcp:HOST:PORT, udp:HOST:PORT or unix:PATH)")
+
+
+def normalize_event(event):
+    """
+    Validates an external event against the shapes run_simulation produces and
+    returns the msg_queue message, or None if it's malformed.
+    """
+    if not isinstance(event, dict):
+        return None
+    kind = event.get('type')
+    level = event.get('threat_level')
+    if level is not None:
+        if not isinstance(level, (int, float)):
+            return None
+        level = max(0, min(MAX_THREAT_LEVEL, int(level)))
+    if kind == 'log':
+        if event.get('severity') not in JOURNAL_SEVERITY_CODES or not isinstance(event.get('message'), str):
+            return None
+        source = f"ingest:{event['source']}" if isinstance(event.get('source'), str) else 'ingest'
+        return {'type': 'log', 'severity': event['severity'], 'message': event['message'], 'threat_level': level,
+                'source': source}
+    if kind == 'attack_complete':
+        prevention = event.get('prevention', [])
+        if not isinstance(event.get('verdict'), str) or not isinstance(prevention, list):
+            return None
+        return {'type': 'attack_complete', 'verdict': event['verdict'], 'prevention': [str(p) for p in prevention],
+                'threat_level': level or 0}
+    if kind == 'error':
+        if not isinstance(event.get('message'), str):
+            return None
+        return {'type': 'error', 'message': event['message']}
+    return None
+
+
+class IngestServer:
+    """
+    Asyncio ingest server for newline-delimited JSON events over TCP, UDP and/or a
+    Unix socket, running on its own thread and feeding the app's msg_queue.
+    Input is parsed a chunk (many lines) at a time. Stream sockets get real
+    backpressure: once the queue reaches INGEST_HIGH_WATER, ingestion stops (mid
+    chunk if need be) and reading resumes below INGEST_LOW_WATER, so TCP flow
+    control slows the producer down.
+    Datagrams can't be paused, so UDP sheds load instead: above the high-water
+    mark only ERROR/CRITICAL and control events are kept, above twice the mark
+    everything is dropped.
+    """
+
+    def __init__(self, sink: queue.Queue, endpoints, high_water=INGEST_HIGH_WATER, low_water=INGEST_LOW_WATER):
+        self.sink = sink
+        self.endpoints = [parse_endpoint(e) if isinstance(e, str) else e for e in endpoints]
+        self.high_water = high_water
+        self.low_water = low_water
+        self.received = 0
+        self.accepted = 0
+        self.rejected = 0
+        self.dropped = 0
+        self.paused = 0
+        self.rate = 0.0  # Accepted events per second (EWMA)
+        self.bound = []  # (kind, actual address) once listening
+        self.ready = threading.Event()
+        self._loop = None
+        self._servers = []
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='ingest-server', daemon=True)
+        self._thread.start()
+        self.ready.wait(timeout=5)
+        return self
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self._open_endpoints())
+        except OSError as e:
+            print(f"Ingest server failed to start: {e}")
+            self.ready.set()
+            return
+        self.ready.set()
+        self._loop.create_task(self._measure_rate())
+        self._loop.run_forever()
+        # Shutdown: stop listening, cancel live connections, then close the loop
+        for server in self._servers:
+            server.close()
+        tasks = asyncio.all_tasks(self._loop)
+        for task in tasks:
+            task.cancel()
+        self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self._loop.close()
+
+    async def _open_endpoints(self):
+        loop = asyncio.get_running_loop()
+        for kind, address in self.endpoints:
+            if kind == 'tcp':
+                server = await asyncio.start_server(self._handle_stream, *address)
+                self.bound.append((kind, server.sockets[0].getsockname()[:2]))
+            elif kind == 'unix':
+                if os.path.exists(address):
+                    os.unlink(address)
+                server = await asyncio.start_unix_server(self._handle_stream, address)
+                self.bound.append((kind, address))
+            else:
+                transport, _ = await loop.create_datagram_endpoint(lambda: _IngestDatagramProtocol(self),
+                                                                   local_addr=address)
+                server = transport
+                self.bound.append((kind, transport.get_extra_info('sockname')[:2]))
+            self._servers.append(server)
+
+    async def _handle_stream(self, reader, writer):
+        buffer = b''
+        try:
+            while True:
+                if self.sink.qsize() >= self.high_water:
+                    await self._wait_for_drain()
+                chunk = await reader.read(INGEST_READ_SIZE)
+                if not chunk:
+                    break
+                buffer += chunk
+                lines = buffer.split(b'\n')
+                buffer = lines.pop()
+                while lines:
+                    # One chunk can hold thousands of events: stop at the high-water mark, finish after the drain
+                    del lines[:self.ingest_lines(lines, limit=self.high_water)]
+                    if lines:
+                        await self._wait_for_drain()
+            if buffer.strip():
+                self.ingest_lines([buffer])
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass  # Peer went away or the server is shutting down
+        finally:
+            writer.close()
+
+    async def _wait_for_drain(self):
+        """Backpressure: stop reading until the UI has drained the queue."""
+        self.paused += 1
+        while self.sink.qsize() > self.low_water:
+            await asyncio.sleep(INGEST_BACKPRESSURE_POLL)
+
+    def ingest_lines(self, lines, shed=False, limit=None):
+        """
+        Parses a batch of raw lines; with shed=True only urgent events survive.
+        With limit, stops once the queue holds that many messages. Returns the lines consumed.
+        """
+        depth = self.sink.qsize()
+        for consumed, raw in enumerate(lines):
+            if limit is not None and depth >= limit:
+                return consumed
+            if not raw.strip():
+                continue
+            self.received += 1
+            try:
+                message = normalize_event(json.loads(raw))
+            except (ValueError, UnicodeDecodeError):
+                message = None
+            if message is None:
+                self.rejected += 1
+                continue
+            if shed:
+                urgent = message['type'] != 'log' or message['severity'] in ('ERROR', 'CRITICAL')
+                if depth >= self.high_water * 2 or not urgent:
+                    self.dropped += 1
+                    continue
+            self.sink.put(message)
+            depth += 1
+            self.accepted += 1
+        return len(lines)
+
+    async def _measure_rate(self):
+        last_accepted = self.accepted
+        last_time = time.monotonic()
+        while True:
+            await asyncio.sleep(1.0)
+            now = time.monotonic()
+            instant = (self.accepted - last_accepted) / (now - last_time)
+            self.rate = instant if self.rate == 0 else self.rate * 0.6 + instant * 0.4
+            last_accepted, last_time = self.accepted, now
+
+    def stats(self) -> dict:
+        return {'received': self.received, 'accepted': self.accepted, 'rejected': self.rejected,
+                'dropped': self.dropped, 'backpressure_pauses': self.paused, 'rate': self.rate,
+                'queue_depth': self.sink.qsize()}
+
+    def stop(self):
+        if self._loop is not None and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+
+class _IngestDatagramProtocol(asyncio.DatagramProtocol):
+    """Each datagram may carry several newline-delimited events."""
+
+    def __init__(self, server: IngestServer):
+        self.server = server
+
+    def datagram_received(self, data, addr):
+        self.server.ingest_lines(data.split(b'\n'), shed=self.server.sink.qsize() >= self.server.high_water)
+
+
+def send_fake_events(endpoint: str, count=1000, rate=0.0, seed=None):
+    """
+    Local fake producer for exercising the ingest server: sends `count` events
+    shaped like run_simulation's, at `rate` events/s (0 = as fast as possible).
+    """
+    kind, address = parse_endpoint(endpoint)
+    rng = RandomStreams(seed).stream('fake_producer')
+    scenario_logs = [entry for info in ATTACK_DATA.values() for entry in info['logs']]
+    if kind == 'udp':
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        send = lambda payload: sock.sendto(payload, address)
+    else:
+        sock = socket.socket(socket.AF_UNIX if kind == 'unix' else socket.AF_INET, socket.SOCK_STREAM)
+        sock.connect(address)
+        send = sock.sendall
+    interval = 1.0 / rate if rate > 0 else 0.0
+    try:
+        for i in range(count):
+            severity, message = rng.choice(scenario_logs)
+            event = {'type': 'log', 'severity': severity, 'message': f"[IDS] {message}",
+                     'threat_level': rng.randint(0, MAX_THREAT_LEVEL)}
+            send((json.dumps(event) + '\n').encode('utf-8'))
+            if interval:
+                time.sleep(interval)
+    finally:
+        sock.close()
+
+
+# --- Headless Metrics / State Export Endpoint ---
+class MetricsServer:
+    """
+    Local HTTP endpoint on a background thread exposing the app snapshot as JSON
+    (/state) and Prometheus text (/metrics). The Tk thread calls publish() once per
+    frame with a plain dict; both payloads are pre-encoded there and swapped in as
+    one tuple, so scrapes only read bytes and never touch Tk.
+    """
+
+    def __init__(self, host='127.0.0.1', port=METRICS_PORT):
+        self.payloads = (b'{}', b'')
+        self.scrapes = 0
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                state_json, prometheus = server.payloads
+                path = self.path.split('?', 1)[0]
+                if path in ('/state', '/state.json'):
+                    body, content_type = state_json, 'application/json'
+                elif path == '/metrics':
+                    body, content_type = prometheus, 'text/plain; version=0.0.4'
+                else:
+                    self.send_error(404)
+                    return
+                server.scrapes += 1
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Keep scrapes out of stderr
+
+        self.httpd = http.server.ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.address = self.httpd.server_address[:2]
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='metrics-server', daemon=True)
+        self._thread.start()
+
+    def publish(self, snapshot: dict):
+        self.payloads = (json.dumps(snapshot).encode('utf-8'), self.to_prometheus(snapshot).encode('utf-8'))
+
+    @staticmethod
+    def escape_label(value) -> str:
+        """Label value escaping from the text exposition format: backslash, double quote, newline."""
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+    @staticmethod
+    def to_prometheus(snapshot: dict) -> str:
+        out = []
+
+        def metric(name, kind, help_text, samples):
+            out.append(f"# HELP threat_matrix_{name} {help_text}")
+            out.append(f"# TYPE threat_matrix_{name} {kind}")
+            for labels, value in samples:
+                label_text = ','.join(f'{k}="{MetricsServer.escape_label(v)}"' for k, v in labels.items())
+                out.append(f"threat_matrix_{name}{{{label_text}}} {value}" if label_text
+                           else f"threat_matrix_{name} {value}")
+
+        state = snapshot['state']
+        metric('threat_level', 'gauge', "Current threat level (0-100).", [({}, state['threat_level'])])
+        metric('simulation_running', 'gauge', "1 while a simulation is running.", [({}, int(state['is_running']))])
+        metric('quality_tier', 'gauge', "Active adaptive quality tier index.", [({}, state['quality_tier_index'])])
+        metric('frame_interval_seconds', 'gauge', "Measured main-loop frame interval.",
+               [({}, state['frame_interval'])])
+        metric('msg_queue_depth', 'gauge', "Messages waiting in msg_queue.", [({}, snapshot['queue_depth'])])
+        lanes = snapshot.get('queue_lanes') or {'depth': {}, 'shed': {}, 'coalesced': 0}
+        metric('msg_queue_lane_depth', 'gauge', "Messages waiting per msg_queue lane.",
+               [({'lane': lane}, depth) for lane, depth in lanes['depth'].items()])
+        metric('msg_queue_shed_total', 'counter', "Messages dropped by msg_queue overload shedding.",
+               [({'lane': lane}, count) for lane, count in lanes['shed'].items()])
+        metric('msg_queue_coalesced_total', 'counter', "Threat-level samples merged into a newer one.",
+               [({}, lanes['coalesced'])])
+        metric('timers', 'gauge', "Live recurring after() loops by name.",
+               [({'loop': name}, count) for name, count in sorted(snapshot.get('timers', {}).items())])
+        metric('widget_frame_seconds', 'gauge', "Per-widget frame cost.",
+               [({'widget': name, 'stat': stat}, entry[stat])
+                for name, entry in sorted(snapshot['frames'].items()) for stat in ('avg', 'max', 'last')])
+        metric('widget_frames_total', 'counter', "Frames rendered per widget.",
+               [({'widget': name}, entry['frames']) for name, entry in sorted(snapshot['frames'].items())])
+        metric('log_lines', 'gauge', "Log lines held in the searchable log, by severity (resets on clear).",
+               [({'severity': sev}, count) for sev, count in snapshot['log_counts'].items()])
+        if snapshot.get('ingest'):
+            ingest = snapshot['ingest']
+            metric('ingest_events_total', 'counter', "External events by outcome.",
+                   [({'outcome': k}, ingest[k]) for k in ('accepted', 'rejected', 'dropped')])
+            metric('ingest_rate', 'gauge', "Accepted external events per second.", [({}, ingest['rate'])])
+        return '\n'.join(out) + '\n'
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+# --- Synthetic Load Generator (stress test for the UI message path) ---
+def parse_rates(spec: str) -> tuple:
+    try:
+        rates = tuple(float(v) for v in spec.split(',') if v)
+    except ValueError:
+        rates = ()
+    if not rates or min(rates) <= 0:
+        raise argparse.ArgumentTypeError(f"expected comma-separated positive events/s, got {spec!r}")
+    return rates
+
+
+def parse_severity_mix(spec: str) -> dict:
+    """'INFO=70,CRITICAL=5' -> relative weights; unnamed severities keep their LOADGEN_MIX weight."""
+    mix = dict(LOADGEN_MIX)
+    for part in spec.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip().upper()
+        try:
+            mix[name] = float(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"expected SEVERITY=WEIGHT, got {part!r}")
+        if name not in JOURNAL_SEVERITY_CODES or mix[name] < 0:
+            raise argparse.ArgumentTypeError(f"bad severity weight {part!r}")
+    if not any(weight > 0 for weight in mix.values()):
+        raise argparse.ArgumentTypeError(f"at least one severity needs a positive weight, got {spec!r}")
+    return mix
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+class LoadStage:
+    """Measurements for one offered rate."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.sent = 0
+        self.started = self.finished = None
+        self.latencies = []  # Seconds from enqueue to the first idle point after the event was applied
+        self.frames = 0
+        self.dropped_frames = 0
+        self.depths = []
+
+    def summary(self) -> dict:
+        latencies = sorted(self.latencies)
+        duration = max(1e-9, (self.finished or time.perf_counter()) - self.started)
+        return {
+            'offered_rate': self.rate,
+            'sent': self.sent,
+            'delivered': len(latencies),
+            'throughput': round(len(latencies) / duration, 1),
+            'latency_p50_ms': round(percentile(latencies, 0.5) * 1000, 1),
+            'latency_p95_ms': round(percentile(latencies, 0.95) * 1000, 1),
+            'latency_p99_ms': round(percentile(latencies, 0.99) * 1000, 1),
+            'latency_max_ms': round((latencies[-1] if latencies else 0.0) * 1000, 1),
+            'frames': self.frames,
+            'dropped_frames': self.dropped_frames,
+            'queue_depth_max': max(self.depths, default=0),
+            'queue_depth_mean': round(sum(self.depths) / len(self.depths), 1) if self.depths else 0.0,
+        }
+
+
+class LoadGenerator:
+    """
+    Pushes synthetic log events into the app's msg_queue through a series of rate
+    stages, sustained or bursty, and measures the UI side: enqueue-to-screen latency,
+    frames lost while the Tk loop was busy, and queue depth. Ends with a saturation
+    report and closes the app, so it can run unattended.
+    """
+
+    def __init__(self, app, rates=LOADGEN_RATES, stage_seconds=LOADGEN_STAGE_SECONDS, mix=None,
+                 pattern='sustained', report_path=None, seed=None):
+        self.app = app
+        self.stages = [LoadStage(rate) for rate in rates]
+        self.stage_seconds = stage_seconds
+        mix = mix or LOADGEN_MIX
+        self.severities = [name for name in mix if mix[name] > 0]
+        self.cumulative = list(itertools.accumulate(mix[name] for name in self.severities))
+        self.pattern = pattern
+        self.report_path = report_path
+        self.rng = RandomStreams(seed).stream('loadgen')
+        self.timeline = []  # (seconds since start, queue depth, frame interval ms)
+        self.current = None
+        self.done = threading.Event()
+        self.probe_interval = 1.0 / TARGET_FPS
+        self._last_probe = None
+        self._started = None
+
+    def start(self):
+        self._started = self._last_probe = time.perf_counter()
+        threading.Thread(target=self._produce, name='loadgen', daemon=True).start()
+        TIMERS.schedule(self.app, 'loadgen', int(self.probe_interval * 1000), self._probe)
+        print(f"Load generator: {len(self.stages)} stages x {self.stage_seconds:g}s ({self.pattern})")
+        return self
+
+    def _rate_at(self, rate, elapsed):
+        """Bursty stages run LOADGEN_BURST_FACTOR x rate for part of each period; the mean stays `rate`."""
+        if self.pattern != 'burst':
+            return rate
+        factor, share = LOADGEN_BURST_FACTOR, LOADGEN_BURST_SHARE
+        if elapsed % LOADGEN_BURST_PERIOD < LOADGEN_BURST_PERIOD * share:
+            return rate * factor
+        return rate * (1 - factor * share) / (1 - share)
+
+    def _produce(self):
+        msg_queue = self.app.msg_queue
+        for index, stage in enumerate(self.stages):
+            self.current = stage
+            stage.started = time.perf_counter()
+            due, previous = 0.0, stage.started
+            while True:
+                now = time.perf_counter()
+                elapsed = now - stage.started
+                if elapsed >= self.stage_seconds or self.done.is_set():
+                    break
+                # Paced by real elapsed time, so oversleeping can't undersend
+                due += self._rate_at(stage.rate, elapsed) * (now - previous)
+                previous = now
+                while stage.sent < due:
+                    roll = self.rng.random() * self.cumulative[-1]
+                    severity = self.severities[bisect.bisect_right(self.cumulative, roll)]
+                    msg_queue.put({'type': 'log', 'severity': severity, 'source': 'loadgen',
+                                   'message': f"[LOADGEN] synthetic {severity.lower()} event #{stage.sent}",
+                                   'threat_level': self.rng.randint(0, MAX_THREAT_LEVEL),
+                                   'enqueued': time.perf_counter(), 'stage': index})
+                    stage.sent += 1
+                time.sleep(max(0.0, now + LOADGEN_TICK - time.perf_counter()))
+            stage.finished = time.perf_counter()
+        self.current = None
+
+    def on_applied(self, events):
+        """process_queue hook: timestamps are taken once Tk is idle again, i.e. after the redraw."""
+        self.app.after_idle(self._on_screen, [(event['stage'], event['enqueued']) for event in events])
+
+    def _on_screen(self, stamps):
+        now = time.perf_counter()
+        for index, enqueued in stamps:
+            self.stages[index].latencies.append(now - enqueued)
+
+    def _probe(self):
+        now = time.perf_counter()
+        interval = now - self._last_probe
+        self._last_probe = now
+        depth = self.app.msg_queue.qsize()
+        self.timeline.append((round(now - self._started, 3), depth, round(interval * 1000, 1)))
+        stage = self.current
+        if stage is not None:
+            stage.frames += 1
+            stage.dropped_frames += max(0, round(interval / self.probe_interval) - 1)
+            stage.depths.append(depth)
+        if self.current is None and (depth == 0 or now - self.stages[-1].finished > LOADGEN_DRAIN_TIMEOUT):
+            self.finish()
+            return
+        TIMERS.schedule(self.app, 'loadgen', int(self.probe_interval * 1000), self._probe)
+
+    def report(self) -> dict:
+        stages = [stage.summary() for stage in self.stages]
+        saturation = next((s['offered_rate'] for s in stages
+                           if s['latency_p95_ms'] > LOADGEN_SATURATION_MS or s['delivered'] < 0.9 * s['sent']), None)
+        return {'pattern': self.pattern, 'stage_seconds': self.stage_seconds, 'saturation_rate': saturation,
+                'stages': stages, 'timeline': self.timeline}
+
+    def finish(self):
+        self.done.set()
+        report = self.report()
+        print(f"{'rate/s':>8} {'sent':>7} {'thru/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+              f"{'dropped':>8} {'depth max':>9}")
+        for s in report['stages']:
+            print(f"{s['offered_rate']:>8g} {s['sent']:>7} {s['throughput']:>8} {s['latency_p50_ms']:>8} "
+                  f"{s['latency_p95_ms']:>8} {s['latency_p99_ms']:>8} {s['dropped_frames']:>8} "
+                  f"{s['queue_depth_max']:>9}")
+        if report['saturation_rate'] is None:
+            print("No saturation within the tested rates")
+        else:
+            print(f"Saturated at {report['saturation_rate']:g} events/s "
+                  f"(p95 latency > {LOADGEN_SATURATION_MS} ms or < 90% delivered)")
+        if self.report_path:
+            try:
+                with open(self.report_path, 'w') as f:
+                    json.dump(report, f, indent=2)
+            except OSError as e:
+                print(f"Load report not saved: {e}")
+        self.app.on_close()
+
+
+# --- Soak Test (long-running leak detection) ---
+def resident_set_mb():
+    """Current RSS from /proc, or None where it isn't available."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def canvas_item_counts(root) -> dict:
+    """Items per canvas, keyed by widget path, over the whole widget tree (Toplevels included)."""
+    counts = {}
+    pending = [root]
+    while pending:
+        widget = pending.pop()
+        if isinstance(widget, tk.Canvas):
+            counts[str(widget)] = len(widget.find_all())
+        pending.extend(widget.winfo_children())
+    return counts
+
+
+class SoakMonitor:
+    """
+    Runs scenarios back to back on accelerated time and samples the resources that
+    leak in a long-lived Tk app: canvas items per widget, pending `after` callbacks,
+    log Text lines, tracemalloc's traced memory (with the top growing allocation
+    sites) and RSS. Growth is measured against a baseline taken after warm-up; any
+    growth past SOAK_THRESHOLDS fails the run.
+    """
+
+    def __init__(self, app, duration: float, speed=SOAK_SPEED, interval=SOAK_SAMPLE_SECONDS, thresholds=None,
+                 report_path=None):
+        self.app = app
+        self.duration = duration
+        self.speed = speed
+        self.interval = interval
+        self.thresholds = {**SOAK_THRESHOLDS, **(thresholds or {})}
+        self.report_path = report_path
+        self.samples = []
+        self.baseline = None
+        self.baseline_snapshot = None
+        self.failures = []
+        self.scenarios = itertools.cycle(ATTACK_DATA)
+        self.runs = 0
+        self._idle_since = None
+        self._started = None
+
+    def start(self):
+        tracemalloc.start()
+        CLOCK.set_speed(self.speed)  # Animations and the simulation's step interval both follow the clock
+        self._started = time.perf_counter()
+        TIMERS.schedule(self.app, 'soak_driver', 200, self._drive)
+        TIMERS.schedule(self.app, 'soak', int(self.interval * 1000), self._sample)
+        print(f"Soak test: {self.duration:g}s at {self.speed:g}x, sampling every {self.interval:g}s")
+        return self
+
+    def _drive(self):
+        """Starts the next scenario once the previous one has been idle for a (dilated) moment."""
+        if self.app.state.is_running:
+            self._idle_since = None
+        elif self._idle_since is None:
+            self._idle_since = time.perf_counter()
+        elif time.perf_counter() - self._idle_since >= SOAK_SCENARIO_GAP / self.speed:
+            self.app.initiate_simulation(next(self.scenarios))
+            self.runs += 1
+            self._idle_since = None
+        TIMERS.schedule(self.app, 'soak_driver', 200, self._drive)
+
+    def measure(self) -> dict:
+        log_index = self.app.log_index
+        rss = resident_set_mb()
+        return {
+            'elapsed': round(time.perf_counter() - self._started, 1),
+            'runs': self.runs,
+            'canvas_items': canvas_item_counts(self.app),
+            'after_callbacks': len(self.app.tk.call('after', 'info')),
+            'timers': TIMERS.counts(),
+            'log_lines': len(log_index),
+            'log_postings': sum(len(ids) for ids in log_index.postings.values()),
+            'traced_mb': round(tracemalloc.get_traced_memory()[0] / 2 ** 20, 2),
+            'rss_mb': None if rss is None else round(rss, 1),
+        }
+
+    def growth(self, sample: dict) -> dict:
+        base = self.baseline
+        items = {path: count - base['canvas_items'].get(path, 0) for path, count in sample['canvas_items'].items()}
+        worst = max(items, key=items.get, default=None)
+        return {
+            'canvas_items': (items[worst] if worst else 0, worst),
+            'after_callbacks': (sample['after_callbacks'] - base['after_callbacks'], None),
+            'log_lines': (sample['log_lines'] - base['log_lines'], None),
+            'log_postings': (sample['log_postings'] - base['log_postings'], None),
+            'traced_mb': (round(sample['traced_mb'] - base['traced_mb'], 2), None),
+            'rss_mb': (round(sample['rss_mb'] - base['rss_mb'], 1) if base['rss_mb'] is not None else 0, None),
+        }
+
+    def _snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),))
+
+    def _sample(self):
+        sample = self.measure()
+        self.samples.append(sample)
+        if len(self.samples) == SOAK_WARMUP_SAMPLES:
+            self.baseline = sample  # Caches, pools and sprite LRUs are full by now
+            self.baseline_snapshot = self._snapshot()
+        elif self.baseline is not None:
+            growth = self.growth(sample)
+            sample['growth'] = {key: value for key, (value, _) in growth.items()}
+            print(f"[soak {sample['elapsed']:>8.0f}s] runs {self.runs}  " +
+                  "  ".join(f"{key} {value:+g}" for key, value in sample['growth'].items()))
+            for key, (value, where) in growth.items():
+                if value > self.thresholds[key]:
+                    self.failures.append(f"{key} grew by {value:g}{f' in {where}' if where else ''} "
+                                         f"(limit {self.thresholds[key]:g})")
+        if self.failures or time.perf_counter() - self._started >= self.duration:
+            self.finish()
+            return
+        TIMERS.schedule(self.app, 'soak', int(self.interval * 1000), self._sample)
+
+    def finish(self):
+        top = []
+        if self.baseline_snapshot is not None:
+            stats = self._snapshot().compare_to(self.baseline_snapshot, 'lineno')
+            top = [str(stat) for stat in stats[:SOAK_TOP_ALLOCATORS] if stat.size_diff > 0]
+        tracemalloc.stop()
+        CLOCK.set_speed(1.0)
+        if top:
+            print("Top growing allocation sites since baseline:")
+            for line in top:
+                print(f"  {line}")
+        if self.baseline is None:
+            self.failures.append(f"run ended before the baseline (needs {SOAK_WARMUP_SAMPLES} samples)")
+        print(f"Soak test {'FAILED' if self.failures else 'passed'} after {self.runs} scenario runs")
+        for failure in self.failures:
+            print(f"  {failure}")
+        if self.report_path:
+            try:
+                with open(self.report_path, 'w') as f:
+                    json.dump({'speed': self.speed, 'thresholds': self.thresholds, 'failures': self.failures,
+                               'top_allocators': top, 'samples': self.samples}, f, indent=2)
+            except OSError as e:
+                print(f"Soak report not saved: {e}")
+        self.app.exit_code = 1 if self.failures else 0
+        self.app.on_close()
+
+
 # --- ENHANCEMENT: App State Manager ---
 class AppState:
     """Manages the central state of the application for decoupled access."""
@@ -207,6 +2072,10 @@ class AppState:
         self._threat_level = tk.IntVar(value=0)
         self._is_running = tk.BooleanVar(value=False)
         self.threat_history = deque([0] * MAX_THREAT_HISTORY, maxlen=MAX_THREAT_HISTORY)
+        # Long-term, cross-session history (the deque above is only the live sparkline window)
+        self.history_store = ThreatHistoryStore.load(HISTORY_FILE)
+        self.recording = True  # Off for synthetic runs, which must not reach the persistent store
+        self.revision = 0  # Bumped on every change; lets renderers skip unchanged frames
 
     @property
     def threat_level(self) -> int:
@@ -216,7 +2085,10 @@ class AppState:
     def threat_level(self, value: int):
         level = max(0, min(MAX_THREAT_LEVEL, value))
         self._threat_level.set(level)
+        self.revision += 1
         self.threat_history.append(level)
+        if self.recording:
+            self.history_store.record(level)
         # ENHANCEMENT: Broadcast state change via virtual event
         self.master.event_generate('<<ThreatLevelUpdate>>')
 
@@ -227,6 +2099,7 @@ class AppState:
     @is_running.setter
     def is_running(self, value: bool):
         self._is_running.set(value)
+        self.revision += 1
         # Broadcast running state change
         self.master.event_generate('<<SimulationStateChange>>')
 
@@ -237,6 +2110,21 @@ class AppState:
         self.threat_history.extend([0] * MAX_THREAT_HISTORY)
         self.threat_level = 0  # This setter will trigger the UI update event
 
+    def sparkline_history(self) -> list:
+        """Live samples while a simulation runs; otherwise the per-minute peaks of the long-term store."""
+        if self.is_running:
+            return list(self.threat_history)
+        peaks = [peak for _, _, peak in self.history_store.query('minute', MAX_THREAT_HISTORY)]
+        return [0] * (MAX_THREAT_HISTORY - len(peaks)) + peaks
+
+    def save_history(self, background=False):
+        if not self.recording:
+            return
+        try:
+            self.history_store.save(HISTORY_FILE, background=background)
+        except OSError as e:
+            print(f"Threat history not saved: {e}")
+
 
 # --- Utility: Simple cross-platform Sound Manager (Unchanged) ---
 class SoundManager:
@@ -287,66 +2175,1104 @@ class SoundManager:
             pass
 
 
+# --- Timer Lifecycle Registry ---
+class TimerRegistry:
+    """
+    Owns every recurring after() callback, keyed by (owner widget, loop name).
+    Rescheduling a key replaces its pending callback, so a loop can't run twice;
+    destroying the owner cancels its timers (and a destroyed owner gets no new
+    ones), and cancel_all() tears down whatever is left when the app closes.
+    """
+
+    def __init__(self):
+        self._timers = {}  # widget path -> {loop name: (widget, after id)}
+        self._hooked = set()  # Widget paths with a <Destroy> hook installed
+        self.cancelled = 0
+
+    def schedule(self, widget, name: str, delay_ms: int, callback):
+        path = str(widget)
+        self.cancel(widget, name)
+        try:
+            if not widget.winfo_exists():
+                return None
+        except tk.TclError:
+            return None  # The owner (or the whole interpreter) is gone: don't start an orphan loop
+        timers = self._timers.setdefault(path, {})
+
+        def fire():
+            owned = self._timers.get(path)
+            if owned is not None:
+                owned.pop(name, None)
+            callback()
+
+        after_id = widget.after(delay_ms, fire)
+        timers[name] = (widget, after_id)
+        if path not in self._hooked:
+            self._hooked.add(path)
+            # On a toplevel this also sees every child's <Destroy>; _on_destroy keys on event.widget
+            widget.bind('<Destroy>', self._on_destroy, add='+')
+        return after_id
+
+    def _cancel_id(self, widget, after_id):
+        try:
+            widget.after_cancel(after_id)
+        except tk.TclError:
+            pass
+        self.cancelled += 1
+
+    def cancel(self, widget, name=None) -> int:
+        """Cancels one named loop of widget, or all of its loops; returns how many were pending."""
+        timers = self._timers.get(str(widget))
+        if not timers:
+            return 0
+        names = list(timers) if name is None else [name] if name in timers else []
+        for key in names:
+            self._cancel_id(*timers.pop(key))
+        return len(names)
+
+    def pending(self, widget, name: str) -> bool:
+        return name in self._timers.get(str(widget), ())
+
+    def _on_destroy(self, event):
+        """Cancels the destroyed widget's loops and forgets its path, so a rebuilt widget starts clean."""
+        path = str(event.widget)
+        self.cancel(path)
+        self._timers.pop(path, None)
+        self._hooked.discard(path)
+
+    def cancel_all(self) -> int:
+        count = 0
+        for timers in self._timers.values():
+            for widget, after_id in timers.values():
+                self._cancel_id(widget, after_id)
+                count += 1
+            timers.clear()
+        return count
+
+    def counts(self) -> dict:
+        """Live (pending) timers per loop name."""
+        counts = {}
+        for timers in self._timers.values():
+            for name in timers:
+                counts[name] = counts.get(name, 0) + 1
+        return counts
+
+    def __len__(self):
+        return sum(len(timers) for timers in self._timers.values())
+
+
+TIMERS = TimerRegistry()
+
+
+# --- Fixed-Timestep Animation Clock ---
+class AnimationClock:
+    """
+    Shared animation time. Widgets advance their motion in fixed steps of clock time
+    and interpolate between the last two steps when drawing, so motion speed no
+    longer depends on the frame rate or on Tk firing callbacks late. `speed`
+    dilates time for every widget at once (accelerated runs).
+    """
+
+    def __init__(self, speed=1.0, time_source=time.perf_counter):
+        self.time_source = time_source
+        self.speed = speed
+        self._real = time_source()
+        self._now = 0.0
+
+    def now(self) -> float:
+        real = self.time_source()
+        self._now += (real - self._real) * self.speed
+        self._real = real
+        return self._now
+
+    def set_speed(self, speed: float):
+        self.now()  # Time so far still counts at the old speed
+        self.speed = speed
+
+    def timer(self, step: float):
+        return StepTimer(self, step)
+
+
+class StepTimer:
+    """One widget's fixed-step accumulator on the shared AnimationClock."""
+
+    def __init__(self, clock: AnimationClock, step: float, max_steps=ANIMATION_MAX_STEPS):
+        self.clock = clock
+        self.step = step
+        self.max_steps = max_steps
+        self.last = clock.now()
+        self.accumulator = 0.0
+
+    def advance(self):
+        """Returns (fixed steps to simulate now, interpolation alpha in [0, 1) for drawing)."""
+        now = self.clock.now()
+        self.accumulator += now - self.last
+        self.last = now
+        steps = int(self.accumulator / self.step)
+        limit = int(self.max_steps * max(1.0, self.clock.speed))
+        if steps > limit:
+            # Stalled or suspended: drop the backlog rather than fast-forward through it
+            self.accumulator -= (steps - limit) * self.step
+            steps = limit
+        self.accumulator -= steps * self.step
+        return steps, self.accumulator / self.step
+
+
+CLOCK = AnimationClock()
+
+
+# --- Adaptive Quality Governor ---
+class QualityGovernor:
+    """
+    Watches measured frame times via a heartbeat on the Tk event loop and steps
+    detail tiers (QUALITY_TIERS) down or up with hysteresis to hold TARGET_FPS.
+    A late heartbeat means the event loop is saturated by rendering work.
+    """
+
+    def __init__(self, master, target_fps=TARGET_FPS, tier=DEFAULT_QUALITY_TIER, adaptive=ADAPTIVE_QUALITY):
+        self.master = master
+        self.target_fps = target_fps
+        self.budget = 1.0 / target_fps
+        self.tier_index = tier
+        self.adaptive = adaptive
+        self.listeners = []
+        self.avg_frame_time = self.budget
+        self._samples = []
+        self._over_windows = 0
+        self._under_windows = 0
+        self._cooldown = QUALITY_UPGRADE_COOLDOWN
+        self._upgrade_blocked_until = 0.0
+        self._last_change_was_upgrade = False
+        self._last_tick = None
+        if self.adaptive:
+            TIMERS.schedule(self.master, 'governor', int(1000 * self.budget), self._tick)
+
+    @property
+    def tier(self) -> dict:
+        return QUALITY_TIERS[self.tier_index]
+
+    def subscribe(self, callback, immediate=True):
+        """Registers callback(tier); with immediate, applies the current tier right away."""
+        self.listeners.append(callback)
+        if immediate:
+            callback(self.tier)
+
+    def unsubscribe(self, callback):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+
+    def set_tier(self, index: int):
+        index = max(0, min(len(QUALITY_TIERS) - 1, index))
+        if index == self.tier_index:
+            return
+        self.tier_index = index
+        for callback in self.listeners:
+            try:
+                callback(self.tier)
+            except Exception as e:
+                print(f"Quality listener failed: {e}")
+
+    def _tick(self):
+        now = time.perf_counter()
+        if self._last_tick is not None:
+            self._samples.append(now - self._last_tick)
+        self._last_tick = now
+
+        if len(self._samples) >= QUALITY_WINDOW_FRAMES:
+            self.avg_frame_time = sum(self._samples) / len(self._samples)
+            self._samples.clear()
+            self._evaluate(now)
+
+        TIMERS.schedule(self.master, 'governor', int(1000 * self.budget), self._tick)
+
+    def _evaluate(self, now):
+        if self.avg_frame_time > self.budget * QUALITY_DOWNGRADE_RATIO:
+            self._over_windows += 1
+            self._under_windows = 0
+        elif self.avg_frame_time < self.budget * QUALITY_UPGRADE_RATIO:
+            self._under_windows += 1
+            self._over_windows = 0
+        else:
+            # Inside the hysteresis band: hold the current tier
+            self._over_windows = 0
+            self._under_windows = 0
+
+        if self._over_windows >= QUALITY_DOWNGRADE_WINDOWS and self.tier_index > 0:
+            # A downgrade right after an upgrade means that tier doesn't fit: back off longer before retrying
+            self._cooldown = self._cooldown * 2 if self._last_change_was_upgrade else QUALITY_UPGRADE_COOLDOWN
+            self._upgrade_blocked_until = now + self._cooldown
+            self._last_change_was_upgrade = False
+            self._over_windows = 0
+            self.set_tier(self.tier_index - 1)
+        elif (self._under_windows >= QUALITY_UPGRADE_WINDOWS and self.tier_index < len(QUALITY_TIERS) - 1
+              and now >= self._upgrade_blocked_until):
+            self._last_change_was_upgrade = True
+            self._under_windows = 0
+            self.set_tier(self.tier_index + 1)
+
+    def stop(self):
+        TIMERS.cancel(self.master, 'governor')
+
+
+# --- Per-Widget Frame Timing ---
+class FrameStats:
+    """Frame cost per widget: frame count, EWMA, last and worst-case seconds."""
+
+    def __init__(self):
+        self._stats = {}
+
+    def record(self, name: str, seconds: float):
+        entry = self._stats.get(name)
+        if entry is None:
+            entry = self._stats[name] = {'frames': 0, 'avg': seconds, 'max': 0.0, 'last': 0.0}
+        entry['frames'] += 1
+        entry['avg'] += (seconds - entry['avg']) * 0.1
+        entry['max'] = max(entry['max'], seconds)
+        entry['last'] = seconds
+
+    def snapshot(self) -> dict:
+        return {name: dict(entry) for name, entry in self._stats.items()}
+
+
+FRAME_STATS = FrameStats()
+
+
+def timed_frame(name: str):
+    """Decorator: records the wall-clock cost of each call under `name` in FRAME_STATS."""
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                FRAME_STATS.record(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+# --- Visibility- and Focus-Aware Animation Suspension ---
+class WidgetActivity:
+    """
+    Visibility state of one animated widget. Its loop asks next_delay() before
+    rescheduling: None parks the loop (widget unmapped, fully covered or window
+    minimized); throttled states stretch the delay. A parked loop is restarted
+    with a single resume() call, so it catches up in one frame.
+    """
+
+    def __init__(self, monitor, widget, resume):
+        self.monitor = monitor
+        self.widget = widget
+        self.resume = resume
+        self.viewable = False
+        self.visibility = 'VisibilityUnobscured'
+        self.parked = False
+        self.suspended_since = None
+        self.suspended_total = 0.0
+
+    @property
+    def suspended(self) -> bool:
+        return (not self.viewable or self.visibility == 'VisibilityFullyObscured'
+                or self.monitor.iconified)
+
+    @property
+    def throttled(self) -> bool:
+        return self.visibility == 'VisibilityPartiallyObscured' or not self.monitor.focused
+
+    def next_delay(self, base_ms: int):
+        """Returns the delay for the next frame, or None if the loop should park until restored."""
+        if self.suspended:
+            self.parked = True
+            return None
+        if self.throttled:
+            return base_ms * VISIBILITY_THROTTLE_FACTOR
+        return base_ms
+
+    def refresh(self):
+        try:
+            self.viewable = bool(self.widget.winfo_viewable())
+        except tk.TclError:
+            return
+        now = time.perf_counter()
+        if self.suspended:
+            if self.suspended_since is None:
+                self.suspended_since = now
+        elif self.suspended_since is not None:
+            self.suspended_total += now - self.suspended_since
+            self.suspended_since = None
+
+        if self.parked and not self.suspended:
+            self.parked = False
+            self.widget.after_idle(self.resume)
+
+    def suspended_seconds(self) -> float:
+        current = time.perf_counter() - self.suspended_since if self.suspended_since is not None else 0.0
+        return self.suspended_total + current
+
+
+class VisibilityMonitor:
+    """
+    Tracks <Map>/<Unmap>/<Visibility>/<FocusIn>/<FocusOut> for one toplevel.
+    Bindings on the toplevel see the events of every child (toplevel bindtag),
+    so one set of handlers serves all registered widgets.
+    """
+
+    def __init__(self, toplevel):
+        self.toplevel = toplevel
+        self.activities = {}
+        self.iconified = False
+        self.focused = True
+        self.on_restore = None  # Optional callback(seconds_suspended) when the window comes back
+        self._iconified_since = None
+        toplevel.bind('<Map>', self._on_map_change, add='+')
+        toplevel.bind('<Unmap>', self._on_map_change, add='+')
+        toplevel.bind('<Visibility>', self._on_visibility, add='+')
+        toplevel.bind('<FocusIn>', self._on_focus_change, add='+')
+        toplevel.bind('<FocusOut>', self._on_focus_change, add='+')
+        toplevel.bind('<Destroy>', self._on_destroy, add='+')
+
+    def register(self, widget, resume) -> WidgetActivity:
+        activity = WidgetActivity(self, widget, resume)
+        self.activities[str(widget)] = activity
+        activity.refresh()
+        return activity
+
+    def _refresh_all(self):
+        for activity in list(self.activities.values()):
+            activity.refresh()
+
+    def _on_map_change(self, event):
+        if event.widget is self.toplevel:
+            iconified = event.type == tk.EventType.Unmap
+            if iconified and self._iconified_since is None:
+                self._iconified_since = time.perf_counter()
+            elif not iconified and self._iconified_since is not None:
+                away = time.perf_counter() - self._iconified_since
+                self._iconified_since = None
+                if self.on_restore:
+                    self.on_restore(away)
+            self.iconified = iconified
+        # Unmapping a parent doesn't send <Unmap> to its children: recheck viewability of everything
+        self._refresh_all()
+
+    def _on_visibility(self, event):
+        activity = self.activities.get(str(event.widget))
+        if activity is not None:
+            activity.visibility = str(event.state)
+            activity.refresh()
+
+    def _on_focus_change(self, event):
+        # Focus moving between our own widgets also fires FocusOut; check app focus once things settle
+        self.toplevel.after_idle(self._check_focus)
+
+    def _check_focus(self):
+        try:
+            self.focused = self.toplevel.focus_displayof() is not None
+        except (tk.TclError, KeyError):
+            self.focused = False
+        self._refresh_all()
+
+    def _on_destroy(self, event):
+        self.activities.pop(str(event.widget), None)
+
+    def suspended_seconds(self) -> float:
+        """Total animation time saved across all tracked widgets."""
+        return sum(a.suspended_seconds() for a in self.activities.values())
+
+
+class ResizeDebouncer:
+    """
+    Coalesces a burst of <Configure> events (e.g. while a window is dragged) into a
+    single callback(old_size, new_size) once the size has settled. Configure events
+    that don't change the size (moves, restacking) never reach the callback.
+    old_size is None on the first layout.
+    """
+
+    def __init__(self, widget, callback, delay_ms=RESIZE_DEBOUNCE_MS):
+        self.widget = widget
+        self.callback = callback
+        self.delay_ms = delay_ms
+        self.size = None
+        self._pending = None
+        widget.bind('<Configure>', self._on_configure, add='+')
+
+    def _on_configure(self, event):
+        self._pending = (event.width, event.height)
+        TIMERS.schedule(self.widget, 'resize', self.delay_ms, self._fire)  # Replaces the pending one
+
+    def _fire(self):
+        if self._pending == self.size:
+            return
+        old_size, self.size = self.size, self._pending
+        self.callback(old_size, self.size)
+
+
+def track_visibility(widget, resume) -> WidgetActivity:
+    """Registers widget with its toplevel's VisibilityMonitor (created on first use)."""
+    toplevel = widget.winfo_toplevel()
+    monitor = getattr(toplevel, '_visibility_monitor', None)
+    if monitor is None:
+        monitor = VisibilityMonitor(toplevel)
+        toplevel._visibility_monitor = monitor
+    return monitor.register(widget, resume)
+
+
+# --- Render Kernels (pure per-frame math) and the Process-Isolated Renderer ---
+def threat_gradient_color(ratio: float) -> str:
+    """Globe palette: blue to orange up to 70% threat, then orange to purple."""
+    if ratio < 0.7:
+        return lerp_color(COLOR_NEON_BLUE, COLOR_NEON_ORANGE, ratio / 0.7)
+    transition_ratio = (ratio - 0.7) / 0.3 if ratio < 1.0 else 1.0
+    return lerp_color(COLOR_NEON_ORANGE, COLOR_NEON_PURPLE, transition_ratio)
+
+
+def project_point(x, y, z, radius, tilt=0.6):
+    """Simple perspective projection onto the globe canvas."""
+    factor = 1 / (1 + (z * 0.5))
+    return x * radius * factor, y * radius * factor * tilt, factor
+
+
+def globe_kernel(config, params, rng):
+    """
+    One globe frame without touching Tk. Returns (point rows, connection rows) as flat
+    float lists. Point rows follow config['lod_indices'] as x1, y1, x2, y2, side, color
+    (side 0 front, 1 back, 2 back and not refreshed this frame; color packed RGB or -1).
+    Connection rows are x1, y1, x2, y2, color.
+    """
+    points = config['points']
+    rotation, level, active, radius, cx, cy, glitch_phase, max_connections = params
+    ratio = level / 100.0
+    cos_r = math.cos(rotation)
+    sin_r = math.sin(rotation)
+    glitch_intensity = ratio if level > 30 else 0
+    base_color = threat_gradient_color(ratio)
+    r_base, g_base, b_base = hex_to_rgb(base_color)
+    high_level = level >= THREAT_COLOR_MAP['HIGH']['level']
+    divisor = config.get('back_divisor', GLOBE_BACK_REFRESH_DIVISOR)
+    back_slot = glitch_phase % divisor
+
+    # One bulk draw per frame: five uniforms per point (spike test, spike size, jitter test, jitter x, jitter y)
+    draws = rng.take(len(points) * 5)
+    rows = []
+    for n, idx in enumerate(config['lod_indices']):
+        x0, y0, z0 = points[idx]
+        d = idx * 5
+        # 1. Rotation and hemisphere test (positive z is the far side)
+        x = x0 * cos_r + z0 * sin_r
+        z = -x0 * sin_r + z0 * cos_r
+        back = z > GLOBE_BACKFACE_Z
+        if back and n % divisor != back_slot:
+            rows.extend((0.0, 0.0, 0.0, 0.0, 2, -1))
+            continue
+
+        # 2. Data Spike/Glow Effect
+        current_radius = radius
+        if active and draws[d] < (0.01 + glitch_intensity * 0.08):
+            current_radius = radius * (1.0 + (0.1 + 0.3 * draws[d + 1]) * glitch_intensity)
+
+        # 3. Projection & Sizing, with visual glitch displacement on critical levels
+        sx, sy, f = project_point(x, y0, z, current_radius)
+        if high_level and draws[d + 2] < 0.2:
+            sx += int(draws[d + 3] * 9) - 4
+            sy += int(draws[d + 4] * 9) - 4
+        screen_x = cx + sx
+        screen_y = cy + sy
+        size = max(1, int(3 * f * (1 + glitch_intensity * 0.5)))
+        if back:
+            rows.extend((screen_x - size, screen_y - size, screen_x + size, screen_y + size, 1, -1))
+            continue
+
+        # 4. Coloring (front only): depth brightness (f) and critical pulse
+        brightness_mod = 0.5 + 0.5 * f
+        pulse_mod = 0.8 + 0.3 * math.sin(glitch_phase * 0.5 + idx) if high_level else 1.0
+        rows.extend((screen_x - size, screen_y - size, screen_x + size, screen_y + size, 0,
+                     pack_rgb(r_base * brightness_mod * pulse_mod, g_base * brightness_mod * pulse_mod,
+                              b_base * brightness_mod * pulse_mod)))
+
+    # --- Dynamic connections (Aura) along the precomputed neighbor graph ---
+    conns = []
+    if ratio >= 0.05:
+        r, g, b = r_base, g_base, b_base
+        brightness_boost = 1.3
+        pulse_factor = 0.5 + 0.5 * math.sin(glitch_phase * 0.1) * ratio
+        max_dist = 60 - (glitch_intensity * 30)
+        max_draw = max_connections * (ratio * 0.8 + 0.2)
+
+        # Each endpoint is projected once per frame
+        screen = {}
+        for idx in config['edge_nodes']:
+            x0, y0, z0 = points[idx]
+            sx, sy, f = project_point(x0 * cos_r + z0 * sin_r, y0, -x0 * sin_r + z0 * cos_r, radius)
+            screen[idx] = (cx + sx, cy + sy)
+
+        drawn = 0
+        for i, j in config['edges']:
+            if drawn >= max_draw:
+                break
+            screen_x1, screen_y1 = screen[i]
+            screen_x2, screen_y2 = screen[j]
+            dist = math.hypot(screen_x1 - screen_x2, screen_y1 - screen_y2)
+            if dist >= max_dist:
+                continue
+            opacity = 1 - (dist / max_dist)
+            final_opacity = max(0.1, min(1.0, opacity * pulse_factor)) * brightness_boost
+            conns.extend((screen_x1, screen_y1, screen_x2, screen_y2,
+                          pack_rgb(r * final_opacity, g * final_opacity, b * final_opacity)))
+            drawn += 1
+    return rows, conns
+
+
+def background_kernel(config, params, rng):
+    """Particle connection lines for one background frame: ([], rows of x1, y1, x2, y2, color)."""
+    positions, max_conns = params
+    conns = []
+    count = 0
+    n = len(positions) // 2
+    for i in range(n):
+        x1, y1 = positions[2 * i], positions[2 * i + 1]
+        for j in range(i + 1, n):
+            if count >= max_conns:
+                break
+            x2, y2 = positions[2 * j], positions[2 * j + 1]
+            dist = math.hypot(x1 - x2, y1 - y2)
+            if dist < 100:
+                opacity = int(255 * (1 - dist / 100))
+                # Blueish hue
+                conns.extend((x1, y1, x2, y2, pack_rgb(opacity, opacity * 0.7, 255)))
+                count += 1
+        if count >= max_conns:
+            break
+    return [], conns
+
+
+RENDER_KERNELS = {'globe': globe_kernel, 'background': background_kernel}
+# Floats per shared-memory slot: enough for the most detailed quality tier
+RENDER_CAPACITY = {
+    'globe': max(t['globe_points'] * 6 + t['globe_connections'] * 5 for t in QUALITY_TIERS),
+    'background': max(int(t['particles'] * 1.8) + 1 for t in QUALITY_TIERS) * 5,
+}
+RENDER_SEQ = struct.Struct('<Q')  # Newest published frame number, at offset 0
+RENDER_SLOT = struct.Struct('<QIII4x')  # Per slot: frame number (0 while being written), config version, row counts
+
+
+class RenderWorker:
+    """
+    Runs one widget's render kernel in a separate process, so its math doesn't
+    compete with Tk for the GIL. Frame parameters go down a pipe; finished rows
+    come back through a shared-memory double buffer. The worker writes the slot the
+    reader isn't on (zeroing its frame number first) and publishes the number last;
+    the reader re-checks the slot's number after copying and drops torn reads.
+    """
+
+    def __init__(self, kind: str, capacity=None):
+        self.kind = kind
+        self.slot_size = RENDER_SLOT.size + 8 * (capacity or RENDER_CAPACITY[kind])
+        self.shm = shared_memory.SharedMemory(create=True, size=RENDER_SEQ.size + 2 * self.slot_size)
+        self.shm.buf[:RENDER_SEQ.size] = bytes(RENDER_SEQ.size)
+        ctx = multiprocessing.get_context('spawn')  # Never fork a process that is running Tk
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_render_worker_main, name=f'render-{kind}', daemon=True,
+                                   args=(kind, self.shm.name, child_conn, self.slot_size, RNG.seed))
+        self.version = 0
+        self.consumed = 0
+        self.torn = 0
+
+    def start(self):
+        self.process.start()
+        return self
+
+    @property
+    def alive(self) -> bool:
+        return self.process.is_alive()
+
+    def configure(self, config):
+        """Sends the widget's static data (point set, LOD, graph); older in-flight frames are discarded."""
+        self.version += 1
+        self.conn.send(('config', self.version, config))
+
+    def exchange(self, params):
+        """Submits this frame's parameters and returns the newest finished (rows, conns), or None."""
+        try:
+            self.conn.send(('frame', params))
+        except (BrokenPipeError, OSError):
+            return None
+        return self.latest()
+
+    def latest(self):
+        buf = self.shm.buf
+        seq = RENDER_SEQ.unpack_from(buf, 0)[0]
+        if seq == self.consumed:
+            return None
+        offset = RENDER_SEQ.size + (seq % 2) * self.slot_size
+        slot_seq, version, count_a, count_b = RENDER_SLOT.unpack_from(buf, offset)
+        start = offset + RENDER_SLOT.size
+        with buf[start:start + 8 * (count_a + count_b)] as raw, raw.cast('d') as view:
+            values = view.tolist()
+        if slot_seq != seq or RENDER_SLOT.unpack_from(buf, offset)[0] != seq:
+            self.torn += 1  # The worker lapped us mid-copy; the next frame is already on its way
+            return None
+        self.consumed = seq
+        if version != self.version:
+            return None
+        return values[:count_a], values[count_a:]
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=2)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout=2)
+        self.conn.close()
+        self.shm.close()
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _render_worker_main(kind, shm_name, conn, slot_size, seed):
+    """RenderWorker process: compute the newest requested frame, publish it, repeat."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    kernel = RENDER_KERNELS[kind]
+    rng = RandomStreams(seed).stream(kind)
+    capacity = (slot_size - RENDER_SLOT.size) // 8
+    config, version, seq = None, 0, 0
+    try:
+        while True:
+            message = conn.recv()
+            params = None
+            while True:
+                if message is None:
+                    return
+                if message[0] == 'config':
+                    _, version, config = message
+                    params = None
+                else:
+                    params = message[1]
+                if not conn.poll():
+                    break
+                message = conn.recv()  # Behind: only the newest frame request is worth computing
+            if params is None or config is None:
+                continue
+            rows, conns = kernel(config, params, rng)
+            if len(rows) + len(conns) > capacity:
+                continue
+            seq += 1
+            offset = RENDER_SEQ.size + (seq % 2) * slot_size
+            start = offset + RENDER_SLOT.size
+            RENDER_SLOT.pack_into(shm.buf, offset, 0, version, len(rows), len(conns))
+            with shm.buf[start:start + 8 * (len(rows) + len(conns))] as raw, raw.cast('d') as view:
+                view[:] = array('d', rows + conns)
+            RENDER_SLOT.pack_into(shm.buf, offset, seq, version, len(rows), len(conns))
+            RENDER_SEQ.pack_into(shm.buf, 0, seq)
+    except (EOFError, OSError, KeyboardInterrupt):
+        pass
+    finally:
+        shm.close()
+
+
+# --- Raster Backend (NumPy frame buffer pushed to one PhotoImage per frame) ---
+def unpack_rgb(colors):
+    """Packed RGB ints (as floats or ints) to an (n, 3) uint8 array."""
+    packed = np.asarray(colors, dtype=np.int64)
+    return np.stack(((packed >> 16) & 255, (packed >> 8) & 255, packed & 255), axis=-1).astype(np.uint8)
+
+
+@functools.lru_cache(maxsize=None)
+def raster_stamp(radius: int, ring: bool = False):
+    """Pixel offsets of a filled disc; with ring, also the particle sprite's outer ring at 2*radius."""
+    outer = radius * 2 if ring else radius
+    dy, dx = np.mgrid[-outer:outer + 1, -outer:outer + 1]
+    dist = np.hypot(dx, dy)
+    inside = dist <= radius
+    if ring:
+        inside |= (dist >= outer - 1) & (dist <= outer)
+    return dx[inside], dy[inside]
+
+
+class FrameBuffer:
+    """An (height, width, 3) uint8 NumPy image with vectorized drawing primitives; may be a view into a larger one."""
+
+    def __init__(self, frame=None):
+        self.frame = frame
+
+    @classmethod
+    def blank(cls, width: int, height: int, background: str):
+        frame = np.empty((height, width, 3), dtype=np.uint8)
+        frame[:] = hex_to_rgb(background)
+        return cls(frame)
+
+    def region(self, x: int, y: int, width: int, height: int):
+        """A FrameBuffer drawing straight into a sub-rectangle of this one."""
+        return FrameBuffer(self.frame[y:y + height, x:x + width])
+
+    def _plot(self, xs, ys, rgb):
+        height, width = self.frame.shape[:2]
+        inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        self.frame[ys[inside], xs[inside]] = rgb[inside]
+
+    def lines(self, conns):
+        """1px segments from flat rows of x1, y1, x2, y2, packed color; sampled once per pixel of length."""
+        rows = np.asarray(conns, dtype=np.float64).reshape(-1, 5)
+        if not len(rows):
+            return
+        x1, y1, x2, y2 = rows[:, 0], rows[:, 1], rows[:, 2], rows[:, 3]
+        steps = np.maximum(np.abs(x2 - x1), np.abs(y2 - y1)).astype(np.int64) + 1
+        owner = np.repeat(np.arange(len(rows)), steps)
+        t = (np.arange(len(owner)) - np.repeat(np.cumsum(steps) - steps, steps)) / np.maximum(steps - 1, 1)[owner]
+        xs = np.rint(x1[owner] + (x2 - x1)[owner] * t).astype(np.int64)
+        ys = np.rint(y1[owner] + (y2 - y1)[owner] * t).astype(np.int64)
+        self._plot(xs, ys, unpack_rgb(rows[:, 4])[owner])
+
+    def discs(self, cx, cy, radii, rgb, ring=False):
+        """Filled discs (particle sprites with ring); smaller radii first, input order within a radius."""
+        cx = np.rint(np.asarray(cx)).astype(np.int64)
+        cy = np.rint(np.asarray(cy)).astype(np.int64)
+        radii = np.asarray(radii, dtype=np.int64)
+        rgb = np.broadcast_to(np.asarray(rgb, dtype=np.uint8), (len(cx), 3))
+        for radius in np.unique(radii):
+            sel = radii == radius
+            dx, dy = raster_stamp(int(radius), ring)
+            xs = (cx[sel, None] + dx).ravel()
+            ys = (cy[sel, None] + dy).ravel()
+            self._plot(xs, ys, np.repeat(rgb[sel], len(dx), axis=0))
+
+    def rect(self, x1, y1, x2, y2, rgb):
+        """Filled rectangle covering [x1, x2) x [y1, y2), clipped to the frame."""
+        height, width = self.frame.shape[:2]
+        x1, x2 = max(0, round(x1)), min(width, round(x2))
+        y1, y2 = max(0, round(y1)), min(height, round(y2))
+        if x1 < x2 and y1 < y2:
+            self.frame[y1:y2, x1:x2] = rgb
+
+    def outline(self, x1, y1, x2, y2, rgb):
+        """1px rectangle outline with inclusive corners, like _put_rect_outline."""
+        self.rect(x1, y1, x2 + 1, y1 + 1, rgb)
+        self.rect(x1, y2, x2 + 1, y2 + 1, rgb)
+        self.rect(x1, y1, x1 + 1, y2 + 1, rgb)
+        self.rect(x2, y1, x2 + 1, y2 + 1, rgb)
+
+
+class RasterLayer(FrameBuffer):
+    """
+    Draws a widget's many small shapes into a NumPy frame buffer and shows it as a
+    single canvas image, so a frame costs one PhotoImage update instead of one Tcl
+    call per item. Static decoration (grid, fill) lives in a base frame that is only
+    rebuilt on resize; each frame starts from a copy of it.
+    """
+
+    def __init__(self, canvas: tk.Canvas, background: str, decorate=None):
+        super().__init__()
+        self.canvas = canvas
+        self.background = hex_to_rgb(background)
+        self.decorate = decorate  # decorate(base) paints static content into a fresh base frame
+        self.size = None
+        self.base = None
+        self.photo = None
+        self.item = canvas.create_image(0, 0, anchor='nw', tags='raster')
+        self.frames = 0
+
+    def begin(self):
+        """Starts a frame from the static base, rebuilding base and image when the canvas size changed."""
+        size = (max(1, self.canvas.winfo_width()), max(1, self.canvas.winfo_height()))
+        if size != self.size:
+            self.size = size
+            self.base = np.empty((size[1], size[0], 3), dtype=np.uint8)
+            self.base[:] = self.background
+            if self.decorate is not None:
+                self.decorate(self.base)
+            self.photo = ImageTk.PhotoImage('RGB', size, master=self.canvas)
+            self.canvas.itemconfig(self.item, image=self.photo)
+        self.frame = self.base.copy()
+        return self.frame
+
+    def commit(self):
+        """Pushes the finished frame to the canvas image in one bulk update."""
+        self.photo.paste(Image.fromarray(self.frame, 'RGB'))
+        self.frames += 1
+
+
+def raster_available() -> bool:
+    return np is not None and Image is not None and ImageTk is not None
+
+
+def raster_globe(buffer: FrameBuffer, ratio, rows, conns):
+    """Composites globe_kernel output: dim back points, links, then front points small-to-large."""
+    points = np.asarray(rows, dtype=np.float64).reshape(-1, 6)
+    cx = (points[:, 0] + points[:, 2]) / 2
+    cy = (points[:, 1] + points[:, 3]) / 2
+    radii = np.rint((points[:, 2] - points[:, 0]) / 2)
+    back = points[:, 4] > 0
+    dim = hex_to_rgb(lerp_color(COLOR_BG_PANEL, threat_gradient_color(ratio), GLOBE_BACK_DIM))
+    buffer.discs(cx[back], cy[back], radii[back], dim)
+    buffer.lines(conns)
+    front = ~back
+    # Size grows with nearness, so ascending radius stacks front points far-to-near
+    buffer.discs(cx[front], cy[front], radii[front], unpack_rgb(points[front, 5]))
+
+
+def raster_meter(buffer: FrameBuffer, level, history, rng):
+    """
+    The shapes of draw_threat_meter, Tk-free and with the same RNG draws. Text needs a
+    font renderer, so the caller draws it; returns (glitch_offset, text_fill) for that.
+    """
+    height, width = buffer.frame.shape[:2]
+    color = get_threat_color(level)
+    fill_width = (level / 100) * (width - 24)
+    glitch_offset = 0
+    text_fill = COLOR_TEXT_LIGHT
+    if level > 50 and rng.random() < 0.15:
+        glitch_offset = rng.randint(-3, 3)
+        if rng.random() < 0.4:
+            text_fill = COLOR_NEON_PURPLE
+    bar_y1 = 24
+    bar_y2 = height - 24
+    buffer.rect(12, bar_y1, width - 12, bar_y2, hex_to_rgb(COLOR_METER_SHELL))
+
+    # Outer glow, layered like render_meter_glow_sprite
+    x1, y1 = 12 - 3 + glitch_offset, bar_y1 - 3
+    x2, y2 = x1 + int(fill_width) + 6, y1 + int(bar_y2 - bar_y1) + 6
+    base_rgb = hex_to_rgb(color)
+    for i in range(3, 0, -1):
+        r, g, b = [c + (255 - c) * 0.1 * i for c in base_rgb]
+        inset = 3 - i
+        buffer.outline(x1 + inset, y1 + inset, x2 - inset, y2 - inset,
+                       hex_to_rgb(lerp_color(COLOR_BG_PANEL, rgb_to_hex(r, g, b), 0.8 / i)))
+
+    segments = 16
+    seg_width = fill_width / segments
+    for i in range(segments):
+        seg_x = 12 + (i * seg_width) + glitch_offset
+        if seg_x < 12 + fill_width:
+            buffer.rect(seg_x, bar_y1, min(seg_x + seg_width, 12 + fill_width), bar_y2,
+                        hex_to_rgb(lerp_color(COLOR_BG_PANEL, color, 0.4 + 0.6 * (i / segments))))
+
+    if len(history) > 1:
+        max_h = bar_y2 - bar_y1
+        xs = [12 + (i / MAX_THREAT_HISTORY) * (width - 24) for i in range(len(history))]
+        ys = [bar_y2 - (hist_level / 100) * max_h for hist_level in history]
+        green = int(COLOR_NEON_GREEN[1:], 16)
+        buffer.lines([v for i in range(len(xs) - 1) for v in (xs[i], ys[i], xs[i + 1], ys[i + 1], green)])
+        buffer.discs([xs[-1]], [ys[-1]], [3], base_rgb)
+    return glitch_offset, text_fill
+
+
+# --- Compact Particle System (one array('d') column per field) ---
+class ParticleSystem:
+    """
+    Structure-of-arrays particle store for the background, traceroute packets and
+    other effects: each field is a contiguous array('d') column (8 bytes per value,
+    no per-particle dict), read as `ps.x[i]`. step() integrates and bounces every
+    particle in one batch, on NumPy views of the same buffers when NumPy is present.
+    """
+
+    def __init__(self, fields=('x', 'y', 'vx', 'vy')):
+        self.fields = tuple(fields)
+        for name in self.fields:
+            setattr(self, name, array('d'))
+        self.prev_x = self.prev_y = None  # Positions before the last fixed step, see remember()
+
+    def __len__(self) -> int:
+        return len(getattr(self, self.fields[0]))
+
+    def add(self, **values) -> int:
+        """Appends one particle (missing fields are 0.0) and returns its index."""
+        for name in self.fields:
+            getattr(self, name).append(values.get(name, 0.0))
+        if self.prev_x is not None:
+            self.prev_x.append(values.get('x', 0.0))
+            self.prev_y.append(values.get('y', 0.0))
+        return len(self) - 1
+
+    def truncate(self, count: int):
+        for name in self.fields:
+            del getattr(self, name)[count:]
+        if self.prev_x is not None:
+            del self.prev_x[count:], self.prev_y[count:]
+
+    def retain(self, keep):
+        """Keeps the particles whose flag in `keep` is true, preserving order."""
+        keep = list(keep)
+        names = self.fields if self.prev_x is None else self.fields + ('prev_x', 'prev_y')
+        for name in names:
+            setattr(self, name, array('d', itertools.compress(getattr(self, name), keep)))
+
+    def clear(self):
+        self.truncate(0)
+
+    def _views(self, *names):
+        # Zero-copy float64 views; callers must drop them before the columns are resized
+        return [np.frombuffer(getattr(self, name), dtype=np.float64) for name in names]
+
+    def step(self, width=None, height=None, dt=1.0):
+        """x += vx * dt (and y); velocities flip where a particle reaches or leaves [0, width] x [0, height]."""
+        if not len(self):
+            return
+        if np is not None:
+            x, y, vx, vy = self._views('x', 'y', 'vx', 'vy')
+            if dt == 1.0:
+                x += vx
+                y += vy
+            else:
+                x += vx * dt
+                y += vy * dt
+            if width is not None:
+                vx[(x <= 0) | (x >= width)] *= -1
+            if height is not None:
+                vy[(y <= 0) | (y >= height)] *= -1
+            return
+        for pos, vel, limit in ((self.x, self.vx, width), (self.y, self.vy, height)):
+            # Column-at-a-time comprehensions: far fewer bytecodes than indexing per particle
+            if dt == 1.0:
+                pos[:] = array('d', [p + v for p, v in zip(pos, vel)])
+            else:
+                pos[:] = array('d', [p + v * dt for p, v in zip(pos, vel)])
+            if limit is not None:
+                vel[:] = array('d', [-v if p <= 0 or p >= limit else v for p, v in zip(pos, vel)])
+
+    def scale(self, factor: float, *names):
+        """Multiplies the named columns in place, e.g. positions on resize."""
+        for name in names:
+            if np is not None:
+                view, = self._views(name)
+                view *= factor
+                del view
+            else:
+                column = getattr(self, name)
+                for i in range(len(column)):
+                    column[i] *= factor
+
+    def remember(self):
+        """Snapshots positions before a frame's last fixed step, so lerp() can draw between the two."""
+        self.prev_x = array('d', self.x)
+        self.prev_y = array('d', self.y)
+
+    def lerp(self, alpha: float):
+        """Positions `alpha` of the way from the snapshot to the current step (current if the pool changed)."""
+        if self.prev_x is None or len(self.prev_x) != len(self):
+            return self.x, self.y
+        if np is not None:
+            (x, y), (px, py) = self._views('x', 'y'), self._views('prev_x', 'prev_y')
+            return (px + (x - px) * alpha).tolist(), (py + (y - py) * alpha).tolist()
+        return ([p + (c - p) * alpha for p, c in zip(self.prev_x, self.x)],
+                [p + (c - p) * alpha for p, c in zip(self.prev_y, self.y)])
+
+    def positions(self, xs=None, ys=None) -> list:
+        """Flat [x0, y0, x1, y1, ...] list, the layout the render kernels take."""
+        flat = [0.0] * (2 * len(self))
+        flat[0::2] = self.x if xs is None else xs
+        flat[1::2] = self.y if ys is None else ys
+        return flat
+
+
 # --- Optimized Animated Background (Unchanged) ---
 class AnimatedBackground(tk.Canvas):
     """Optimized animated grid background with particle physics."""
 
     def __init__(self, parent, particle_count=DEFAULT_PARTICLE_COUNT, fps=30, **kwargs):
         super().__init__(parent, **kwargs)
-        self.particles = []
+        self.particles = ParticleSystem(('x', 'y', 'vx', 'vy', 'size'))
         self.particle_items = []
+        self.particle_sprites = []
         self.connection_items = []
         self.grid_items = []
         self.animation_running = True
         self.particle_count = particle_count
         self.fps = fps
         self.frame_delay = int(1000 / self.fps)
+        self.rng = RNG.stream('background')
+        self.renderer = None  # RenderWorker when connection math runs out of process
+        self.raster = None  # RasterLayer when particles, links and grid are drawn into one image
+        self._raster_conns = []
+        self.clock = CLOCK.timer(1.0 / fps)  # Velocities are per step of the nominal frame rate
 
-        width = 1200
-        height = 800
         # Initialize particles and pre-create canvas items (optimization)
-        for _ in range(self.particle_count):
-            p = {
-                'x': random.uniform(0, width),
-                'y': random.uniform(0, height),
-                'vx': random.uniform(-0.5, 0.5),
-                'vy': random.uniform(-0.5, 0.5),
-                'size': random.randint(1, 3)
-            }
-            self.particles.append(p)
-            outer = self.create_oval(0, 0, 0, 0, outline=COLOR_NEON_BLUE, width=1, tags='particle')
-            core = self.create_oval(0, 0, 0, 0, fill=COLOR_NEON_BLUE, outline='', tags='particle')
-            self.particle_items.append((outer, core))
-
-        self.bind('<Configure>', self.on_resize)
-        self.draw_grid()
-        self._animate_id = None
-        self.animate()
+        self.set_particle_count(self.particle_count)
 
-    def on_resize(self, event=None):
+        self.grid_v_items = []
+        self.grid_h_items = []
+        self.resizer = ResizeDebouncer(self, self.on_resize)
         self.draw_grid()
+        self.activity = track_visibility(self, self.animate)
+        self.animate()
 
-    def draw_grid(self):
-        # reuse grid items by clearing and redrawing only when size changes
-        for gid in self.grid_items:
-            try:
-                self.delete(gid)
-            except Exception:
-                pass
-        self.grid_items.clear()
-
-        width = self.winfo_width() or 1200
-        height = self.winfo_height() or 800
-        step = 60
-        for x in range(0, width, step):
-            color = random.choice(['#0a0a1a', '#151525', '#1a1a2e'])
-            gid = self.create_line(x, 0, x, height, fill=color, width=1, tags='grid')
-            self.grid_items.append(gid)
-        for y in range(0, height, step):
-            color = random.choice(['#0a0a1a', '#151525', '#1a1a2e'])
-            gid = self.create_line(0, y, width, y, fill=color, width=1, tags='grid')
-            self.grid_items.append(gid)
-
+    def set_particle_count(self, count: int):
+        """Grows or shrinks the particle pool, creating/deleting only the difference."""
+        width = self.winfo_width() if self.winfo_width() > 1 else 1200
+        height = self.winfo_height() if self.winfo_height() > 1 else 800
+        particles = self.particles
+        while len(particles) < count:
+            x = self.rng.uniform(0, width)
+            y = self.rng.uniform(0, height)
+            vx = self.rng.uniform(-0.5, 0.5)
+            vy = self.rng.uniform(-0.5, 0.5)
+            size = self.rng.randint(1, 3)
+            particles.add(x=x, y=y, vx=vx, vy=vy, size=size)
+            # One pre-rendered "outer + core" sprite per particle instead of two ovals
+            sprite = SPRITES.get(('particle', size, COLOR_NEON_BLUE),
+                                 lambda s=size: render_particle_sprite(self, s, COLOR_NEON_BLUE))
+            self.particle_sprites.append(sprite)  # Keep a reference so LRU eviction can't blank the item
+            self.particle_items.append(self.create_image(x, y, image=sprite, tags='particle',
+                                                         state='normal' if self.raster is None else 'hidden'))
+        if len(particles) > count:
+            particles.truncate(count)
+            del self.particle_sprites[count:]
+            while len(self.particle_items) > count:
+                self.delete(self.particle_items.pop())
+        self.particle_count = count
+
+    def apply_quality(self, tier: dict):
+        """QualityGovernor listener: particle budget and frame rate follow the detail tier."""
+        self.set_particle_count(tier['particles'])
+        self.frame_delay = int(1000 / (self.fps * tier['fps_scale']))
+
+    def on_resize(self, old_size, new_size):
+        width, height = new_size
+        if old_size is not None:
+            # Rescale particles into the new area instead of respawning them
+            sx = width / max(1, old_size[0])
+            sy = height / max(1, old_size[1])
+            self.particles.scale(sx, 'x')
+            self.particles.scale(sy, 'y')
+            self.particles.remember()  # Don't interpolate across the rescale
+            if self.raster is None:
+                self._place_particles()
+        self.draw_grid(width, height)
+
+    def _place_particles(self, xs=None, ys=None):
+        if xs is None:
+            xs, ys = self.particles.x, self.particles.y
+        for idx, item in enumerate(self.particle_items):
+            self.coords(item, xs[idx], ys[idx])
+
+    def _layout_grid_lines(self, items, count, make_coords):
+        """Moves existing lines, creating or deleting only the difference. Lines keep their color."""
+        for idx in range(count):
+            coords = make_coords(idx * GRID_STEP)
+            if idx < len(items):
+                self.coords(items[idx], *coords)
+            else:
+                items.append(self.create_line(*coords, fill=self.rng.choice(GRID_COLORS), width=1, tags='grid'))
+        while len(items) > count:
+            self.delete(items.pop())
+
+    def draw_grid(self, width=None, height=None):
+        width = width or self.winfo_width() or 1200
+        height = height or self.winfo_height() or 800
+        self._layout_grid_lines(self.grid_v_items, len(range(0, width, GRID_STEP)),
+                                lambda x: (x, 0, x, height))
+        self._layout_grid_lines(self.grid_h_items, len(range(0, height, GRID_STEP)),
+                                lambda y: (0, y, width, y))
+        self.grid_items = self.grid_v_items + self.grid_h_items
+        self.tag_lower('grid')
+
+    @timed_frame('background')
     def animate(self):
         if not self.animation_running:
             return
@@ -354,102 +3280,247 @@ class AnimatedBackground(tk.Canvas):
         width = self.winfo_width() or 1200
         height = self.winfo_height() or 800
 
-        # Update particle positions and reuse canvas items
-        for idx, p in enumerate(self.particles):
-            p['x'] += p['vx']
-            p['y'] += p['vy']
-            if p['x'] <= 0 or p['x'] >= width:
-                p['vx'] *= -1
-            if p['y'] <= 0 or p['y'] >= height:
-                p['vy'] *= -1
-
-            outer_id, core_id = self.particle_items[idx]
-            x, y, s = p['x'], p['y'], p['size']
-            self.coords(outer_id, x - s * 2, y - s * 2, x + s * 2, y + s * 2)
-            self.coords(core_id, x - s, y - s, x + s, y + s)
-
-        # Remove old connection lines then draw new ones selectively
+        # Advance the physics by the fixed steps due, then draw between the last two (reusing canvas items)
+        particles = self.particles
+        steps, alpha = self.clock.advance()
+        for n in range(steps):
+            if n == steps - 1:
+                particles.remember()
+            particles.step(width, height)
+        xs, ys = particles.lerp(alpha)
+        if self.raster is None:
+            self._place_particles(xs, ys)
+
+        # Draw connections but cap number for perf
+        params = (particles.positions(xs, ys), int(self.particle_count * 1.8))
+        if self.renderer is None:
+            frame = background_kernel(None, params, self.rng)
+        else:
+            frame = self.renderer.exchange(params)
+            if frame is None and not self.renderer.alive:
+                self.renderer = None  # Worker died: fall back to in-process math next frame
+        if self.raster is not None:
+            if frame is not None:
+                self._raster_conns = frame[1]
+            self.render_raster(self._raster_conns, xs, ys)  # Particles move every frame, links when a frame arrives
+        elif frame is not None:
+            self.apply_connections(frame[1])
+
+        delay = self.activity.next_delay(self.frame_delay)
+        if delay is not None:
+            TIMERS.schedule(self, 'background', delay, self.animate)
+
+    def apply_connections(self, conns):
+        """Remove old connection lines then draw the new ones."""
         for cid in self.connection_items:
             try:
                 self.delete(cid)
             except Exception:
                 pass
         self.connection_items.clear()
-
-        # Draw connections but cap number for perf
-        max_conns = int(self.particle_count * 1.8)
-        conns = 0
-        for i, p1 in enumerate(self.particles):
-            for p2 in self.particles[i + 1:]:
-                if conns >= max_conns:
-                    break
-                dx = p1['x'] - p2['x']
-                dy = p1['y'] - p2['y']
-                dist = math.hypot(dx, dy)
-                if dist < 100:
-                    opacity = int(255 * (1 - dist / 100))
-                    g = int(opacity * 0.7)
-                    opacity = max(0, min(255, opacity))
-                    g = max(0, min(255, g))
-                    # Blueish hue
-                    color = f'#{opacity:02x}{g:02x}ff'
-                    cid = self.create_line(p1['x'], p1['y'], p2['x'], p2['y'], fill=color, width=1,
-                                           tags='particle_conn')
-                    self.connection_items.append(cid)
-                    conns += 1
-            if conns >= max_conns:
-                break
-
-        self._animate_id = self.after(self.frame_delay, self.animate)
+        for i in range(0, len(conns), 5):
+            self.connection_items.append(self.create_line(conns[i], conns[i + 1], conns[i + 2], conns[i + 3],
+                                                          fill=f'#{int(conns[i + 4]):06x}', width=1,
+                                                          tags='particle_conn'))
+
+    def attach_renderer(self, worker: RenderWorker):
+        self.renderer = worker
+        worker.configure({})
+
+    def enable_raster(self):
+        """Switches particles, links and grid to a RasterLayer; the Tk items stay behind, hidden."""
+        self.raster = RasterLayer(self, COLOR_BG_DARK, decorate=self._raster_grid)
+        self.apply_connections([])
+        for tag in ('particle', 'grid'):
+            self.itemconfig(tag, state='hidden')
+
+    def _raster_grid(self, base):
+        height, width = base.shape[:2]
+        colors = [hex_to_rgb(color) for color in GRID_COLORS]
+        for n, x in enumerate(range(0, width, GRID_STEP)):
+            base[:, x] = colors[n % len(colors)]
+        for n, y in enumerate(range(0, height, GRID_STEP)):
+            base[y, :] = colors[n % len(colors)]
+
+    def render_raster(self, conns, xs, ys):
+        """One frame into the RasterLayer: particle sprites first, links on top (the item stacking order)."""
+        layer = self.raster
+        layer.begin()
+        if len(xs):
+            layer.discs(xs, ys, self.particles.size, hex_to_rgb(COLOR_NEON_BLUE), ring=True)
+        layer.lines(conns)
+        layer.commit()
 
     # ENHANCEMENT: Explicit cleanup
     def stop(self):
         self.animation_running = False
-        if self._animate_id:
-            try:
-                self.after_cancel(self._animate_id)
-            except Exception:
-                pass
+        TIMERS.cancel(self)
         self.delete('all')
 
 
+def fibonacci_sphere(count: int) -> list:
+    """Unit-sphere points on a golden section spiral, for an even distribution."""
+    points = []
+    for i in range(count):
+        theta = math.acos(1 - 2 * (i + 0.5) / count)
+        phi = math.pi * (1 + 5 ** 0.5) * i
+        points.append([math.sin(theta) * math.cos(phi), math.sin(theta) * math.sin(phi), math.cos(theta)])
+    return points
+
+
+def globe_edges(points, rng) -> list:
+    """Neighbor graph for a point set, shuffled so the draw cap spreads evenly over the sphere."""
+    max_chord = GLOBE_EDGE_SPACING * math.sqrt(4 * math.pi / max(1, len(points)))
+    edges = build_sphere_adjacency(points, max_chord, GLOBE_EDGE_DEGREE)
+    rng.shuffle(edges)
+    return edges
+
+
+def build_sphere_adjacency(points, max_chord, max_degree):
+    """
+    Neighbor graph of unit-sphere points via spatial bucketing: each point is hashed
+    into a cube cell of side max_chord, so all candidates lie in the 27 surrounding
+    cells. Each point keeps its max_degree nearest neighbors. Returns sorted (i, j) edges, i < j.
+    """
+    buckets = {}
+    cells = []
+    for idx, (x, y, z) in enumerate(points):
+        cell = (math.floor(x / max_chord), math.floor(y / max_chord), math.floor(z / max_chord))
+        cells.append(cell)
+        buckets.setdefault(cell, []).append(idx)
+
+    edges = set()
+    max_chord_sq = max_chord * max_chord
+    for idx, (x, y, z) in enumerate(points):
+        cx, cy, cz = cells[idx]
+        candidates = []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for dz in (-1, 0, 1):
+                    for other in buckets.get((cx + dx, cy + dy, cz + dz), ()):
+                        if other == idx:
+                            continue
+                        ox, oy, oz = points[other]
+                        dist_sq = (x - ox) ** 2 + (y - oy) ** 2 + (z - oz) ** 2
+                        if dist_sq <= max_chord_sq:
+                            candidates.append((dist_sq, other))
+        candidates.sort()
+        for _, other in candidates[:max_degree]:
+            edges.add((min(idx, other), max(idx, other)))
+    return sorted(edges)
+
+
 # --- UPDATED Pseudo 3D Hologram Globe (Canvas-based) ---
 class HologramGlobe(tk.Canvas):
-    def __init__(self, parent, state: AppState, radius=110, points=260, fps=35, **kwargs):
+    def __init__(self, parent, state: AppState, radius=110, points=260, fps=35, scheduler=None, **kwargs):
         super().__init__(parent, bg=COLOR_BG_PANEL, highlightthickness=0, **kwargs)
-        self.state = state  # ENHANCEMENT: Reference to AppState
+        self.state = state  # ENHANCEMENT: Reference to AppState (or a StateSnapshot when scheduler-driven)
+        self.scheduler = scheduler
         self.base_radius = radius
         self.points = []
         self.point_items = []
         self.connection_items = []
+        self._conns_visible = 0
         self.max_connections = 100
         self.rotation = 0.0
+        self.prev_rotation = 0.0  # Rotation before the last fixed step; frames draw in between
         self.fps = fps
         self.frame_delay = int(1000 / self.fps)
+        self.clock = CLOCK.timer(1.0 / fps)
         self.center = (self.winfo_reqwidth() // 2 or 200, self.winfo_reqheight() // 2 or 200)
         self.glitch_phase = 0
+        self.rng = RNG.stream('globe')
+        self.renderer = None  # RenderWorker when the frame math runs out of process
+        self.raster = None  # RasterLayer when points and links are drawn into one image
 
-        # create sphere points using golden section spiral for even distribution
-        for i in range(points):
-            theta = math.acos(1 - 2 * (i + 0.5) / points)
-            phi = math.pi * (1 + 5 ** 0.5) * i
-            x = math.sin(theta) * math.cos(phi)
-            y = math.sin(theta) * math.sin(phi)
-            z = math.cos(theta)
-            self.points.append([x, y, z])
-            item = self.create_oval(0, 0, 0, 0, fill=COLOR_NEON_BLUE, outline='')
-            self.point_items.append(item)
-
-        self.bind('<Configure>', lambda e: self.on_resize())
-        self._anim = None
-        self.animate()
+        self.set_point_count(points)
+
+        self.resizer = ResizeDebouncer(self, lambda old, new: self.on_resize())
+        self.activity = track_visibility(self, self.animate)
+        if scheduler is None:
+            self.animate()
+        else:
+            scheduler.add(self.render_frame, self.activity)
         # ENHANCEMENT: Bind to global state change event
         self.master.bind('<<ThreatLevelUpdate>>', self.on_level_update)
 
+    def set_point_count(self, points: int):
+        """(Re)builds the sphere point set, reusing existing oval items where possible."""
+        self.points = fibonacci_sphere(points)
+        while len(self.point_items) < points:
+            self.point_items.append(self.create_oval(0, 0, 0, 0, fill=COLOR_NEON_BLUE, outline='',
+                                                     state='normal' if self.raster is None else 'hidden'))
+        while len(self.point_items) > points:
+            self.delete(self.point_items.pop())
+        for item in self.point_items:
+            self.itemconfig(item, tags=('globe_point', 'globe_front'))
+        self.back_flags = [False] * points
+        self._sorted_rotation = float('-inf')
+        self.lod_stride = None
+        self.edges, self.edge_nodes = [], []
+        self.update_lod()
+
+        # The points are static on the unit sphere: build the neighbor graph once per point set
+        self.edges = globe_edges(self.points, self.rng)
+        self.edge_nodes = sorted({idx for edge in self.edges for idx in edge})
+        self._update_kernel_config()
+
+    def update_lod(self):
+        """Picks the subset of points to animate: every k-th spiral point, fewer on small canvases."""
+        w = self.winfo_width() if self.winfo_width() > 1 else 300
+        h = self.winfo_height() if self.winfo_height() > 1 else 300
+        fraction = max(GLOBE_LOD_MIN_FRACTION, min(1.0, (min(w, h) / GLOBE_LOD_REFERENCE_SIZE) ** 2))
+        stride = max(1, round(1 / fraction))
+        if stride == self.lod_stride:
+            return
+        self.lod_stride = stride
+        self.lod_indices = list(range(0, len(self.points), stride))
+        active = set(self.lod_indices)
+        for idx, item in enumerate(self.point_items):
+            self.itemconfig(item, state='normal' if idx in active and self.raster is None else 'hidden')
+        self._update_kernel_config()
+
+    def _update_kernel_config(self):
+        """Static inputs of globe_kernel; a RenderWorker gets a copy whenever they change."""
+        self.kernel_config = {'points': self.points, 'lod_indices': self.lod_indices,
+                              'edges': self.edges, 'edge_nodes': self.edge_nodes,
+                              # A raster frame is redrawn from scratch, so every back point is needed
+                              'back_divisor': GLOBE_BACK_REFRESH_DIVISOR if self.raster is None else 1}
+        if self.renderer is not None:
+            self.renderer.configure(self.kernel_config)
+
+    def attach_renderer(self, worker: RenderWorker):
+        self.renderer = worker
+        worker.configure(self.kernel_config)
+
+    def enable_raster(self):
+        """Switches points and links to a RasterLayer; the oval and line pools stay behind, hidden."""
+        self.raster = RasterLayer(self, COLOR_BG_PANEL)
+        for tag in ('globe_point', 'globe_conn'):
+            self.itemconfig(tag, state='hidden')
+        self._update_kernel_config()
+
+    def _sort_front_points(self, rotation):
+        """Stacks front-facing points far-to-near (at the drawn rotation) so near points are never overdrawn."""
+        cos_r, sin_r = math.cos(rotation), math.sin(rotation)
+        front = [idx for idx in self.lod_indices if not self.back_flags[idx]]
+        front.sort(key=lambda i: -(-self.points[i][0] * sin_r + self.points[i][2] * cos_r))
+        for idx in front:
+            self.tag_raise(self.point_items[idx])
+        self._sorted_rotation = rotation
+
+    def apply_quality(self, tier: dict):
+        """QualityGovernor listener: point count, connection cap and frame rate follow the detail tier."""
+        if tier['globe_points'] != len(self.points):
+            self.set_point_count(tier['globe_points'])
+        self.max_connections = tier['globe_connections']
+        self.frame_delay = int(1000 / (self.fps * tier['fps_scale']))
+
     def on_resize(self):
         w = self.winfo_width() or 300
         h = self.winfo_height() or 300
         self.center = (w / 2, h / 2)
+        self.update_lod()
 
     # ENHANCEMENT: Status update is now handled by reacting to the global event
     def on_level_update(self, event=None):
@@ -457,158 +3528,109 @@ class HologramGlobe(tk.Canvas):
 
     def project(self, x, y, z, tilt=0.6, current_radius=None):
         """Simple perspective projection, now using dynamic radius."""
-        r = current_radius if current_radius is not None else self.base_radius
-        factor = 1 / (1 + (z * 0.5))
-        sx = x * r * factor
-        sy = y * r * factor * tilt
-        return sx, sy, factor
-
-    def draw_connections(self, cx, cy, ratio, glitch_intensity):
-        """Draws dynamic, glowing connections between points with smooth color transition."""
-
-        for cid in self.connection_items:
-            try:
-                self.delete(cid)
-            except Exception:
-                pass
-        self.connection_items.clear()
-
-        if ratio < 0.05:
-            return
-
-        # --- Dynamic Connection Base Color (Smooth Lerp) ---
-        if ratio < 0.7:
-            conn_base_color = lerp_color(COLOR_NEON_BLUE, COLOR_NEON_ORANGE, ratio / 0.7)
-        else:
-            transition_ratio = (ratio - 0.7) / 0.3 if ratio < 1.0 else 1.0
-            conn_base_color = lerp_color(COLOR_NEON_ORANGE, COLOR_NEON_PURPLE, transition_ratio)
-
-        subset_points = random.sample(self.points, min(len(self.points), 80))
-
-        connections_drawn = 0
-        max_draw = self.max_connections * (ratio * 0.8 + 0.2)
-
-        for i, p1 in enumerate(subset_points):
-            x1, y1, z1 = p1
-            x_rot_1 = x1 * math.cos(self.rotation) + z1 * math.sin(self.rotation)
-            z_rot_1 = -x1 * math.sin(self.rotation) + z1 * math.cos(self.rotation)
-            y_rot_1 = y1
-            sx1, sy1, f1 = self.project(x_rot_1, y_rot_1, z_rot_1, current_radius=self.base_radius)
-            screen_x1, screen_y1 = cx + sx1, cy + sy1
-
-            for p2 in subset_points[i + 1:]:
-                if connections_drawn >= max_draw:
-                    return
-
-                x2, y2, z2 = p2
-                x_rot_2 = x2 * math.cos(self.rotation) + z2 * math.sin(self.rotation)
-                z_rot_2 = -x2 * math.sin(self.rotation) + z2 * math.cos(self.rotation)
-                y_rot_2 = y2
-                sx2, sy2, f2 = self.project(x_rot_2, y_rot_2, z_rot_2, current_radius=self.base_radius)
-                screen_x2, screen_y2 = cx + sx2, cy + sy2
-
-                dx = screen_x1 - screen_x2
-                dy = screen_y1 - screen_y2
-                dist = math.hypot(dx, dy)
-
-                max_dist = 60 - (glitch_intensity * 30)
-                if dist < max_dist:
-                    opacity = 1 - (dist / max_dist)
-                    pulse_factor = 0.5 + 0.5 * math.sin(self.glitch_phase * 0.1) * ratio
-                    final_opacity = max(0.1, min(1.0, opacity * pulse_factor))
-
-                    r, g, b = hex_to_rgb(conn_base_color)
-                    brightness_boost = 1.3
-                    r_final = r * final_opacity * brightness_boost
-                    g_final = g * final_opacity * brightness_boost
-                    b_final = b * final_opacity * brightness_boost
-
-                    color_hex = rgb_to_hex(r_final, g_final, b_final)
-
-                    cid = self.create_line(screen_x1, screen_y1, screen_x2, screen_y2,
-                                           fill=color_hex, width=1, tags='globe_conn')
-                    self.connection_items.append(cid)
-                    connections_drawn += 1
-
+        return project_point(x, y, z, current_radius if current_radius is not None else self.base_radius, tilt)
+
+    def apply_connections(self, conns):
+        """Moves pooled line items onto this frame's connection rows (x1, y1, x2, y2, color)."""
+        drawn = len(conns) // 5
+        for n in range(drawn):
+            i = n * 5
+            color_hex = f'#{int(conns[i + 4]):06x}'
+            if n < len(self.connection_items):
+                cid = self.connection_items[n]
+                self.coords(cid, conns[i], conns[i + 1], conns[i + 2], conns[i + 3])
+                self.itemconfig(cid, fill=color_hex)
+            else:
+                cid = self.create_line(conns[i], conns[i + 1], conns[i + 2], conns[i + 3],
+                                       fill=color_hex, width=1, tags='globe_conn')
+                self.connection_items.append(cid)
+
+        # Hide pooled lines that weren't needed this frame (state only changes when the count does)
+        if drawn != self._conns_visible:
+            for cid in self.connection_items[drawn:self._conns_visible]:
+                self.itemconfig(cid, state='hidden')
+            for cid in self.connection_items[self._conns_visible:drawn]:
+                self.itemconfig(cid, state='normal')
+            self._conns_visible = drawn
+
+    def apply_points(self, ratio, rows, rotation):
+        """
+        Applies globe_kernel point rows to the oval items; only front points get a new fill.
+        rotation is the (interpolated) angle the rows were projected at.
+        """
+        # Back hemisphere: one shared dim color for the whole tag, coords refreshed round-robin
+        self.itemconfig('globe_back', fill=lerp_color(COLOR_BG_PANEL, threat_gradient_color(ratio), GLOBE_BACK_DIM))
+        flipped = False
+        for n, idx in enumerate(self.lod_indices):
+            i = n * 6
+            side = rows[i + 4]
+            item = self.point_items[idx]
+            back = side > 0
+            if back != self.back_flags[idx]:
+                self.back_flags[idx] = back
+                self.itemconfig(item, tags=('globe_point', 'globe_back' if back else 'globe_front'))
+                flipped = True
+            if side == 2:
+                continue
+            self.coords(item, rows[i], rows[i + 1], rows[i + 2], rows[i + 3])
+            if not back:
+                self.itemconfig(item, fill=f'#{int(rows[i + 5]):06x}')
+
+        # --- Depth ordering: front above back in one call; full z-sort only past a rotation threshold ---
+        if flipped:
+            self.tag_raise('globe_front')
+        if abs(rotation - self._sorted_rotation) >= GLOBE_SORT_THRESHOLD:
+            self._sort_front_points(rotation)
+
+    def render_raster(self, ratio, rows, conns):
+        self.raster.begin()
+        raster_globe(self.raster, ratio, rows, conns)
+        self.raster.commit()
+
+    @timed_frame('globe')
     def animate(self):
         level = self.state.threat_level
         active = self.state.is_running or level > 0
 
         ratio = level / 100.0
         rotation_boost = 1.0 + (ratio / 1.5)
-        self.rotation += 0.02 * rotation_boost
-
-        cos_r = math.cos(self.rotation)
-        sin_r = math.sin(self.rotation)
+        steps, alpha = self.clock.advance()
+        for _ in range(steps):
+            self.prev_rotation = self.rotation
+            self.rotation += 0.02 * rotation_boost
+        rotation = self.prev_rotation + (self.rotation - self.prev_rotation) * alpha
         cx, cy = self.center
 
-        glitch_intensity = ratio if level > 30 else 0
-
-        # --- Draw dynamic connections (Aura) ---
-        self.draw_connections(cx, cy, ratio, glitch_intensity)
-
-        for idx, (x0, y0, z0) in enumerate(self.points):
-            # 1. Rotation and Data Spike/Glow Effect
-            x = x0 * cos_r + z0 * sin_r
-            z = -x0 * sin_r + z0 * cos_r
-            y = y0
-
-            current_radius = self.base_radius
-            if active and random.random() < (0.01 + glitch_intensity * 0.08):
-                current_radius = self.base_radius * (1.0 + random.uniform(0.1, 0.4) * glitch_intensity)
-
-            # 2. Projection & Sizing
-            sx, sy, f = self.project(x, y, z, current_radius=current_radius)
-
-            # Introduce visual glitch displacement on critical levels
-            if level >= THREAT_COLOR_MAP['HIGH']['level'] and random.random() < 0.2:
-                sx += random.randint(-4, 4)
-                sy += random.randint(-4, 4)
-
-            screen_x = cx + sx
-            screen_y = cy + sy
-            size = max(1, int(3 * f * (1 + glitch_intensity * 0.5)))
-
-            # 3. Coloring: Smooth transition based on threat level and depth (f)
-            if ratio < 0.7:
-                point_base_color = lerp_color(COLOR_NEON_BLUE, COLOR_NEON_ORANGE, ratio / 0.7)
+        params = (rotation, level, active, self.base_radius, cx, cy, self.glitch_phase, self.max_connections)
+        if self.renderer is None:
+            frame = globe_kernel(self.kernel_config, params, self.rng)
+        else:
+            # Out of process: hand off this frame, apply the newest finished one (usually the previous)
+            frame = self.renderer.exchange(params)
+            if frame is None and not self.renderer.alive:
+                self.renderer = None
+        if frame is not None:
+            rows, conns = frame
+            if self.raster is not None:
+                self.render_raster(ratio, rows, conns)
             else:
-                transition_ratio = (ratio - 0.7) / 0.3 if ratio < 1.0 else 1.0
-                point_base_color = lerp_color(COLOR_NEON_ORANGE, COLOR_NEON_PURPLE, transition_ratio)
-
-            r_base, g_base, b_base = hex_to_rgb(point_base_color)
-
-            # Depth: make closer points brighter (f is the depth factor)
-            brightness_mod = 0.5 + 0.5 * f
-
-            # Pulse: Critical pulse only at high level
-            pulse_mod = 1.0
-            if level >= THREAT_COLOR_MAP['HIGH']['level']:
-                pulse_mod = 0.8 + 0.3 * math.sin(self.glitch_phase * 0.5 + idx)
-
-            r_final = r_base * brightness_mod * pulse_mod
-            g_final = g_base * brightness_mod * pulse_mod
-            b_final = b_base * brightness_mod * pulse_mod
-
-            point_col = rgb_to_hex(r_final, g_final, b_final)
-
-            # Update coordinates and color
-            self.coords(self.point_items[idx], screen_x - size, screen_y - size, screen_x + size, screen_y + size)
-            try:
-                self.itemconfig(self.point_items[idx], fill=point_col)
-            except Exception:
-                pass
+                self.apply_connections(conns)
+                self.apply_points(ratio, rows, rotation)
 
         self.glitch_phase += 1
-        self._anim = self.after(self.frame_delay, self.animate)
+        if self.scheduler is None:
+            delay = self.activity.next_delay(self.frame_delay)
+            if delay is not None:
+                TIMERS.schedule(self, 'globe', delay, self.animate)
+
+    def render_frame(self, snapshot):
+        self.animate()
 
     # ENHANCEMENT: Explicit cleanup
     def stop(self):
-        if self._anim:
-            try:
-                self.after_cancel(self._anim)
-            except Exception:
-                pass
+        if self.scheduler is not None:
+            self.scheduler.remove(self.render_frame)
+        TIMERS.cancel(self)
         self.delete('all')
 
 
@@ -635,15 +3657,21 @@ class GlowButton(tk.Canvas):
         self.bind('<Button-1>', self.on_click)
         self.bind('<Enter>', self.on_enter)
         self.bind('<Leave>', self.on_leave)
-        self.bind('<Configure>', lambda e: self.draw())
+        self.resizer = ResizeDebouncer(self, self.on_resize)
+
+        # Retained items: the pre-rendered body sprite, the scanline over it and the label
+        self._body_item = self.create_image(0, 0, anchor='nw')
+        self._scan_item = self.create_line(0, 0, 0, 0, fill=self._border_color, state='hidden')
+        self._text_item = self.create_text(0, 0, text=self.text, font=('Consolas', 11, 'bold'))
 
         self.draw()
+        self.activity = track_visibility(self, self.animate_glow)
         self.animate_glow()
 
     def draw(self):
-        self.delete('all')
-        width = self.winfo_width() or 200
-        height = self.winfo_height() or 44
+        # Sprites need at least the border and scanline margins to rasterize into
+        width = max(self.winfo_width() or 200, 12)
+        height = max(self.winfo_height() or 44, 12)
 
         if self.enabled:
             bg_color = COLOR_BG_PANEL if not self.hover else self._hover_bg_color
@@ -654,20 +3682,34 @@ class GlowButton(tk.Canvas):
             text_color = '#555555'
             border_color_final = '#333333'
 
-        self.create_rectangle(2, 2, width - 2, height - 2, fill=bg_color, outline=border_color_final, width=2)
+        # Static body: one sprite per size, colors and hover state; the animation never re-rasterizes it
+        key = ('button', width, height, bg_color, border_color_final)
+        sprite = SPRITES.get(key, lambda: render_button_sprite(self, width, height, bg_color, border_color_final))
+        if sprite is not getattr(self, '_body_sprite', None):
+            self._body_sprite = sprite  # Hold the displayed sprite even if the cache evicts it
+            self.itemconfig(self._body_item, image=sprite)
 
         # scanline effect
         if self.enabled:
-            y_pos = (self.glow_intensity % (height - 6)) + 4
-            scanline_color = self._border_color
-            self.create_line(6, y_pos, width - 6, y_pos, fill=scanline_color, width=1)
+            y_pos = int(self.glow_intensity % (height - 6)) + 4
+            self.coords(self._scan_item, 6, y_pos, width - 6, y_pos)
+            self.itemconfig(self._scan_item, state='normal')
+        else:
+            self.itemconfig(self._scan_item, state='hidden')
+        self.coords(self._text_item, width / 2, height / 2)
+        self.itemconfig(self._text_item, fill=text_color)
 
-        self.create_text(width / 2, height / 2, text=self.text, fill=text_color, font=('Consolas', 11, 'bold'))
+    def on_resize(self, old_size=None, new_size=None):
+        # Sprites are keyed by size: the old one may still be on other buttons, so the LRU ages it out
+        self.draw()
 
+    @timed_frame('button')
     def animate_glow(self):
         self.glow_intensity = (self.glow_intensity + 2) % 100
         self.draw()
-        self.after(30, self.animate_glow)
+        delay = self.activity.next_delay(30)
+        if delay is not None:
+            TIMERS.schedule(self, 'glow', delay, self.animate_glow)
 
     def on_click(self, event):
         if self.enabled and self.command:
@@ -698,25 +3740,33 @@ class TracerouteVisualizer(tk.Canvas):
         self.hops = hops
         self.fps = fps
         self.frame_delay = int(1000 / self.fps)
+        self.clock = CLOCK.timer(1.0 / fps)
         self.nodes = []
-        self.packets = []
-        self._anim = None
-        self.bind('<Configure>', lambda e: self.setup_nodes())
+        self.packets = ParticleSystem(('x', 'y', 'vx', 'vy', 'target'))  # target: index of the next hop
+        self.packet_items = []  # Pooled squares, reused across frames; the extras stay hidden
+        self._packets_visible = 0
+        self._packet_color = None
+        self.rng = RNG.stream('traceroute')
+        self.base_line = None
         self.setup_nodes()
+        self.resizer = ResizeDebouncer(self, self.on_resize)
+        self.activity = track_visibility(self, self.animate)
         self.animate()
 
     def setup_nodes(self, event=None):
         self.delete('all')
         self.nodes.clear()
         self.packets.clear()
+        self.packet_items.clear()
+        self._packets_visible = 0
         width = self.winfo_width() or 300
         height = self.winfo_height() or 100
 
         x_positions = [width * (i / (self.hops - 1)) for i in range(self.hops)]
 
         # Draw base line
-        self.create_line(x_positions[0], height / 2, x_positions[-1], height / 2,
-                         fill="#333355", width=2, tags='traceroute_base')
+        self.base_line = self.create_line(x_positions[0], height / 2, x_positions[-1], height / 2,
+                                          fill="#333355", width=2, tags='traceroute_base')
 
         for i, x in enumerate(x_positions):
             y = height / 2
@@ -729,6 +3779,26 @@ class TracerouteVisualizer(tk.Canvas):
 
         self.update_nodes_visuals()
 
+    def on_resize(self, old_size, new_size):
+        """Relayouts nodes in place and rescales packets in flight instead of rebuilding the canvas."""
+        width, height = new_size
+        old_width = self.nodes[-1]['x'] if self.nodes and self.nodes[-1]['x'] > 0 else None
+        sx = width / old_width if old_width else 1.0
+
+        for i, node in enumerate(self.nodes):
+            node['x'] = width * (i / (self.hops - 1))
+            node['y'] = height / 2
+            self.coords(node['label'], node['x'], node['y'] + 15)
+        self.coords(self.base_line, self.nodes[0]['x'], height / 2, self.nodes[-1]['x'], height / 2)
+
+        self.packets.scale(sx, 'x', 'vx')
+        ys = self.packets.y
+        for i in range(len(ys)):
+            ys[i] = height / 2
+        self.packets.remember()
+
+        self.update_nodes_visuals()
+
     def update_nodes_visuals(self):
         """ENHANCEMENT: Updates node colors based on current threat level."""
         level = self.state.threat_level
@@ -755,67 +3825,87 @@ class TracerouteVisualizer(tk.Canvas):
                 col = node_color if is_running else COLOR_NEON_GREEN
 
             # Flickering effect for compromised nodes
-            if is_running and level >= THREAT_COLOR_MAP['HIGH']['level'] and i > 0 and random.random() < 0.2:
-                col = COLOR_BG_PANEL if random.random() < 0.5 else active_node_color
+            if is_running and level >= THREAT_COLOR_MAP['HIGH']['level'] and i > 0 and self.rng.random() < 0.2:
+                col = COLOR_BG_PANEL if self.rng.random() < 0.5 else active_node_color
 
             # Update node appearance
             self.coords(node['node'], x - 5, y - 5, x + 5, y + 5)
             self.itemconfig(node['node'], fill=col, outline=col, width=1)
 
-    def animate(self):
-        # 1. Update packets
-        active_packets = []
-        for p in self.packets:
-            p['x'] += p['vx']
-
-            if p['target_idx'] < len(self.nodes) and p['x'] >= self.nodes[p['target_idx']]['x']:
-                p['current_idx'] = p['target_idx']
-                p['target_idx'] += 1
-
-                if p['current_idx'] == len(self.nodes) - 1:
+    def apply_quality(self, tier: dict):
+        self.frame_delay = int(1000 / (self.fps * tier['fps_scale']))
+
+    def step_packets(self):
+        """One fixed step of packet motion."""
+        # Move all packets in one batch, then hand arrivals on to the next hop
+        packets = self.packets
+        packets.step()
+        xs, vxs, targets = packets.x, packets.vx, packets.target
+        keep = []
+        for i in range(len(packets)):
+            current = int(targets[i])
+            if current < len(self.nodes) and xs[i] >= self.nodes[current]['x']:
+                if current == len(self.nodes) - 1:
+                    keep.append(False)
                     continue
-
-                next_node_x = self.nodes[p['target_idx']]['x']
-                distance = next_node_x - self.nodes[p['current_idx']]['x']
-                p['vx'] = distance / 10
-                p['x'] = self.nodes[p['current_idx']]['x']
-
-            active_packets.append(p)
-
-        self.packets = active_packets
-
-        # 2. Add new packets randomly (simulating continuous data flow)
-        if random.random() < 0.08:
+                targets[i] = current + 1
+                vxs[i] = (self.nodes[current + 1]['x'] - self.nodes[current]['x']) / 10
+                xs[i] = self.nodes[current]['x']
+            keep.append(True)
+        if not all(keep):
+            packets.retain(keep)
+
+        # Add new packets randomly (simulating continuous data flow)
+        if self.rng.random() < 0.08:
             start_node = self.nodes[0]
             next_node = self.nodes[1]
             distance = next_node['x'] - start_node['x']
-            self.packets.append({
-                'x': start_node['x'],
-                'y': start_node['y'],
-                'vx': distance / 10,
-                'current_idx': 0,
-                'target_idx': 1,
-                'item_id': None
-            })
-
-        # 3. Redraw packets and update node visuals
-        self.delete('packet')
-        for p in self.packets:
-            color = get_threat_color(self.state.threat_level) if self.state.is_running else COLOR_NEON_BLUE
-            self.create_rectangle(p['x'] - 3, p['y'] - 3, p['x'] + 3, p['y'] + 3,
-                                  fill=color, outline=color, width=1, tags='packet')
-
+            self.packets.add(x=start_node['x'], y=start_node['y'], vx=distance / 10, target=1)
+
+    def apply_packets(self, xs, ys, color):
+        """Moves pooled packet items onto this frame's positions, creating items only when the pool is short."""
+        count = len(xs)
+        for i in range(count):
+            x, y = xs[i], ys[i]
+            if i < len(self.packet_items):
+                self.coords(self.packet_items[i], x - 3, y - 3, x + 3, y + 3)
+            else:
+                self.packet_items.append(self.create_rectangle(x - 3, y - 3, x + 3, y + 3, fill=color,
+                                                               outline=color, width=1, tags='packet'))
+        if color != self._packet_color:
+            self.itemconfig('packet', fill=color, outline=color)
+            self._packet_color = color
+
+        # Hide pooled items that weren't needed this frame (state only changes when the count does)
+        if count != self._packets_visible:
+            for item in self.packet_items[count:self._packets_visible]:
+                self.itemconfig(item, state='hidden')
+            for item in self.packet_items[self._packets_visible:count]:
+                self.itemconfig(item, state='normal')
+            self._packets_visible = count
+
+    @timed_frame('traceroute')
+    def animate(self):
+        # 1. Packets move and spawn on fixed steps; the frame draws between the last two
+        steps, alpha = self.clock.advance()
+        for n in range(steps):
+            if n == steps - 1:
+                self.packets.remember()
+            self.step_packets()
+        xs, ys = self.packets.lerp(alpha)
+
+        # 2. Move packets and update node visuals
+        color = get_threat_color(self.state.threat_level) if self.state.is_running else COLOR_NEON_BLUE
+        self.apply_packets(xs, ys, color)
         self.update_nodes_visuals()
 
-        self._anim = self.after(self.frame_delay, self.animate)
+        delay = self.activity.next_delay(self.frame_delay)
+        if delay is not None:
+            TIMERS.schedule(self, 'traceroute', delay, self.animate)
 
     # ENHANCEMENT: Explicit cleanup
     def stop(self):
-        if self._anim:
-            try:
-                self.after_cancel(self._anim)
-            except Exception:
-                pass
+        TIMERS.cancel(self)
         self.delete('all')
 
 
@@ -832,6 +3922,7 @@ class SystemStatusPanel(tk.Frame):
             'NET_IN': 5.0,
             'NET_OUT': 8.0
         }
+        self.rng = RNG.stream('status')
 
         gauge_container = tk.Frame(self, bg=COLOR_BG_PANEL)
         gauge_container.pack(side='left', fill='y', expand=False, padx=10, pady=10)
@@ -849,7 +3940,7 @@ class SystemStatusPanel(tk.Frame):
         self.traceroute = TracerouteVisualizer(trace_frame, state=self.state, height=50)
         self.traceroute.pack(fill='x', expand=True, pady=5)
 
-        self._anim = None
+        self.activity = track_visibility(self.gauge_canvas, self.animate)
         self.animate()
 
     def draw_gauge(self, key, value, y_start, width, height):
@@ -899,6 +3990,11 @@ class SystemStatusPanel(tk.Frame):
         canvas.create_text(bar_x2, y_start + 5, text=value_text, anchor='ne', fill=COLOR_NEON_GREEN,
                            font=('Consolas', 9, 'bold'), tags=f"{key}_value")
 
+    def apply_quality(self, tier: dict):
+        self.frame_delay = int(1000 / (self.fps * tier['fps_scale']))
+        self.traceroute.apply_quality(tier)
+
+    @timed_frame('status_panel')
     def animate(self):
         width = self.gauge_canvas.winfo_width() or 200
         height = self.gauge_canvas.winfo_height() or 200
@@ -910,36 +4006,465 @@ class SystemStatusPanel(tk.Frame):
         threat_mod = 1 + (self.state.threat_level / 200)
 
         # CPU load spikes during high threat
-        cpu_sim = self.metrics['CPU_LOAD'] + random.uniform(-1.5, 1.5) * threat_mod
+        cpu_sim = self.metrics['CPU_LOAD'] + self.rng.uniform(-1.5, 1.5) * threat_mod
         self.metrics['CPU_LOAD'] = max(10, min(100, cpu_sim))
 
         # Memory utilization increases slightly
-        mem_sim = self.metrics['MEM_UTIL'] + random.uniform(-0.8, 0.8) * (1 + threat_mod / 2)
+        mem_sim = self.metrics['MEM_UTIL'] + self.rng.uniform(-0.8, 0.8) * (1 + threat_mod / 2)
         self.metrics['MEM_UTIL'] = max(20, min(85, mem_sim))
 
         # Network traffic
-        self.metrics['NET_IN'] = max(0.1, min(15.0, self.metrics['NET_IN'] + random.uniform(-0.5, 0.5)))
-        self.metrics['NET_OUT'] = max(0.1, min(15.0, self.metrics['NET_OUT'] + random.uniform(-0.5, 0.5)))
+        self.metrics['NET_IN'] = max(0.1, min(15.0, self.metrics['NET_IN'] + self.rng.uniform(-0.5, 0.5)))
+        self.metrics['NET_OUT'] = max(0.1, min(15.0, self.metrics['NET_OUT'] + self.rng.uniform(-0.5, 0.5)))
 
         self.draw_gauge('CPU_LOAD', self.metrics['CPU_LOAD'], offset_y + band_height * 0, width, height)
         self.draw_gauge('MEM_UTIL', self.metrics['MEM_UTIL'], offset_y + band_height * 1, width, height)
         self.draw_gauge('NET_IN', self.metrics['NET_IN'], offset_y + band_height * 2, width, height)
         self.draw_gauge('NET_OUT', self.metrics['NET_OUT'], offset_y + band_height * 3, width, height)
 
-        self._anim = self.after(self.frame_delay, self.animate)
+        delay = self.activity.next_delay(self.frame_delay)
+        if delay is not None:
+            TIMERS.schedule(self, 'status', delay, self.animate)
 
     def stop(self):
         self.traceroute.stop()
-        if self._anim:
+        TIMERS.cancel(self)
+
+
+# --- Live Process / Connection Feed (/proc) ---
+TCP_STATES = {'01': 'ESTABLISHED', '02': 'SYN_SENT', '03': 'SYN_RECV', '04': 'FIN_WAIT1', '05': 'FIN_WAIT2',
+              '06': 'TIME_WAIT', '07': 'CLOSE', '08': 'CLOSE_WAIT', '09': 'LAST_ACK', '0A': 'LISTEN',
+              '0B': 'CLOSING'}
+
+
+def parse_proc_address(text: str):
+    """'0100007F:1F90' (as printed in /proc/net/tcp[6]) -> ('127.0.0.1', 8080)."""
+    hex_ip, _, hex_port = text.partition(':')
+    raw = bytes.fromhex(hex_ip)
+    if sys.byteorder == 'little':
+        # The kernel prints each 32-bit word of the address in host byte order
+        raw = b''.join(raw[i:i + 4][::-1] for i in range(0, len(raw), 4))
+    return socket.inet_ntop(socket.AF_INET if len(raw) == 4 else socket.AF_INET6, raw), int(hex_port, 16)
+
+
+def parse_proc_stat(text: str):
+    """'/proc/<pid>/stat' -> (comm, state, start_time, rss_pages). comm may itself contain ')'."""
+    head, _, rest = text.rpartition(')')
+    fields = rest.split()
+    return head.partition('(')[2], fields[0], int(fields[19]), int(fields[21])
+
+
+def parse_tcp_entry(entry: str) -> dict:
+    """One /proc/net/tcp[6] line without its 'sl:' slot prefix."""
+    parts = entry.split()
+    return {'local': parse_proc_address(parts[0]), 'remote': parse_proc_address(parts[1]),
+            'state': TCP_STATES.get(parts[2], parts[2]), 'uid': int(parts[6]), 'inode': int(parts[8])}
+
+
+class ProcFeed:
+    """
+    Incremental view of processes and TCP sockets from a /proc-style tree (or a
+    fixture directory with the same layout: <pid>/stat, net/tcp, net/tcp6, loadavg).
+    Each scan lists PIDs but reads stat only for new ones (bounded per scan) plus a
+    round-robin slice of cached ones, and re-parses only socket lines whose text
+    changed. Scans run on a background thread; the header rotates through the
+    latest highlights, which are swapped in as one reference.
+    """
+
+    def __init__(self, root=PROC_ROOT, interval=PROC_SCAN_INTERVAL):
+        self.root = root
+        self.interval = interval
+        self.processes = {}  # pid -> (comm, state, start_time, rss_pages)
+        self.sockets = {}  # line text (minus slot number) -> parsed socket
+        self._refresh_order = deque()
+        self.warm = False  # True once every listed PID has been read at least once
+        self.recent_pids = deque(maxlen=PROC_HIGHLIGHTS)  # Newly started processes stay in rotation for a while
+        self.recent_sockets = deque(maxlen=PROC_HIGHLIGHTS)
+        self.highlights = ([], [])  # (process lines, socket lines)
+        self.loadavg = None
+        self._rotation = 0
+        self.scans = 0
+        self.stat_reads = 0
+        self.socket_parses = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='proc-feed', daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.is_set():
             try:
-                self.after_cancel(self._anim)
-            except Exception:
-                pass
+                self.scan()
+            except OSError as e:
+                print(f"Process feed scan failed: {e}")
+            self._stop.wait(self.interval)
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+
+    def _read(self, *parts) -> str:
+        with open(os.path.join(self.root, *parts), 'r', errors='replace') as f:
+            return f.read()
+
+    def scan(self):
+        # Until the cache has caught up with the process table, everything looks "new": don't flood the rotation
+        warm = self.warm
+        new_pids = self._scan_processes()
+        new_sockets = self._scan_sockets()
+        if warm:
+            self.recent_pids.extend(new_pids)
+            self.recent_sockets.extend(new_sockets)
+        try:
+            self.loadavg = self._read('loadavg').split()[0]
+        except (OSError, IndexError):
+            pass
+        self.highlights = self._pick_highlights()
+        self.scans += 1
+
+    def _read_pid(self, pid: int):
+        """Reads one stat file; returns True if it's a different process than the cached one."""
+        try:
+            info = parse_proc_stat(self._read(str(pid), 'stat'))
+        except (OSError, ValueError, IndexError):
+            self.processes.pop(pid, None)  # Exited between listing and reading
+            return False
+        self.stat_reads += 1
+        previous = self.processes.get(pid)
+        self.processes[pid] = info
+        self._refresh_order.append(pid)
+        return previous is None or previous[2] != info[2]
+
+    def _scan_processes(self) -> list:
+        with os.scandir(self.root) as entries:
+            live = {int(entry.name) for entry in entries if entry.name.isdigit()}
+        for pid in [pid for pid in self.processes if pid not in live]:
+            del self.processes[pid]
+        unread = sorted(live.difference(self.processes))
+        self.warm = len(unread) <= PROC_READ_BUDGET
+        new = []
+        # Unchanged processes cost nothing beyond the listing: only a fixed-size slice of the cache is
+        # re-read per scan, taken before this scan's new PIDs join the rotation (so none is read twice)
+        for _ in range(min(PROC_REFRESH_BATCH, len(self._refresh_order))):
+            pid = self._refresh_order.popleft()
+            if pid in self.processes and self._read_pid(pid):
+                new.append(pid)  # PID reused by a new process
+        for pid in unread[:PROC_READ_BUDGET]:
+            if self._read_pid(pid):
+                new.append(pid)
+        return new
+
+    def _scan_sockets(self) -> list:
+        fresh = {}
+        new = []
+        for name in ('tcp', 'tcp6'):
+            try:
+                lines = self._read('net', name).splitlines()[1:]
+            except OSError:
+                continue
+            for line in lines:
+                # The slot number shifts as sockets come and go; the rest only changes with the socket
+                entry = line.partition(':')[2].strip()
+                parsed = self.sockets.get(entry)
+                if parsed is None:
+                    try:
+                        parsed = parse_tcp_entry(entry)
+                    except (ValueError, IndexError, OSError):
+                        continue
+                    self.socket_parses += 1
+                    new.append(parsed)
+                fresh[entry] = parsed
+        self.sockets = fresh
+        return new
+
+    def _pick_highlights(self):
+        """Recently started processes and new outside connections first, then the biggest / busiest."""
+        largest = heapq.nlargest(PROC_HIGHLIGHTS, self.processes, key=lambda pid: self.processes[pid][3])
+        recent = list(reversed(self.recent_pids))
+        pids = list(dict.fromkeys(pid for pid in recent + largest if pid in self.processes))[:PROC_HIGHLIGHTS]
+        processes = [f"{self.processes[pid][0]} [{pid}] {self.processes[pid][1]}" for pid in pids]
+
+        def rank(sock):
+            remote_ip = sock['remote'][0]
+            outside = remote_ip not in ('0.0.0.0', '::') and not remote_ip.startswith(('127.', '::1', '::ffff:127.'))
+            return (sock['state'] != 'ESTABLISHED', not outside, sock['state'] != 'LISTEN')
+
+        # Partial selection: the socket table can be huge, only the top few are ever shown
+        established = (sorted(reversed(self.recent_sockets), key=rank)
+                       + heapq.nsmallest(PROC_HIGHLIGHTS * 2, self.sockets.values(), key=rank))
+        sockets = []
+        for sock in established:
+            ip, port = sock['remote'] if sock['state'] != 'LISTEN' else sock['local']
+            line = f"{ip}:{port} {sock['state']}"
+            if line not in sockets:
+                sockets.append(line)
+            if len(sockets) >= PROC_HIGHLIGHTS:
+                break
+        return processes, sockets
+
+    def next_entry(self):
+        """Next (process, socket, load) for the header, or None until the first scan has data."""
+        processes, sockets = self.highlights
+        if not processes:
+            return None
+        self._rotation += 1
+        return (processes[self._rotation % len(processes)],
+                sockets[self._rotation % len(sockets)] if sockets else "no TCP sockets",
+                self.loadavg or "?")
+
+
+# --- Wall Mode: one simulation core, several display windows ---
+class StateSnapshot:
+    """
+    Per-frame copy of the AppState fields views read, under the same names, so
+    widgets render from it unchanged. The sparkline is computed lazily, once per frame.
+    """
+
+    def __init__(self, state: AppState, log_index: LogIndex):
+        self._state = state
+        self._log_index = log_index
+        self.frame = 0
+        self.refresh()
+
+    def refresh(self):
+        state = self._state
+        self.frame += 1
+        self.threat_level = state.threat_level
+        self.is_running = state.is_running
+        self.revision = state.revision
+        self.threat_history = tuple(state.threat_history)
+        self.log_generation = self._log_index.generation
+        self.log_end = self._log_index.end_id
+        self._sparkline = None
+
+    def sparkline_history(self) -> list:
+        if self._sparkline is None:
+            self._sparkline = self._state.sparkline_history()
+        return self._sparkline
+
+
+class FrameScheduler:
+    """
+    A single after() loop for every wall view: each tick refreshes one StateSnapshot
+    and hands it to the registered renderers, so another screen adds rendering cost
+    only. Renderers of hidden windows are skipped; throttled ones run every Nth frame.
+    """
+
+    def __init__(self, master, state: AppState, log_index: LogIndex, fps=TARGET_FPS):
+        self.master = master
+        self.fps = fps
+        self.frame_delay = int(1000 / fps)
+        self.snapshot = StateSnapshot(state, log_index)
+        self.renderers = []  # (render(snapshot), WidgetActivity or None)
+
+    def add(self, render, activity=None):
+        self.renderers.append((render, activity))
+        if not TIMERS.pending(self.master, 'wall'):
+            TIMERS.schedule(self.master, 'wall', self.frame_delay, self._tick)
+
+    def remove(self, render):
+        self.renderers = [entry for entry in self.renderers if entry[0] != render]
+
+    def apply_quality(self, tier: dict):
+        self.frame_delay = int(1000 / (self.fps * tier['fps_scale']))
+
+    @timed_frame('wall')
+    def _tick(self):
+        if not self.renderers:
+            return  # Restarted by the next add()
+        snapshot = self.snapshot
+        snapshot.refresh()
+        for render, activity in list(self.renderers):
+            if activity is not None:
+                if activity.suspended:
+                    continue
+                if activity.throttled and snapshot.frame % VISIBILITY_THROTTLE_FACTOR:
+                    continue
+            try:
+                render(snapshot)
+            except tk.TclError:
+                self.remove(render)  # Its window went away mid-frame
+        TIMERS.schedule(self.master, 'wall', self.frame_delay, self._tick)
+
+    def stop(self):
+        self.renderers.clear()
+        TIMERS.cancel(self.master, 'wall')
+
+
+def parse_wall_view(spec: str):
+    """'KIND' or 'KIND@WxH+X+Y' -> (kind, geometry or None)."""
+    kind, _, geometry = spec.partition('@')
+    if kind not in WALL_VIEWS:
+        raise ValueError(f"Unknown wall view '{kind}' (use one of: {', '.join(WALL_VIEWS)})")
+    return kind, geometry or None
+
+
+class WallView(tk.Toplevel):
+    """One panel of the dashboard in its own window (e.g. on another monitor), drawn by the app's FrameScheduler."""
+
+    TITLES = {'globe': "◢ HOLOGRAM GLOBE ◣", 'log': "◢ LIVE THREAT LOG ◣", 'meter': "◢ THREAT LEVEL ◣"}
+
+    def __init__(self, app, kind: str, geometry=None):
+        super().__init__(app, bg=COLOR_BG_DARK)
+        self.app = app
+        self.kind = kind
+        self.scheduler = app.scheduler
+        self.title(f"CYBERPUNK THREAT MATRIX // {kind.upper()}")
+        if geometry:
+            self.geometry(geometry)
+        self.fullscreen = False
+        self.bind('<F11>', lambda e: self.toggle_fullscreen())
+        self.bind('<Escape>', lambda e: self.fullscreen and self.toggle_fullscreen())
+        self.protocol('WM_DELETE_WINDOW', self.close)
+
+        # Static title: a per-view separator animation would add a loop outside the scheduler
+        panel = tk.Frame(self, bg=COLOR_BG_PANEL)
+        panel.pack(fill='both', expand=True, padx=8, pady=8)
+        tk.Label(panel, text=self.TITLES[kind], bg=COLOR_BG_PANEL, fg=COLOR_NEON_BLUE,
+                 font=('Consolas', 12, 'bold'), pady=8).pack(fill='x')
+        self.render = None
+        getattr(self, f'build_{kind}')(panel)
+
+    def build_globe(self, panel):
+        self.globe = HologramGlobe(panel, state=self.scheduler.snapshot, radius=160, points=260,
+                                   scheduler=self.scheduler)
+        self.globe.pack(fill='both', expand=True, padx=10, pady=10)
+        self.app.governor.subscribe(self.globe.apply_quality)
+
+    def build_log(self, panel):
+        body = tk.Frame(panel, bg=COLOR_BG_PANEL)
+        body.pack(fill='both', expand=True, padx=10, pady=(0, 10))
+        scrollbar = tk.Scrollbar(body, orient='vertical')
+        scrollbar.pack(side='right', fill='y')
+        text = tk.Text(body, wrap=tk.WORD, bg=COLOR_BG_PANEL, fg=COLOR_TEXT_LIGHT, font=('Consolas', 10),
+                       relief=tk.FLAT, bd=0, state=tk.DISABLED)
+        text.pack(side='left', fill='both', expand=True)
+        configure_log_tags(text)
+        # Shares the main window's index; new line ids are picked up once per frame
+        self.log_view = LogView(text, scrollbar, self.app.log_index)
+        self._log_generation = self.app.log_index.generation
+        self._log_seen = self.app.log_index.end_id
+        self.render = self.render_log
+        self.scheduler.add(self.render, track_visibility(text, lambda: None))
+
+    def render_log(self, snapshot):
+        if snapshot.log_generation != self._log_generation:
+            self._log_generation = snapshot.log_generation
+            self._log_seen = snapshot.log_end
+            self.log_view.reset()
+            return
+        for line_id in range(max(self._log_seen, self.app.log_index.first_id), snapshot.log_end):
+            self.log_view.on_line_added(line_id)
+        self._log_seen = snapshot.log_end
+
+    def build_meter(self, panel):
+        self.meter_canvas = tk.Canvas(panel, height=120, bg=COLOR_BG_PANEL, highlightthickness=2,
+                                      highlightbackground=COLOR_NEON_BLUE)
+        self.meter_canvas.pack(fill='both', expand=True, padx=10, pady=10)
+        self._meter_revision = None
+        self.meter_resizer = ResizeDebouncer(self.meter_canvas, self.on_meter_resize)
+        self.render = self.render_meter
+        self.scheduler.add(self.render, track_visibility(self.meter_canvas, lambda: None))
+
+    def on_meter_resize(self, old_size, new_size):
+        self._meter_revision = None
+
+    def render_meter(self, snapshot):
+        # Glitch jitter only shows above 50%; below that an unchanged state needs no redraw
+        if snapshot.revision == self._meter_revision and snapshot.threat_level <= 50:
+            return
+        self._meter_revision = snapshot.revision
+        self.app.draw_threat_meter(self.meter_canvas, snapshot)
+
+    def toggle_fullscreen(self):
+        self.fullscreen = not self.fullscreen
+        self.attributes("-fullscreen", self.fullscreen)
+
+    def close(self):
+        if self.kind == 'globe':
+            self.app.governor.unsubscribe(self.globe.apply_quality)
+            self.globe.stop()
+        elif self.render is not None:
+            self.scheduler.remove(self.render)
+        if self in self.app.wall_views:
+            self.app.wall_views.remove(self)
+        self.destroy()
+
+
+# --- Retained Header Renderer ---
+class HeaderRenderer:
+    """
+    Layered header drawn from items created once: two glitch ghosts under the title,
+    then the separator line. Each tick only moves, shows/hides or recolors a layer,
+    and only when the value differs from what is already on the canvas. Pulse colors
+    and separator offsets are looked up from per-phase tables.
+    """
+
+    PULSE_STEPS = round(2 * math.pi / 0.1)  # Phases per pulse cycle (sin(phase * 0.1))
+    SEPARATOR_STEPS = round(2 * math.pi / 0.05)  # Phases per separator sway cycle (sin(phase * 0.05))
+
+    def __init__(self, canvas: tk.Canvas, title: str, font=('Consolas', 18, 'bold'), y_center=30):
+        self.canvas = canvas
+        self.y_center = y_center
+        self.pulse_colors = []
+        for k in range(self.PULSE_STEPS):
+            alpha = max(0, min(255, int(200 + 55 * math.sin(2 * math.pi * k / self.PULSE_STEPS))))
+            self.pulse_colors.append(f'#{alpha:02x}{alpha:02x}ff')
+        self.separator_offsets = [int(20 * math.sin(2 * math.pi * k / self.SEPARATOR_STEPS))
+                                  for k in range(self.SEPARATOR_STEPS)]
+
+        # Stacking order is creation order: ghosts (purple, green), title, separator
+        self.ghosts = [canvas.create_text(0, y_center, text=title, fill=color, font=font, anchor='center',
+                                          state='hidden')
+                       for color in (COLOR_NEON_PURPLE, COLOR_NEON_GREEN)]
+        self.title_item = canvas.create_text(0, y_center, text=title, fill=self.pulse_colors[0], font=font,
+                                             anchor='center')
+        self.separator = canvas.create_line(0, 50, 0, 50, fill=COLOR_NEON_BLUE, width=2)
+        self._applied = {}  # item -> {'coords': ..., option: value} as last sent to Tk
+
+    def _update(self, item, coords=None, **options):
+        applied = self._applied.setdefault(item, {})
+        if coords is not None and applied.get('coords') != coords:
+            self.canvas.coords(item, *coords)
+            applied['coords'] = coords
+        changed = {key: value for key, value in options.items() if applied.get(key) != value}
+        if changed:
+            self.canvas.itemconfig(item, **changed)
+            applied.update(changed)
+
+    def render(self, phase: int, level: int, rng, width: int):
+        x_pos = width / 2
+        ratio = level / 100.0
+        # Glitch intensity: starts subtle even at 0 (0.1 base) and scales up quickly after 20%
+        glitch_intensity = 0.1 if ratio < 0.2 else ratio
+
+        # 1. Digital Noise/Ghosting (Scaled by intensity)
+        if rng.random() < (0.05 + glitch_intensity * 0.4):
+            for ghost, spread in zip(self.ghosts, (4, 3)):
+                offset_x = rng.randint(-spread, spread) * glitch_intensity
+                offset_y = rng.randint(-spread, spread) * glitch_intensity
+                self._update(ghost, (x_pos + offset_x, self.y_center + offset_y), state='normal')
+        else:
+            for ghost in self.ghosts:
+                self._update(ghost, state='hidden')
+
+        # 2. Pulsing/Main Text Effect: blue pulse at 0%, otherwise the threat color
+        fill = get_threat_color(level) if level > 0 else self.pulse_colors[phase % self.PULSE_STEPS]
+        self._update(self.title_item, (x_pos, self.y_center), fill=fill)
+
+        # 3. Animated Separator Line
+        line_offset = self.separator_offsets[phase % self.SEPARATOR_STEPS]
+        self._update(self.separator, (50 + line_offset, 50, width - 50 - line_offset, 50))
 
 
 # --- Main Application (Updated to use AppState) ---
 class CyberpunkThreatMatrix(tk.Tk):
-    def __init__(self):
+    def __init__(self, ingest_endpoints=(), metrics_port=None, wall_views=(), isolated_render=False,
+                 proc_root=PROC_ROOT, raster=False, loadgen=None, soak=None):
         super().__init__()
         self.title("CYBERPUNK THREAT MATRIX // SIMULATOR")
         self.geometry("1200x800")
@@ -947,19 +4472,71 @@ class CyberpunkThreatMatrix(tk.Tk):
 
         # ENHANCEMENT: Initialize central state manager
         self.state = AppState(self)
-        self.msg_queue = queue.Queue()
-        self.after(100, self.process_queue)
+        self.msg_queue = LaneQueue()
+        self.threat_seq = {}  # source -> seq of the level last applied (lanes may deliver out of order)
+        self.threat_floor = 0  # seq of the last completion/error; older levels must not revive the meter
+        self.shed_shown = 0
+        TIMERS.schedule(self, 'queue', 100, self.process_queue)
 
         self.stop_simulation_flag = False
         self.attack_buttons = {}
         self.sound = SoundManager()
 
+        # Persistent, searchable record of every log event (survives the per-run log clear)
+        self.current_scenario = 'system'
+        # Scenario-configurable scoring; concurrent sources (simulation, ingest feeds) merge through it
+        self.threat_model = ThreatModel()
+        self.threat_sources = {}
+        self._journal_cursor = None
+        self._log_view_since = time.time()  # Journal records older than this aren't in the log widget yet
+        self.journal = None
+        if loadgen is None:
+            try:
+                self.journal = EventJournal()
+            except (OSError, ValueError) as e:
+                print(f"Event journal disabled: {e}")
+        else:
+            # Synthetic load stays out of the persistent journal and history store
+            self.state.recording = False
+
         # FIX: Initialize self.abort_btn to prevent Attribute Error before it's created.
         self.abort_btn = None
+        self.ingest = None  # Set up below; the header data stream reads it from its first tick
+        self.load_generator = None
+        self.soak = None
+        self.exit_code = 0  # Set by unattended modes (--soak) for the process exit status
+
+        # Real processes and sockets for the header data stream (random stand-in without /proc)
+        self.proc_feed = None
+        if proc_root and os.path.isdir(proc_root):
+            self.proc_feed = ProcFeed(proc_root).start()
+
+        # Adaptive detail: watches frame times and retunes the animated widgets
+        self.governor = QualityGovernor(self)
+        # Suspends animation loops of hidden widgets; reports the idle time on restore
+        self._visibility_monitor = VisibilityMonitor(self)
+        self._visibility_monitor.on_restore = self.on_window_restored
 
         self.setup_style()
         self.create_animated_background()
         self.create_widgets()
+        for widget in (self.bg_canvas, self.globe, self.status_panel):
+            self.governor.subscribe(widget.apply_quality)
+        self.governor.subscribe(self.on_quality_change, immediate=False)  # Log real tier changes only
+        if raster:
+            self.enable_raster()
+
+        # Optional: globe and background frame math in worker processes, results via shared memory
+        self.render_workers = []
+        if isolated_render:
+            self.start_render_workers()
+
+        # Wall mode: extra windows share one scheduler and state snapshot, not another simulation
+        self.scheduler = FrameScheduler(self, self.state, self.log_index)
+        self.governor.subscribe(self.scheduler.apply_quality)
+        self.wall_views = []
+        for kind, geometry in wall_views:
+            self.wall_views.append(WallView(self, kind, geometry))
 
         # ENHANCEMENT: Initial UI update relies on AppState
         self.update_threat_meter_visuals()
@@ -974,11 +4551,50 @@ class CyberpunkThreatMatrix(tk.Tk):
         self.bind('<Escape>', lambda e: self.exit_fullscreen())
         self.bind('<<ThreatLevelUpdate>>', self.on_threat_update)
         self.bind('<<SimulationStateChange>>', self.on_state_change)
+        self.bind('<Control-e>', lambda e: self.export_threat_history())
+        self.bind('<F9>', lambda e: self.page_journal())
+
+        # External event feeds (IDS stand-ins) share the simulation's message path
+        if ingest_endpoints:
+            self.ingest = IngestServer(self.msg_queue, ingest_endpoints).start()
+            for kind, address in self.ingest.bound:
+                self.log_message(f"[INGEST] Listening for events on {kind}:{address}", "INFO")
+
+        # Headless observability: snapshots are rebuilt here once per frame, served from a thread
+        self.metrics = None
+        if metrics_port is not None:
+            try:
+                self.metrics = MetricsServer(port=metrics_port)
+                self.log_message(f"[METRICS] Serving /metrics and /state on "
+                                 f"http://{self.metrics.address[0]}:{self.metrics.address[1]}", "INFO")
+                self.publish_metrics()
+            except OSError as e:
+                self.log_message(f"[METRICS] Endpoint disabled: {e}", "ERROR")
+
+        # Stress mode: synthetic event floods through the same message path, then a saturation report
+        if loadgen is not None:
+            self.log_message("[LOADGEN] Synthetic load run started; the app closes when the report is done", "WARNING")
+            self.load_generator = LoadGenerator(self, **loadgen).start()
+        # Soak mode: scenarios back to back on accelerated time, with leak sampling
+        if soak is not None:
+            self.soak = SoakMonitor(self, **soak).start()
+
+        self.protocol('WM_DELETE_WINDOW', self.on_close)
+        TIMERS.schedule(self, 'autosave', HISTORY_AUTOSAVE_MS, self.autosave_history)
 
     # ENHANCEMENT: Event handler for UI updates
     def on_threat_update(self, event=None):
         self.update_threat_meter_visuals()
 
+    def on_quality_change(self, tier: dict):
+        self.log_message(f"[QUALITY] Detail tier → {tier['name']} "
+                         f"(frame {self.governor.avg_frame_time * 1000:.1f} ms, "
+                         f"target {self.governor.budget * 1000:.1f} ms)", "INFO")
+
+    def on_window_restored(self, seconds_away: float):
+        self.log_message(f"[POWER] Window restored after {seconds_away:.1f}s; animations suspended "
+                         f"{self._visibility_monitor.suspended_seconds():.1f}s in total across widgets", "INFO")
+
     # ENHANCEMENT: Event handler for button state and global visual cleanup
     def on_state_change(self, event=None):
         is_running = self.state.is_running
@@ -1033,15 +4649,41 @@ class CyberpunkThreatMatrix(tk.Tk):
         log_frame = self.create_panel(log_col, "◢ LIVE THREAT LOG ◣")
         log_frame.grid(row=0, column=0, sticky='nsew', padx=6, pady=6)
 
-        self.log_text = scrolledtext.ScrolledText(log_frame, wrap=tk.WORD, height=10, bg=COLOR_BG_PANEL,
-                                                  fg=COLOR_TEXT_LIGHT, font=('Consolas', 10), relief=tk.FLAT, bd=0,
-                                                  insertbackground=COLOR_NEON_BLUE)
-        self.log_text.pack(fill='both', expand=True, padx=10, pady=(0, 10))
+        # Filter bar: live search plus one toggle per severity
+        filter_bar = tk.Frame(log_frame, bg=COLOR_BG_PANEL)
+        filter_bar.pack(fill='x', padx=10, pady=(0, 4))
+        tk.Label(filter_bar, text="⟫ FILTER", bg=COLOR_BG_PANEL, fg=COLOR_NEON_BLUE,
+                 font=('Consolas', 9)).pack(side='left')
+        self.log_search_var = tk.StringVar()
+        self.log_search_var.trace_add('write', lambda *_: self.log_view.set_filter(query=self.log_search_var.get()))
+        tk.Entry(filter_bar, textvariable=self.log_search_var, bg=COLOR_BG_DARK, fg=COLOR_TEXT_LIGHT,
+                 insertbackground=COLOR_NEON_BLUE, relief=tk.FLAT, font=('Consolas', 9),
+                 width=14).pack(side='left', fill='x', expand=True, padx=6)
+        self.severity_toggles = {}
+        for severity, label, color in (("INFO", "INF", COLOR_NEON_BLUE), ("WARNING", "WRN", COLOR_NEON_GREEN),
+                                       ("ERROR", "ERR", COLOR_NEON_ORANGE), ("CRITICAL", "CRT", COLOR_NEON_PURPLE)):
+            toggle = tk.Label(filter_bar, text=label, bg=COLOR_BG_DARK, fg=color, font=('Consolas', 9, 'bold'),
+                              padx=4, cursor='hand2')
+            toggle.pack(side='left', padx=1)
+            toggle.bind('<Button-1>', lambda e, sev=severity: self.toggle_severity(sev))
+            self.severity_toggles[severity] = toggle
+        # Overload indicator: hidden until msg_queue sheds or rejects its first message
+        self.shed_label = tk.Label(filter_bar, text="", bg=COLOR_BG_PANEL, fg=COLOR_NEON_ORANGE,
+                                   font=('Consolas', 9, 'bold'))
+        self.shed_label.pack(side='right')
+
+        log_body = tk.Frame(log_frame, bg=COLOR_BG_PANEL)
+        log_body.pack(fill='both', expand=True, padx=10, pady=(0, 10))
+        log_scrollbar = tk.Scrollbar(log_body, orient='vertical')
+        log_scrollbar.pack(side='right', fill='y')
+        self.log_text = tk.Text(log_body, wrap=tk.WORD, height=10, bg=COLOR_BG_PANEL,
+                                fg=COLOR_TEXT_LIGHT, font=('Consolas', 10), relief=tk.FLAT, bd=0,
+                                insertbackground=COLOR_NEON_BLUE)
+        self.log_text.pack(side='left', fill='both', expand=True)
         self.log_text.config(state=tk.DISABLED)
-        self.log_text.tag_config("INFO", foreground=COLOR_NEON_BLUE)
-        self.log_text.tag_config("WARNING", foreground=COLOR_NEON_GREEN)
-        self.log_text.tag_config("ERROR", foreground=COLOR_NEON_ORANGE)
-        self.log_text.tag_config("CRITICAL", foreground=COLOR_NEON_PURPLE, font=('Consolas', 10, 'bold'))
+        self.log_index = LogIndex()
+        self.log_view = LogView(self.log_text, log_scrollbar, self.log_index)
+        configure_log_tags(self.log_text)
 
         # --- SYSTEM STATUS PANEL ---
         status_frame = self.create_panel(log_col, "◢ CORE SYSTEM STATUS ◣")
@@ -1082,6 +4724,7 @@ class CyberpunkThreatMatrix(tk.Tk):
         self.threat_meter_canvas = tk.Canvas(meter_panel, height=90, bg=COLOR_BG_PANEL, highlightthickness=2,
                                              highlightbackground=COLOR_NEON_BLUE)
         self.threat_meter_canvas.pack(fill='x', padx=10, pady=10)
+        self.meter_resizer = ResizeDebouncer(self.threat_meter_canvas, self.on_meter_resize)
 
         self.recom_text = tk.Label(meter_panel, text="⟫ Awaiting simulation initiation...", justify=tk.LEFT,
                                    bg=COLOR_BG_PANEL, fg=COLOR_TEXT_LIGHT, font=('Consolas', 9), wraplength=320, pady=5,
@@ -1092,17 +4735,32 @@ class CyberpunkThreatMatrix(tk.Tk):
 
     def update_data_stream(self):
         """Updates the small data stream text in the header."""
-        rand_ip = ".".join(str(random.randint(0, 255)) for _ in range(4))
-        rand_port = random.randint(1024, 65535)
-        rand_hash_short = ''.join(random.choices('0123456789abcdef', k=12))
-        rand_process = random.choice(["NET_WATCH", "K_SHELL", "AUTH_SVC", "MEM_SCAN", "I/O_MON"])
-
-        stream_content = (
-            f"PROCESS: {rand_process}...\n"
-            f"TARGET: {rand_ip}:{rand_port}\n"
-            f"CHECKSUM: {rand_hash_short}\n"
-            f"LOAD: {random.randint(10, 99)}%"
-        )
+        entry = self.proc_feed.next_entry() if self.proc_feed else None
+        if entry:
+            process, target, load = entry
+            stream_content = (
+                f"PROCESS: {process}\n"
+                f"TARGET: {target}\n"
+                f"TRACKED: {len(self.proc_feed.processes)} procs · {len(self.proc_feed.sockets)} socks\n"
+                f"LOAD: {load}"
+            )
+        else:
+            rng = RNG.stream('data_stream')
+            rand_ip = ".".join(str(rng.randint(0, 255)) for _ in range(4))
+            rand_port = rng.randint(1024, 65535)
+            rand_hash_short = ''.join(rng.choices('0123456789abcdef', k=12))
+            rand_process = rng.choice(["NET_WATCH", "K_SHELL", "AUTH_SVC", "MEM_SCAN", "I/O_MON"])
+
+            stream_content = (
+                f"PROCESS: {rand_process}...\n"
+                f"TARGET: {rand_ip}:{rand_port}\n"
+                f"CHECKSUM: {rand_hash_short}\n"
+                f"LOAD: {rng.randint(10, 99)}%"
+            )
+        if self.ingest:
+            stats = self.ingest.stats()
+            stream_content += (f"\nINGEST: {stats['rate']:.0f} ev/s · Q {stats['queue_depth']}"
+                               f" · DROP {stats['dropped']}")
 
         # update only label text (don't recreate widget)
         if hasattr(self, 'data_stream_label'):
@@ -1112,68 +4770,33 @@ class CyberpunkThreatMatrix(tk.Tk):
             self.data_stream_label = tk.Label(self.header_frame, text=stream_content, bg=COLOR_BG_DARK,
                                               fg=COLOR_NEON_GREEN, font=('Consolas', 9))
             self.data_stream_label.pack(side='right', padx=8)
+            self.data_stream_activity = track_visibility(self.data_stream_label, self.update_data_stream)
 
-        self.after(400, self.update_data_stream)
+        delay = self.data_stream_activity.next_delay(400)
+        if delay is not None:
+            TIMERS.schedule(self.data_stream_label, 'data_stream', delay, self.update_data_stream)
 
     def start_header_animation(self):
         """Initializes the header animation phase."""
         self.header_phase = 0
+        self.header_renderer = HeaderRenderer(self.header_canvas, "⚡ PROTOCOL: REDLINE ⚡")
+        self.header_activity = track_visibility(self.header_canvas, self.animate_header)
         self.animate_header()
 
     # MODIFIED: Advanced Header Glitch Animation is now the default
+    @timed_frame('header')
     def animate_header(self):
         """
         Animates the pulsing and glitching header text with the updated title.
         Glitch intensity scales with threat level, and defaults to subtle pulse at 0%.
         """
-        canvas = self.header_canvas
-        canvas.delete('all')
-
-        width = canvas.winfo_width() or 1200
-        title = "⚡ PROTOCOL: REDLINE ⚡"
-        x_pos = width / 2
-        y_center = 30
-
-        level = self.state.threat_level
-        ratio = level / 100.0
-
-        # Glitch intensity: starts subtle even at 0 (0.1 base) and scales up quickly after 20%
-        # This keeps the animation active and engaging in the normal state.
-        glitch_intensity = 0.1 if ratio < 0.2 else ratio
-
-        # 1. Digital Noise/Ghosting (Scaled by intensity)
-        if random.random() < (0.05 + glitch_intensity * 0.4):
-            # Glitch layer 1 (Purple)
-            offset_x = random.randint(-4, 4) * glitch_intensity
-            offset_y = random.randint(-4, 4) * glitch_intensity
-            canvas.create_text(x_pos + offset_x, y_center + offset_y, text=title,
-                               fill=COLOR_NEON_PURPLE,
-                               font=('Consolas', 18, 'bold'), anchor='center')
-
-            # Glitch layer 2 (Green)
-            offset_x = random.randint(-3, 3) * glitch_intensity
-            offset_y = random.randint(-3, 3) * glitch_intensity
-            canvas.create_text(x_pos + offset_x, y_center + offset_y, text=title,
-                               fill=COLOR_NEON_GREEN,
-                               font=('Consolas', 18, 'bold'), anchor='center')
-
-        # 2. Pulsing/Main Text Effect
-        alpha = int(200 + 55 * math.sin(self.header_phase * 0.1))
-        alpha = max(0, min(255, alpha))
-
-        # If threat is 0, use the blue pulse. Otherwise, use the threat color.
-        pulse_color = get_threat_color(level) if level > 0 else f'#{alpha:02x}{alpha:02x}ff'
-
-        canvas.create_text(x_pos, y_center, text=title, fill=pulse_color,
-                           font=('Consolas', 18, 'bold'), anchor='center')
-
-        # 3. Animated Separator Line
-        line_offset = int(20 * math.sin(self.header_phase * 0.05))
-        canvas.create_line(50 + line_offset, 50, width - 50 - line_offset, 50,
-                           fill=COLOR_NEON_BLUE, width=2)
+        width = self.header_canvas.winfo_width() or 1200
+        self.header_renderer.render(self.header_phase, self.state.threat_level, RNG.stream('header'), width)
 
         self.header_phase += 1
-        self.after(50, self.animate_header)
+        delay = self.header_activity.next_delay(50)
+        if delay is not None:
+            TIMERS.schedule(self.header_canvas, 'header', delay, self.animate_header)
 
     def create_panel(self, parent, title):
         frame = tk.Frame(parent, bg=COLOR_BG_PANEL, highlightthickness=0)
@@ -1189,8 +4812,11 @@ class CyberpunkThreatMatrix(tk.Tk):
             offset = int(8 * math.sin(phase[0] * 0.1))
             sep.create_line(offset, 1, width - offset, 1, fill=COLOR_NEON_BLUE, width=2)
             phase[0] += 1
-            sep.after(80, lambda: animate_sep(phase))
+            delay = sep_activity.next_delay(80)
+            if delay is not None:
+                TIMERS.schedule(sep, 'separator', delay, lambda: animate_sep(phase))
 
+        sep_activity = track_visibility(sep, animate_sep)
         animate_sep()
         return frame
 
@@ -1238,10 +4864,14 @@ class CyberpunkThreatMatrix(tk.Tk):
         self.state.threat_level = 0
         self.state.reset_history()  # Ensure fresh start
 
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.delete(1.0, tk.END)
+        self.current_scenario = attack_type
+        self.threat_model = ThreatModel.for_scenario(attack_type)
+        self.threat_sources.clear()
+        self._journal_cursor = None
+        self._log_view_since = time.time()
+        self.log_index.clear()
+        self.log_view.reset()
         self.log_message(f"[START] ⚡ Initiating {attack_type.replace('_', ' ').upper()} simulation...", "CRITICAL")
-        self.log_text.config(state=tk.DISABLED)
         self.recom_text.config(text="⟫ Simulation active. Analyzing threat vector...")
         self.sound.play_tone('start')
 
@@ -1257,6 +4887,7 @@ class CyberpunkThreatMatrix(tk.Tk):
         # ENHANCEMENT: State reset
         self.state.is_running = False
         # NEW ENHANCEMENT: Reset history to clear the visual line
+        self.threat_sources.clear()
         self.state.reset_history()
 
     def run_simulation(self, attack_type: str):
@@ -1267,15 +4898,16 @@ class CyberpunkThreatMatrix(tk.Tk):
 
         logs = attack_info["logs"]
         total_steps = len(logs)
+        evaluator = self.threat_model.evaluator(total_steps)
+        rng = RNG.stream('threat')
 
         try:
-            for i, (severity, log_message) in enumerate(logs):
+            for severity, log_message in logs:
                 if self.stop_simulation_flag:
                     self.msg_queue.put({"type": "error", "message": "Simulation aborted by user."})
                     break
 
-                step = i + 1
-                current_threat_level = calculate_threat_level(step, total_steps, severity)
+                current_threat_level = evaluator.step(severity, rng)
 
                 if severity == "CRITICAL":
                     self.sound.play_tone('critical')
@@ -1286,7 +4918,7 @@ class CyberpunkThreatMatrix(tk.Tk):
                     "message": log_message,
                     "threat_level": current_threat_level
                 })
-                time.sleep(ATTACK_SIMULATION_INTERVAL)
+                time.sleep(ATTACK_SIMULATION_INTERVAL / CLOCK.speed)
 
             if not self.stop_simulation_flag:
                 self.msg_queue.put({
@@ -1303,18 +4935,27 @@ class CyberpunkThreatMatrix(tk.Tk):
                 self.state.is_running = False
                 self.stop_simulation_flag = False
 
+    @timed_frame('queue')
     def process_queue(self):
+        applied = []
         try:
             while not self.msg_queue.empty():
                 data = self.msg_queue.get(block=False)
+                if "enqueued" in data:
+                    applied.append(data)
                 if data["type"] == "log":
-                    self.log_message(data["message"], data["severity"])
+                    self.log_message(data["message"], data["severity"], data["threat_level"])
                     # ENHANCEMENT: Set state property which triggers the event
-                    self.state.threat_level = data["threat_level"]
+                    if data["threat_level"] is not None:  # External feeds may log without a level
+                        self.apply_threat_sample(data)
+                elif data["type"] == "threat_level":
+                    self.apply_threat_sample(data)
                 elif data["type"] == "attack_complete":
                     # ENHANCEMENT: State reset
+                    self.threat_floor = data.get("seq", 0)
                     self.state.is_running = False
                     # NEW ENHANCEMENT: Reset history to clear the visual line
+                    self.threat_sources.clear()
                     self.state.reset_history()
 
                     self.show_recommendations(data["verdict"], data["prevention"])
@@ -1324,28 +4965,61 @@ class CyberpunkThreatMatrix(tk.Tk):
                     self.recom_text.config(text="⚠ ERROR: Simulation terminated unexpectedly or aborted.")
                     self.sound.play_tone('warning')
                     # ENHANCEMENT: State reset
+                    self.threat_floor = data.get("seq", 0)
                     self.state.is_running = False
                     # NEW ENHANCEMENT: Reset history to clear the visual line
+                    self.threat_sources.clear()
                     self.state.reset_history()
         except queue.Empty:
             pass
+        if applied and self.load_generator:
+            self.load_generator.on_applied(applied)
+        shed = sum(self.msg_queue.shed.values())
+        if shed != self.shed_shown:
+            self.shed_shown = shed
+            self.shed_label.config(text=f"SHED {shed}")
+
+        TIMERS.schedule(self, 'queue', 100, self.process_queue)
+
+    def apply_threat_sample(self, data):
+        """Merge one source's level unless a newer level (or a completion/error reset) already superseded it."""
+        source = data.get("source", "simulation")
+        seq = data.get("seq", 0)
+        if seq and (seq <= self.threat_floor or seq <= self.threat_seq.get(source, 0)):
+            return
+        self.threat_seq[source] = seq
+        self.threat_sources[source] = data["threat_level"]
+        self.state.threat_level = self.threat_model.combine(self.threat_sources.values())
 
-        self.after(100, self.process_queue)
+    def log_message(self, message: str, severity: str, threat_level=None):
+        if self.journal:
+            level = self.state.threat_level if threat_level is None else threat_level
+            self.journal.append(severity, message, scenario=self.current_scenario, threat_level=level)
 
-    def log_message(self, message: str, severity: str):
         timestamp = datetime.now().strftime("[%H:%M:%S.%f]")[:-3]
-        icon = {"INFO": "▶", "WARNING": "⚠", "ERROR": "✖", "CRITICAL": "⚡"}.get(severity, "●")
-        log_line = f"{timestamp} {icon} {message}\n"
+        icon = LOG_ICONS.get(severity, "●")
+        log_line = f"{timestamp} {icon} {message}"
 
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, log_line, severity)
-        self.log_text.see(tk.END)
-        self.log_text.config(state=tk.DISABLED)
+        line_id = self.log_index.add(log_line, severity)
+        self.log_view.on_line_added(line_id)
+
+    def toggle_severity(self, severity: str):
+        severities = set(self.log_view.severities) ^ {severity}
+        self.log_view.set_filter(severities=severities)
+        self.severity_toggles[severity].config(bg=COLOR_BG_DARK if severity in severities else COLOR_BG_PANEL,
+                                               relief=tk.FLAT if severity in severities else tk.SUNKEN)
+
+    def on_meter_resize(self, old_size, new_size):
+        self.update_threat_meter_visuals()
 
     # ENHANCEMENT: Renamed and logic simplified as it pulls from self.state
     def update_threat_meter_visuals(self):
-        level = self.state.threat_level
-        canvas = self.threat_meter_canvas
+        self.draw_threat_meter(self.threat_meter_canvas, self.state)
+
+    @timed_frame('meter')
+    def draw_threat_meter(self, canvas, state):
+        """Draws the meter from `state` (AppState or a StateSnapshot) onto any meter canvas."""
+        level = state.threat_level
         canvas.delete("all")
 
         width = canvas.winfo_width() or 360
@@ -1360,9 +5034,10 @@ class CyberpunkThreatMatrix(tk.Tk):
         glitch_offset = 0
         text_fill = COLOR_TEXT_LIGHT
 
-        if level > 50 and random.random() < 0.15:
-            glitch_offset = random.randint(-3, 3)
-            if random.random() < 0.4:
+        rng = RNG.stream('meter')
+        if level > 50 and rng.random() < 0.15:
+            glitch_offset = rng.randint(-3, 3)
+            if rng.random() < 0.4:
                 text_fill = COLOR_NEON_PURPLE
 
         bar_y1 = 24
@@ -1370,18 +5045,14 @@ class CyberpunkThreatMatrix(tk.Tk):
 
         canvas.create_rectangle(12, bar_y1, width - 12, bar_y2, fill=COLOR_METER_SHELL, outline='')
 
-        # Outer glow effect (ENHANCED for better blending)
-        for i in range(3, 0, -1):  # Draw from largest to smallest for layering
-            offset = i
-            base_color_rgb = hex_to_rgb(color)
-            r, g, b = [c + (255 - c) * 0.1 * i for c in base_color_rgb]  # Slightly brighter outline
-
-            # Simulated gradient/transparency by blending with background
-            blend_color = lerp_color(COLOR_BG_PANEL, rgb_to_hex(r, g, b), 0.8 / i)
-
-            canvas.create_rectangle(12 - offset + glitch_offset, bar_y1 - offset,
-                                    12 + fill_width + offset + glitch_offset, bar_y2 + offset,
-                                    outline=blend_color, width=1)
+        # Outer glow effect: 3 blended layers pre-rendered into a single sprite per (quantized size, threat color)
+        glow_width = int(round(fill_width / METER_GLOW_QUANTUM)) * METER_GLOW_QUANTUM
+        bar_height = int(bar_y2 - bar_y1)
+        if glow_width >= 0 and bar_height > 0:
+            glow = SPRITES.get(('meter_glow', glow_width, bar_height, color),
+                               lambda: render_meter_glow_sprite(canvas, glow_width, bar_height, color))
+            canvas.glow_sprite = glow  # Hold the displayed sprite even if the cache evicts it
+            canvas.create_image(12 - 3 + glitch_offset, bar_y1 - 3, image=glow, anchor='nw')
 
         # Inner segmented fill
         for i in range(segments):
@@ -1396,7 +5067,7 @@ class CyberpunkThreatMatrix(tk.Tk):
                                         outline='')
 
         # ENHANCEMENT: Sparkline Graph Overlay
-        history = list(self.state.threat_history)
+        history = state.sparkline_history()
         if len(history) > 1:
             line_points = []
             max_h = bar_y2 - bar_y1
@@ -1449,23 +5120,621 @@ class CyberpunkThreatMatrix(tk.Tk):
             self.fullscreen = False
             self.attributes("-fullscreen", False)
 
+    def autosave_history(self):
+        self.state.save_history(background=True)  # Keep the file write off the Tk thread
+        TIMERS.schedule(self, 'autosave', HISTORY_AUTOSAVE_MS, self.autosave_history)
 
-# --- Threat calculation kept as before but unchanged ---
-def calculate_threat_level(step: int, total_steps: int, severity: str) -> int:
-    base_level = (step / total_steps) * 70
-    if severity == "INFO":
-        bonus = random.randint(0, 5)
-    elif severity == "WARNING":
-        bonus = random.randint(5, 15)
-    elif severity == "ERROR":
-        bonus = random.randint(15, 25)
-    elif severity == "CRITICAL":
-        bonus = random.randint(25, 30)
-    else:
-        bonus = 0
-    return min(int(base_level + bonus), MAX_THREAT_LEVEL)
+    def export_threat_history(self):
+        """Ctrl+E: dumps the per-second history as CSV plus a columnar directory for post-incident analysis."""
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        export_dir = os.path.join(DATA_DIR, 'exports')
+        try:
+            os.makedirs(export_dir, exist_ok=True)
+            csv_path = os.path.join(export_dir, f"threat_history_{stamp}.csv")
+            self.state.history_store.export_csv(csv_path)
+            self.state.history_store.export_columnar(os.path.join(export_dir, f"threat_history_{stamp}"))
+            self.log_message(f"[EXPORT] Threat history written to {export_dir}", "INFO")
+        except OSError as e:
+            self.log_message(f"[EXPORT] Failed: {e}", "ERROR")
+
+    def page_journal(self):
+        """F9: pages the next older block of journaled events in at the top of the log."""
+        if not self.journal:
+            return
+        if self._journal_cursor == 'end':
+            return
+        records, cursor = self.journal.query(end_ts=self._log_view_since, before=self._journal_cursor)
+        self._journal_cursor = cursor or 'end'
+        # Older history goes in front of the current lines; only the new page is indexed
+        lines = []
+        for ts, severity, level, scenario, message in records:
+            stamp = datetime.fromtimestamp(ts).strftime("[%Y-%m-%d %H:%M:%S]")
+            lines.append((f"{stamp} {LOG_ICONS.get(severity, '●')} ({scenario} · {level}%) {message}", severity))
+        self.log_index.prepend(lines)
+        self.log_view.reset()
+        self.log_view.yview('moveto', 0)
+
+    def enable_raster(self):
+        if not raster_available():
+            print("Raster backend disabled: needs numpy and Pillow (with ImageTk)")
+            return
+        for widget in (self.bg_canvas, self.globe):
+            widget.enable_raster()
+        print("Raster backend: background and globe draw into frame buffers")
+
+    def start_render_workers(self):
+        try:
+            for widget, kind in ((self.globe, 'globe'), (self.bg_canvas, 'background')):
+                worker = RenderWorker(kind).start()
+                self.render_workers.append(worker)
+                widget.attach_renderer(worker)
+        except (OSError, ValueError) as e:
+            print(f"Isolated renderer disabled: {e}")
+            for widget in (self.globe, self.bg_canvas):
+                widget.renderer = None
+            return
+        print(f"Isolated renderer: {len(self.render_workers)} worker processes")
+
+    def build_snapshot(self) -> dict:
+        """Plain-data snapshot of everything observable; safe to hand to other threads."""
+        return {
+            'timestamp': time.time(),
+            'state': {
+                'threat_level': self.state.threat_level,
+                'is_running': self.state.is_running,
+                'scenario': self.current_scenario,
+                'quality_tier': self.governor.tier['name'],
+                'quality_tier_index': self.governor.tier_index,
+                'frame_interval': self.governor.avg_frame_time,
+            },
+            'threat_history': list(self.state.threat_history),
+            'frames': FRAME_STATS.snapshot(),
+            'queue_depth': self.msg_queue.qsize(),
+            'queue_lanes': self.msg_queue.stats(),
+            'log_counts': dict(self.log_index.severity_counts),
+            'log_lines': len(self.log_index),
+            'journal_records': self.journal.records_written if self.journal else 0,
+            'ingest': self.ingest.stats() if self.ingest else None,
+            'timers': TIMERS.counts(),
+        }
+
+    def publish_metrics(self):
+        self.metrics.publish(self.build_snapshot())
+        TIMERS.schedule(self, 'metrics', int(1000 / TARGET_FPS), self.publish_metrics)
+
+    def on_close(self):
+        # Stop the animation loops explicitly, then cancel whatever is still registered (panels, buttons, app loops)
+        for widget in (self.bg_canvas, self.globe, self.status_panel):
+            widget.stop()
+        self.governor.stop()
+        self.scheduler.stop()
+        if self.load_generator:
+            self.load_generator.done.set()
+        TIMERS.cancel_all()
+        for worker in self.render_workers:
+            worker.stop()
+        if self.metrics:
+            self.metrics.stop()
+        if self.proc_feed:
+            self.proc_feed.stop()
+        if self.ingest:
+            self.ingest.stop()
+        self.state.save_history()
+        if self.journal:
+            self.journal.close()
+        self.destroy()
+
+
+# --- Compiled Threat Model ---
+class ThreatModel:
+    """
+    Threat scoring compiled from THREAT_MODEL_DEFAULTS plus a scenario's optional
+    'threat_model' overrides. Each step scores a progress ramp plus a weighted random
+    severity bonus; with decay, earlier peaks fade instead of vanishing. The scalar
+    path (UI) and the NumPy batch path (analysis) perform the same float operations
+    in the same order, so a seed yields identical levels on either path.
+    """
+
+    def __init__(self, config=None):
+        config = {**THREAT_MODEL_DEFAULTS, **(config or {})}
+        if config['combine'] not in THREAT_COMBINERS:
+            raise ValueError(f"Unknown threat combiner '{config['combine']}' (use one of: {', '.join(THREAT_COMBINERS)})")
+        bonus = {**THREAT_MODEL_DEFAULTS['bonus'], **config['bonus']}
+        weights = {**THREAT_MODEL_DEFAULTS['weights'], **config['weights']}
+        self.ramp = float(config['ramp'])
+        # Tables indexed by JOURNAL_SEVERITY_CODES; unknown severities get no bonus and consume no draw
+        self.bonus_low = tuple(int(bonus[severity][0]) for severity in JOURNAL_SEVERITIES)
+        self.bonus_span = tuple(int(bonus[severity][1]) - int(bonus[severity][0]) + 1 for severity in JOURNAL_SEVERITIES)
+        self.weights = tuple(float(weights[severity]) for severity in JOURNAL_SEVERITIES)
+        self.combine_mode = config['combine']
+
+        # Decay weight per look-back lag (in steps), computed once here so both paths multiply by the same floats
+        self.decay = (1.0,)
+        half_life = config['decay_half_life']
+        if half_life:
+            factor = 0.5 ** (ATTACK_SIMULATION_INTERVAL / half_life)
+            decay = [1.0]
+            while factor ** len(decay) >= THREAT_DECAY_CUTOFF:
+                decay.append(factor ** len(decay))
+            self.decay = tuple(decay)
+
+    @classmethod
+    def for_scenario(cls, attack_type: str):
+        return cls(ATTACK_DATA.get(attack_type, {}).get('threat_model'))
+
+    def score(self, step: int, total_steps: int, severity: str, rng) -> float:
+        """Raw score of one step: progress ramp plus the weighted severity bonus (one draw from rng)."""
+        base_level = (step / total_steps) * self.ramp
+        code = JOURNAL_SEVERITY_CODES.get(severity)
+        if code is None:
+            return base_level
+        return base_level + self.weights[code] * (self.bonus_low[code] + int(rng.random() * self.bonus_span[code]))
+
+    def level(self, scores) -> int:
+        """Level after the newest score: the strongest of the recent scores, each faded by its age."""
+        newest = len(scores) - 1
+        carried = scores[newest]
+        for lag in range(1, min(len(self.decay), newest + 1)):
+            carried = max(carried, scores[newest - lag] * self.decay[lag])
+        return min(int(carried), MAX_THREAT_LEVEL)
+
+    def evaluator(self, total_steps: int):
+        return ThreatEvaluator(self, total_steps)
+
+    def evaluate(self, severities, rng) -> list:
+        """Scalar path: the levels of one scenario run, step by step."""
+        evaluator = self.evaluator(len(severities))
+        return [evaluator.step(severity, rng) for severity in severities]
+
+    def evaluate_batch(self, severities, runs: int, rng):
+        """
+        NumPy path: a (runs, steps) int array of levels. Draws are consumed run by run,
+        so row k equals the k-th of `runs` consecutive evaluate() calls on the same stream.
+        """
+        if np is None:
+            raise RuntimeError("Batch threat evaluation requires NumPy")
+        steps = len(severities)
+        codes = [JOURNAL_SEVERITY_CODES.get(severity) for severity in severities]
+        known = [i for i, code in enumerate(codes) if code is not None]
+
+        base = (np.arange(1, steps + 1, dtype=np.float64) / steps) * self.ramp
+        scores = np.repeat(base[np.newaxis, :], runs, axis=0)
+        if known:
+            draws = np.frombuffer(rng.take(runs * len(known)), dtype=np.float64).reshape(runs, len(known))
+            low = np.array([self.bonus_low[codes[i]] for i in known], dtype=np.float64)
+            span = np.array([self.bonus_span[codes[i]] for i in known], dtype=np.float64)
+            weight = np.array([self.weights[codes[i]] for i in known], dtype=np.float64)
+            scores[:, known] = scores[:, known] + weight * (low + np.trunc(draws * span))
+
+        carried = scores.copy()
+        for lag in range(1, min(len(self.decay), steps)):
+            np.maximum(carried[:, lag:], scores[:, :-lag] * self.decay[lag], out=carried[:, lag:])
+        return np.minimum(carried.astype(np.int64), MAX_THREAT_LEVEL)
+
+    def combine(self, levels) -> int:
+        """Merges the levels of concurrent threat sources into the displayed level."""
+        levels = list(levels)
+        if not levels:
+            return 0
+        if self.combine_mode == 'max':
+            return max(levels)
+        if self.combine_mode == 'sum':
+            return min(sum(levels), MAX_THREAT_LEVEL)
+        remaining = 1.0  # noisy-or: chance that no source is a real threat
+        for level in levels:
+            remaining *= 1 - level / MAX_THREAT_LEVEL
+        return min(int(MAX_THREAT_LEVEL * (1 - remaining)), MAX_THREAT_LEVEL)
+
+    def combine_batch(self, level_arrays):
+        """Element-wise combine() over equally shaped level arrays (same operation order)."""
+        if self.combine_mode == 'max':
+            return np.maximum.reduce(level_arrays)
+        if self.combine_mode == 'sum':
+            return np.minimum(np.add.reduce(level_arrays), MAX_THREAT_LEVEL)
+        remaining = np.ones(np.shape(level_arrays[0]))
+        for levels in level_arrays:
+            remaining = remaining * (1 - levels / MAX_THREAT_LEVEL)
+        return np.minimum((MAX_THREAT_LEVEL * (1 - remaining)).astype(np.int64), MAX_THREAT_LEVEL)
+
+
+class ThreatEvaluator:
+    """Per-run state of a ThreatModel for the step-by-step UI path."""
+
+    def __init__(self, model: ThreatModel, total_steps: int):
+        self.model = model
+        self.total_steps = total_steps
+        self.scores = []
+
+    def step(self, severity: str, rng) -> int:
+        self.scores.append(self.model.score(len(self.scores) + 1, self.total_steps, severity, rng))
+        return self.model.level(self.scores)
+
+
+def analyze_scenarios(names, runs: int, seed: int):
+    """Headless analysis: per-step mean / p95 / max threat level of each scenario over many seeded runs."""
+    for name in names:
+        model = ThreatModel.for_scenario(name)
+        severities = [severity for severity, _ in ATTACK_DATA[name]['logs']]
+        rng = RandomStreams(seed).stream('threat')
+        if np is not None:
+            levels = model.evaluate_batch(severities, runs, rng)
+        else:
+            levels = [model.evaluate(severities, rng) for _ in range(runs)]
+        print(f"{name} ({runs} runs, seed {seed})")
+        for step, severity in enumerate(severities):
+            column = sorted(run[step] for run in levels)
+            print(f"  step {step + 1:>2} {severity:<8} mean {sum(column) / runs:6.2f}  "
+                  f"p95 {column[min(runs - 1, int(runs * 0.95))]:>3}  max {column[-1]:>3}")
+
+
+# --- Offscreen Frame Export (training captures without a window) ---
+@functools.lru_cache(maxsize=None)
+def export_font(size: int, bold=False):
+    """A monospace TrueType font if one is installed, else Pillow's built-in default."""
+    for name in (('DejaVuSansMono-Bold.ttf', 'Consolas Bold.ttf') if bold else ('DejaVuSansMono.ttf', 'consola.ttf')):
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            pass
+    return ImageFont.load_default(size)
+
+
+@functools.lru_cache(maxsize=1)
+def export_palette():
+    """A fixed 256-color GIF palette covering the app's colors and the blends between them."""
+    colors = [COLOR_BG_DARK, COLOR_BG_PANEL, COLOR_NEON_BLUE, COLOR_NEON_PURPLE, COLOR_NEON_ORANGE,
+              COLOR_NEON_GREEN, COLOR_TEXT_LIGHT, COLOR_METER_SHELL, *GRID_COLORS]
+    swatch = [hex_to_rgb(lerp_color(a, b, step / 15)) for a in colors for b in colors for step in range(16)]
+    swatch += [hex_to_rgb(threat_gradient_color(step / 63)) for step in range(64)]
+    image = Image.fromarray(np.array(swatch, dtype=np.uint8).reshape(1, -1, 3), 'RGB')
+    return image.quantize(256, method=Image.Quantize.MEDIANCUT)
+
+
+class PngSequenceSink:
+    """Writes frame_00000.png, frame_00001.png, ... into a directory."""
+
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self.pattern = os.path.join(directory, 'frame_{:05d}.png')
+        self.count = 0
+
+    def write(self, image):
+        image.save(self.pattern.format(self.count), compress_level=1)
+        self.count += 1
+
+    def close(self):
+        pass
+
+
+class GifSink:
+    """Appends each frame to an animated GIF as it arrives; a fixed palette means nothing is buffered."""
+
+    def __init__(self, path: str, fps: int):
+        self.file = open(path, 'wb')
+        self.duration = round(1000 / fps)
+        self.count = 0
+
+    def write(self, image):
+        frame = image.quantize(palette=export_palette(), dither=Image.Dither.NONE)
+        if self.count == 0:
+            header, _ = GifImagePlugin.getheader(frame, info={'loop': 0, 'optimize': False})
+            self.file.write(b''.join(header))
+        self.file.write(b''.join(GifImagePlugin.getdata(frame, duration=self.duration, optimize=False)))
+        self.count += 1
+
+    def close(self):
+        self.file.write(b';')  # GIF trailer
+        self.file.close()
+
+
+class FfmpegSink:
+    """Streams raw RGB frames into an ffmpeg process (VP9 WebM)."""
+
+    def __init__(self, path: str, fps: int, size):
+        ffmpeg = shutil.which('ffmpeg')
+        if ffmpeg is None:
+            raise OSError("ffmpeg not found on PATH (needed for WebM output)")
+        self.process = subprocess.Popen(
+            [ffmpeg, '-loglevel', 'error', '-y', '-f', 'rawvideo', '-pix_fmt', 'rgb24',
+             '-s', f'{size[0]}x{size[1]}', '-r', str(fps), '-i', '-',
+             '-c:v', 'libvpx-vp9', '-b:v', '0', '-crf', '32', '-deadline', 'realtime', path],
+            stdin=subprocess.PIPE)
+        self.count = 0
+
+    def write(self, image):
+        self.process.stdin.write(image.tobytes())
+        self.count += 1
+
+    def close(self):
+        self.process.stdin.close()
+        if self.process.wait() != 0:
+            raise OSError(f"ffmpeg exited with status {self.process.returncode}")
+
+
+class FramePipeline:
+    """
+    Renders on the caller's thread and encodes on another, with at most `depth` frames
+    in between. Pillow's and ffmpeg's encoders release the GIL, so the two overlap.
+    """
+
+    def __init__(self, sink, depth=EXPORT_QUEUE_DEPTH):
+        self.sink = sink
+        self.frames = queue.Queue(maxsize=depth)
+        self.error = None
+        self.thread = threading.Thread(target=self._encode, name='frame-encoder', daemon=True)
+        self.thread.start()
+
+    def _encode(self):
+        while True:
+            image = self.frames.get()
+            if image is None:
+                return
+            if self.error is None:
+                try:
+                    self.sink.write(image)
+                except (OSError, ValueError) as e:
+                    self.error = e  # Keep draining so the renderer never blocks on a dead encoder
+
+    def write(self, image):
+        if self.error is not None:
+            raise self.error
+        self.frames.put(image)
+
+    def close(self):
+        self.frames.put(None)
+        self.thread.join()
+        self.sink.close()
+        if self.error is not None:
+            raise self.error
+
+
+def open_frame_sink(target: str, fps: int, size):
+    """Picks the encoder from the target: .gif, .webm, or a directory for a PNG sequence."""
+    ext = os.path.splitext(target)[1].lower()
+    if ext == '.gif':
+        return GifSink(target, fps)
+    if ext == '.webm':
+        return FfmpegSink(target, fps, size)
+    if ext == '':
+        return PngSequenceSink(target)
+    raise ValueError(f"Unsupported export target {target!r} (use .gif, .webm or a directory)")
+
+
+class OffscreenScene:
+    """
+    Globe, meter and log of one scenario replay, composited into one NumPy frame.
+    Uses the same kernels and RNG streams as the live widgets, but no Tk at all.
+    """
+
+    def __init__(self, size=EXPORT_SIZE, seed=0, tier=DEFAULT_QUALITY_TIER):
+        self.width, self.height = size
+        self.streams = RandomStreams(seed)
+        self.globe_rng = self.streams.stream('globe')
+        self.meter_rng = self.streams.stream('meter')
+        side = min(self.height, self.width * 9 // 16)
+        self.globe_box = (0, (self.height - side) // 2, side, side)
+        self.meter_box = (side, 0, self.width - side, 110)
+        self.log_box = (side, 110, self.width - side, self.height - 110)
+        self.radius = min(160, side * 0.37)  # Link distances are in pixels; keep the widgets' scale
+        detail = QUALITY_TIERS[tier]
+        points = fibonacci_sphere(detail['globe_points'])
+        edges = globe_edges(points, self.globe_rng)
+        self.kernel_config = {'points': points, 'lod_indices': list(range(len(points))), 'edges': edges,
+                              'edge_nodes': sorted({idx for edge in edges for idx in edge}), 'back_divisor': 1}
+        self.max_connections = detail['globe_connections']
+        self.rotation = 0.0
+        self.line_font = export_font(13)
+        self.label_font = export_font(16, bold=True)
+        self._base_key, self._base = None, None
+        self._labels = {}  # Label text -> coverage mask (levels repeat, so each is rendered once)
+
+    def _static_base(self, lines):
+        """Panels and log text; rebuilt only when the log changes, since text rendering dominates a frame."""
+        key = tuple(lines)
+        if key == self._base_key:
+            return self._base
+        canvas = FrameBuffer.blank(self.width, self.height, COLOR_BG_DARK)
+        panel = hex_to_rgb(COLOR_BG_PANEL)
+        gx, gy, gw, gh = self.globe_box
+        canvas.rect(gx, gy, gx + gw, gy + gh, panel)
+        mx, my, mw, mh = self.meter_box
+        canvas.rect(mx + 8, my + 8, mx + mw - 8, my + mh - 8, panel)
+        lx, ly, lw, lh = self.log_box
+        canvas.rect(lx + 8, ly, lx + lw - 8, ly + lh - 8, panel)
+        image = Image.fromarray(canvas.frame, 'RGB')
+        draw = ImageDraw.Draw(image)
+        line_height = getattr(self.line_font, 'size', 11) + 5  # Bitmap fallback fonts have no size
+        y = ly + 8
+        max_chars = max(1, int((lw - 40) // self.line_font.getlength('M')))
+        for text, severity in lines[-max(1, (lh - 24) // line_height):]:
+            if len(text) > max_chars:
+                text = text[:max_chars - 1] + '…'
+            draw.text((lx + 16, y), text, fill=LOG_COLORS.get(severity, COLOR_TEXT_LIGHT), font=self.line_font)
+            y += line_height
+        self._base_key, self._base = key, np.asarray(image)
+        return self._base
+
+    def _label(self, text: str):
+        """Antialiased coverage mask of a meter label."""
+        mask = self._labels.get(text)
+        if mask is None:
+            left, top, right, bottom = self.label_font.getbbox(text)
+            image = Image.new('L', (right - left, bottom - top))
+            ImageDraw.Draw(image).text((-left, -top), text, fill=255, font=self.label_font)
+            mask = self._labels[text] = np.asarray(image, dtype=np.float32)[..., None] / 255.0
+        return mask
+
+    def render(self, level, active, history, lines, glitch_phase):
+        """One composited frame as a PIL image."""
+        canvas = FrameBuffer(self._static_base(lines).copy())
+        gx, gy, gw, gh = self.globe_box
+        params = (self.rotation, level, active, self.radius, gw / 2, gh / 2, glitch_phase, self.max_connections)
+        rows, conns = globe_kernel(self.kernel_config, params, self.globe_rng)
+        raster_globe(canvas.region(gx, gy, gw, gh), level / 100.0, rows, conns)
+
+        mx, my, mw, mh = self.meter_box
+        glitch_offset, text_fill = raster_meter(canvas.region(mx + 8, my + 8, mw - 16, mh - 16), level, history,
+                                                self.meter_rng)
+        alpha = self._label(f"◢ {level}% THREAT LEVEL ◣")
+        height, width = alpha.shape[:2]
+        x = int(mx + (mw - width) / 2 + glitch_offset)
+        y = int(my + (mh - height) / 2)
+        # Small frames (or the glitch offset) can push the label past an edge: blend only the visible part
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + width, self.width), min(y + height, self.height)
+        if x1 > x0 and y1 > y0:
+            alpha = alpha[y0 - y:y1 - y, x0 - x:x1 - x]
+            patch = canvas.frame[y0:y1, x0:x1]
+            patch[:] = patch * (1 - alpha) + np.array(hex_to_rgb(text_fill), dtype=np.float32) * alpha
+        return Image.fromarray(canvas.frame, 'RGB')
+
+
+def export_scenario(attack_type: str, target: str, fps=EXPORT_FPS, size=EXPORT_SIZE, seed=0):
+    """
+    Replays a scenario on a simulated clock (events every ATTACK_SIMULATION_INTERVAL, as
+    run_simulation) and streams each frame to the encoder as soon as it is rendered.
+    """
+    if np is None or Image is None:
+        raise RuntimeError("Frame export needs numpy and Pillow")
+    info = ATTACK_DATA[attack_type]
+    logs = info['logs']
+    scene = OffscreenScene(size, seed)
+    evaluator = ThreatModel.for_scenario(attack_type).evaluator(len(logs))
+    threat_rng = scene.streams.stream('threat')
+    history = deque([0] * MAX_THREAT_HISTORY, maxlen=MAX_THREAT_HISTORY)
+    lines = deque(maxlen=200)
+    level, step, completed = 0, 0, False
+    run_seconds = len(logs) * ATTACK_SIMULATION_INTERVAL
+    frame_count = math.ceil((run_seconds + EXPORT_TAIL_SECONDS) * fps)
+
+    sink = FramePipeline(open_frame_sink(target, fps, size))
+    started = time.perf_counter()
+    try:
+        for frame in range(frame_count):
+            now = frame / fps
+            while step < len(logs) and step * ATTACK_SIMULATION_INTERVAL <= now:
+                severity, message = logs[step]
+                level = evaluator.step(severity, threat_rng)
+                history.append(level)
+                lines.append((f"[{now:06.2f}s] {LOG_ICONS.get(severity, '●')} {message}", severity))
+                step += 1
+            if not completed and now >= run_seconds:
+                completed = True
+                level = 0
+                history.extend([0] * MAX_THREAT_HISTORY)
+                lines.append((f"[{now:06.2f}s] ◢ VERDICT ◣ {info['verdict']}", 'WARNING'))
+            # The globe advances per animation tick; scale that to the export frame rate
+            scene.rotation += 0.02 * (1.0 + (level / 100.0) / 1.5) * EXPORT_GLOBE_RATE / fps
+            image = scene.render(level, not completed or level > 0, list(history), list(lines),
+                                 int(now * EXPORT_GLOBE_RATE))
+            sink.write(image)
+    finally:
+        sink.close()
+    elapsed = time.perf_counter() - started
+    simulated = frame_count / fps
+    print(f"Exported {frame_count} frames ({simulated:.1f}s simulated) to {target} in {elapsed:.1f}s "
+          f"({simulated / max(elapsed, 1e-9):.1f}x real time)")
+    return frame_count
+
+
+def parse_frame_size(spec: str):
+    try:
+        width, height = (int(v) for v in spec.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT, got {spec!r}")
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(f"frame size must be positive, got {spec!r}")
+    return width, height
+
+
+def positive_int(text: str) -> int:
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an integer, got {text!r}")
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"must be positive, got {text!r}")
+    return value
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Cyberpunk Threat Matrix simulator")
+    parser.add_argument('--ingest', action='append', default=[], metavar='ENDPOINT',
+                        help="accept NDJSON events on tcp:HOST:PORT, udp:HOST:PORT or unix:PATH (repeatable)")
+    parser.add_argument('--metrics', nargs='?', type=int, const=METRICS_PORT, default=None, metavar='PORT',
+                        help=f"serve /metrics (Prometheus) and /state (JSON) on localhost (default port {METRICS_PORT})")
+    parser.add_argument('--wall', action='append', default=[], type=parse_wall_view, metavar='VIEW[@GEOMETRY]',
+                        help=f"open a {'/'.join(WALL_VIEWS)} view in its own window, e.g. globe@1920x1080+1920+0 "
+                             f"(repeatable; press F11 in a view for fullscreen)")
+    parser.add_argument('--isolated-render', action='store_true',
+                        help="compute globe and background frames in worker processes (shared-memory results)")
+    parser.add_argument('--raster', action='store_true',
+                        help="draw background and globe into NumPy/PIL frame buffers instead of canvas items")
+    parser.add_argument('--analyze', nargs='?', const='all', choices=['all', *ATTACK_DATA], metavar='SCENARIO',
+                        help="don't start the UI; print per-step threat statistics for a scenario (default: all)")
+    parser.add_argument('--runs', type=positive_int, default=1000, help="seeded runs per scenario for --analyze")
+    parser.add_argument('--seed', type=int, default=0, help="master seed for --analyze and --export")
+    parser.add_argument('--export', choices=list(ATTACK_DATA), metavar='SCENARIO',
+                        help="render a scenario replay offscreen (no window) and exit")
+    parser.add_argument('--out', metavar='PATH',
+                        help="--export target: .gif, .webm (via ffmpeg) or a directory of PNGs (default SCENARIO.gif)")
+    parser.add_argument('--fps', type=positive_int, default=EXPORT_FPS, help="frames per simulated second for --export")
+    parser.add_argument('--size', type=parse_frame_size, default=EXPORT_SIZE, metavar='WxH',
+                        help="frame size for --export")
+    parser.add_argument('--loadgen', nargs='?', type=parse_rates, const=LOADGEN_RATES, metavar='RATES',
+                        help="stress the UI message path with synthetic events at each comma-separated rate "
+                             "(events/s), report latency / dropped frames / queue depth, then exit")
+    parser.add_argument('--loadgen-seconds', type=float, default=LOADGEN_STAGE_SECONDS, help="seconds per rate stage")
+    parser.add_argument('--loadgen-pattern', choices=('sustained', 'burst'), default='sustained',
+                        help="constant flood, or periodic bursts with the same mean rate")
+    parser.add_argument('--loadgen-mix', type=parse_severity_mix, default=None, metavar='SEVERITY=WEIGHT,...',
+                        help="relative severity weights (default INFO=70,WARNING=20,ERROR=8,CRITICAL=2)")
+    parser.add_argument('--loadgen-report', metavar='PATH', help="also write the report (with timeline) as JSON")
+    parser.add_argument('--soak', nargs='?', type=float, const=3600.0, metavar='SECONDS',
+                        help="run scenarios back to back and fail on canvas item / after / memory growth "
+                             "(needs a display; re-runs itself under xvfb-run when there is none)")
+    parser.add_argument('--soak-speed', type=float, default=SOAK_SPEED, help="time acceleration for --soak")
+    parser.add_argument('--soak-interval', type=float, default=SOAK_SAMPLE_SECONDS, metavar='SECONDS',
+                        help="real seconds between --soak samples")
+    parser.add_argument('--soak-report', metavar='PATH', help="also write the --soak samples and verdict as JSON")
+    parser.add_argument('--proc-root', default=PROC_ROOT, metavar='DIR',
+                        help="/proc-style tree feeding the header data stream (a fixture dir for tests; '' disables)")
+    parser.add_argument('--fake-producer', metavar='ENDPOINT',
+                        help="don't start the UI; send fake events to a running instance's ingest endpoint")
+    parser.add_argument('--events', type=int, default=1000, help="events sent by --fake-producer")
+    parser.add_argument('--rate', type=float, default=0.0, help="events/s for --fake-producer (0 = unthrottled)")
+    return parser.parse_args(argv)
 
 
 if __name__ == "__main__":
-    app = CyberpunkThreatMatrix()
-    app.mainloop()
+    args = parse_args()
+    if args.analyze:
+        analyze_scenarios(list(ATTACK_DATA) if args.analyze == 'all' else [args.analyze], args.runs, args.seed)
+    elif args.export:
+        try:
+            export_scenario(args.export, args.out or f'{args.export}.gif', fps=args.fps, size=args.size,
+                            seed=args.seed)
+        except (OSError, RuntimeError, ValueError) as e:
+            print(f"Export failed: {e}")
+            sys.exit(1)
+    elif args.fake_producer:
+        send_fake_events(args.fake_producer, count=args.events, rate=args.rate)
+    else:
+        if args.soak is not None and sys.platform.startswith('linux') and not os.environ.get('DISPLAY'):
+            xvfb_run = shutil.which('xvfb-run')
+            if xvfb_run is None:
+                print("Soak test needs a display: install Xvfb (xvfb-run) or set DISPLAY")
+                sys.exit(2)
+            os.execv(xvfb_run, [xvfb_run, '-a', sys.executable, *sys.argv])
+        app = CyberpunkThreatMatrix(ingest_endpoints=args.ingest, metrics_port=args.metrics,
+                                   wall_views=args.wall, isolated_render=args.isolated_render,
+                                   proc_root=args.proc_root, raster=args.raster,
+                                   loadgen=None if args.loadgen is None else {
+                                       'rates': args.loadgen, 'stage_seconds': args.loadgen_seconds,
+                                       'mix': args.loadgen_mix, 'pattern': args.loadgen_pattern,
+                                       'report_path': args.loadgen_report, 'seed': args.seed},
+                                   soak=None if args.soak is None else {
+                                       'duration': args.soak, 'speed': args.soak_speed, 'interval': args.soak_interval,
+                                       'report_path': args.soak_report})
+        app.mainloop()
+        sys.exit(app.exit_code)